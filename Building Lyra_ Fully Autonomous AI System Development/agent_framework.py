@@ -7,19 +7,38 @@ Provides communication, coordination, and management capabilities for autonomous
 """
 
 import asyncio
+import heapq
 import json
-import uuid
+import os
 import threading
 import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Callable, Union
+from typing import Awaitable, Dict, List, Optional, Any, Callable, Union, Set, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 import sqlite3
 import logging
 from concurrent.futures import ThreadPoolExecutor
 
+# Optional faster event loop
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Optional faster encoders for message payloads
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 class MessageType(Enum):
     COMMAND = "command"
     QUERY = "query"
@@ -36,7 +55,51 @@ class AgentStatus(Enum):
     ERROR = "error"
     SHUTDOWN = "shutdown"
 
-@dataclass
+def _msgpack_default(value: Any) -> Any:
+    """Encode values msgpack has no native type for"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialize {type(value).__name__} payload value")
+
+def pack_payload(payload: Dict[str, Any]) -> bytes:
+    """Serialize a message payload for BLOB storage (msgpack, else JSON bytes)"""
+    if msgpack is not None:
+        return msgpack.packb(payload, use_bin_type=True, default=_msgpack_default)
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload).encode()
+
+def unpack_payload(data: Union[bytes, str]) -> Dict[str, Any]:
+    """Decode a stored payload written by pack_payload or as legacy JSON text"""
+    if isinstance(data, str) or data[:1] in (b"{", b"["):
+        return json.loads(data)
+    if msgpack is None:
+        raise RuntimeError("msgpack is required to decode this payload")
+    return msgpack.unpackb(data, raw=False)
+
+def generate_id(prefix: str, nbytes: int = 6) -> str:
+    """Generate a random identifier such as msg_1a2b3c4d5e6f"""
+    return f"{prefix}_{os.urandom(nbytes).hex()}"
+
+# Per-thread cache of the formatted whole-second part of the last timestamp
+_timestamp_cache = threading.local()
+
+def format_timestamp(ts: float) -> str:
+    """Format epoch seconds like datetime.isoformat(), reusing the per-second prefix"""
+    # Same rounding as datetime.fromtimestamp
+    second = int(ts)
+    micros = round((ts - second) * 1_000_000)
+    if micros >= 1_000_000:
+        second += 1
+        micros -= 1_000_000
+    
+    if getattr(_timestamp_cache, "second", None) != second:
+        _timestamp_cache.second = second
+        _timestamp_cache.prefix = datetime.fromtimestamp(second).isoformat()
+    
+    return f"{_timestamp_cache.prefix}.{micros:06d}" if micros else _timestamp_cache.prefix
+
+@dataclass(slots=True)
 class AgentMessage:
     """Inter-agent communication message"""
     id: str
@@ -48,14 +111,23 @@ class AgentMessage:
     timestamp: str = None
     correlation_id: Optional[str] = None
     expires_at: Optional[str] = None
+    sent_at: float = 0.0  # epoch seconds, same instant as timestamp
     
     def __post_init__(self):
         if self.timestamp is None:
-            self.timestamp = datetime.now().isoformat()
+            if not self.sent_at:
+                self.sent_at = time.time()
+            self.timestamp = format_timestamp(self.sent_at)
+        elif not self.sent_at:
+            try:
+                self.sent_at = datetime.fromisoformat(self.timestamp).timestamp()
+            except (TypeError, ValueError):
+                # Free-form timestamps are kept as given, stamped with the construction time
+                self.sent_at = time.time()
         if self.id is None:
-            self.id = f"msg_{uuid.uuid4().hex[:12]}"
+            self.id = generate_id("msg")
 
-@dataclass
+@dataclass(slots=True)
 class AgentCapability:
     """Defines an agent's capability"""
     name: str
@@ -65,19 +137,46 @@ class AgentCapability:
     resource_requirements: Dict[str, Any]
     execution_time_estimate: float  # seconds
 
+# Queued by BaseAgent.stop() to wake the message loop
+_STOP_SENTINEL = object()
+
+class MessageQueue(asyncio.Queue):
+    """Agent inbox that hands out all pending messages in one wakeup"""
+    
+    async def get_batch(self, max_items: int) -> List[AgentMessage]:
+        """Wait for one message, then drain up to max_items without awaiting again"""
+        batch = [await self.get()]
+        while len(batch) < max_items:
+            try:
+                batch.append(self.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return batch
+
 class BaseAgent(ABC):
     """Base class for all Lyra agents"""
     
+    # Maximum number of messages handled per message loop wakeup
+    message_batch_size = 64
+    # Inbox capacity; MessageBus drops messages once it is reached
+    message_queue_maxsize = 10000
+    
     def __init__(self, agent_id: str, name: str, description: str):
         self.agent_id = agent_id
         self.name = name
         self.description = description
         self.status = AgentStatus.INITIALIZING
         self.capabilities: Dict[str, AgentCapability] = {}
-        self.message_queue: asyncio.Queue = asyncio.Queue()
+        # Called with (agent_id, capability_name) when a capability is added; set by AgentManager
+        self._capability_callback: Optional[Callable[[str, str], None]] = None
+        # Called with agent_id when status, metrics or heartbeat change; set by AgentManager
+        self._status_callback: Optional[Callable[[str], None]] = None
+        self.message_queue: MessageQueue = MessageQueue(maxsize=self.message_queue_maxsize)
         self.response_handlers: Dict[str, Callable] = {}
         self.running = False
+        self._message_task: Optional[asyncio.Task] = None
         self.last_heartbeat = datetime.now()
+        self.last_heartbeat_iso = self.last_heartbeat.isoformat()
         
         # Performance metrics
         self.tasks_completed = 0
@@ -98,6 +197,20 @@ class BaseAgent(ABC):
         """Process incoming message and return response if needed"""
         pass
     
+    async def process_batch(self, messages: List[AgentMessage]) -> List[Union[AgentMessage, Exception, None]]:
+        """Process a batch of messages, returning one response, None or exception per message
+        
+        Override to handle a whole batch at once (e.g. one bulk write); the default
+        processes messages one at a time and captures each failure in place.
+        """
+        results = []
+        for message in messages:
+            try:
+                results.append(await self.process_message(message))
+            except Exception as e:
+                results.append(e)
+        return results
+    
     @abstractmethod
     async def shutdown(self):
         """Clean shutdown of agent resources"""
@@ -106,18 +219,25 @@ class BaseAgent(ABC):
     def add_capability(self, capability: AgentCapability):
         """Add a capability to this agent"""
         self.capabilities[capability.name] = capability
+        if self._capability_callback:
+            self._capability_callback(self.agent_id, capability.name)
         self.logger.info(f"Added capability: {capability.name}")
     
+    def _status_changed(self):
+        """Notify the manager that this agent's reported status is out of date"""
+        if self._status_callback:
+            self._status_callback(self.agent_id)
+    
     async def start(self):
         """Start the agent's main processing loop"""
         self.running = True
         self.status = AgentStatus.ACTIVE
+        self._status_changed()
         
         await self.initialize()
         
-        # Start message processing loop
-        asyncio.create_task(self._message_loop())
-        asyncio.create_task(self._heartbeat_loop())
+        # Start message processing loop; heartbeats are collected by AgentManager
+        self._message_task = asyncio.create_task(self._message_loop())
         
         self.logger.info(f"Agent {self.name} started successfully")
     
@@ -125,75 +245,126 @@ class BaseAgent(ABC):
         """Stop the agent"""
         self.running = False
         self.status = AgentStatus.SHUTDOWN
+        self._status_changed()
+        
+        # Wake the message loop so it can exit; a full inbox has no room, so cancel instead
+        try:
+            self.message_queue.put_nowait(_STOP_SENTINEL)
+        except asyncio.QueueFull:
+            if self._message_task:
+                self._message_task.cancel()
+        self._message_task = None
+        
         await self.shutdown()
         self.logger.info(f"Agent {self.name} stopped")
     
     async def _message_loop(self):
         """Main message processing loop"""
         while self.running:
+            # Block until messages arrive; stop() queues a sentinel to wake us
+            batch = await self.message_queue.get_batch(self.message_batch_size)
+            batch = [message for message in batch if message is not _STOP_SENTINEL]
+            if not batch:
+                continue
+            
+            start_time = time.time()
+            self.status = AgentStatus.BUSY
+            self._status_changed()
+            completed = 0
+            failed = 0
+            
+            pending = self._drop_expired(batch)
+            
             try:
-                # Wait for message with timeout
-                message = await asyncio.wait_for(self.message_queue.get(), timeout=1.0)
-                
-                start_time = time.time()
-                self.status = AgentStatus.BUSY
-                
-                # Process the message
-                response = await self.process_message(message)
+                # Process the messages
+                results = await self.process_batch(pending) if pending else []
+            except Exception as e:
+                results = [e] * len(pending)
+            
+            for result in results:
+                if isinstance(result, Exception):
+                    self.logger.error(f"Error processing message: {result}")
+                    self.tasks_failed += 1
+                    failed += 1
+                    continue
                 
                 # Send response if generated
-                if response and hasattr(self, 'message_bus'):
-                    await self.message_bus.send_message(response)
+                if result and hasattr(self, 'message_bus'):
+                    try:
+                        await self.message_bus.send_message(result)
+                    except Exception as e:
+                        self.logger.error(f"Error sending response: {e}")
+                        self.tasks_failed += 1
+                        failed += 1
+                        continue
                 
-                # Update metrics
+                completed += 1
+            
+            # Update metrics once per batch
+            if completed:
                 processing_time = time.time() - start_time
-                self.tasks_completed += 1
+                total_completed = self.tasks_completed + completed
                 self.average_response_time = (
-                    (self.average_response_time * (self.tasks_completed - 1) + processing_time) 
-                    / self.tasks_completed
-                )
-                
-                self.status = AgentStatus.IDLE
-                
-            except asyncio.TimeoutError:
-                # No message received, continue loop
-                continue
-            except Exception as e:
-                self.logger.error(f"Error processing message: {e}")
-                self.tasks_failed += 1
-                self.status = AgentStatus.ERROR
-    
-    async def _heartbeat_loop(self):
-        """Send periodic heartbeat messages"""
-        while self.running:
-            self.last_heartbeat = datetime.now()
-            
-            if hasattr(self, 'message_bus'):
-                heartbeat = AgentMessage(
-                    id=f"hb_{uuid.uuid4().hex[:8]}",
-                    sender=self.agent_id,
-                    recipient="system",
-                    message_type=MessageType.HEARTBEAT,
-                    payload={
-                        "status": self.status.value,
-                        "tasks_completed": self.tasks_completed,
-                        "tasks_failed": self.tasks_failed,
-                        "average_response_time": self.average_response_time,
-                        "capabilities": list(self.capabilities.keys())
-                    }
+                    (self.average_response_time * self.tasks_completed + processing_time)
+                    / total_completed
                 )
-                await self.message_bus.send_message(heartbeat)
+                self.tasks_completed = total_completed
             
-            await asyncio.sleep(30)  # Heartbeat every 30 seconds
+            self.status = AgentStatus.ERROR if failed else AgentStatus.IDLE
+            self._status_changed()
+
+    def _drop_expired(self, batch: List[AgentMessage]) -> List[AgentMessage]:
+        """Filter out messages whose expires_at passed while they waited in the inbox"""
+        now = None
+        pending = []
+        for message in batch:
+            if message.expires_at:
+                now = now or datetime.now()
+                try:
+                    expired = datetime.fromisoformat(message.expires_at) <= now
+                except ValueError:
+                    expired = False
+                if expired:
+                    self.logger.debug(f"Dropping expired message {message.id}")
+                    continue
+            pending.append(message)
+        return pending
 
 class MessageBus:
     """Central message bus for inter-agent communication"""
     
-    def __init__(self, db_path: str = "lyra_messages.db"):
+    # SQLite durability levels; NORMAL in WAL mode may lose the last commits on power loss
+    SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL")
+    
+    # Kept as one constant so every write hits the connection's statement cache
+    _INSERT_SQL = "INSERT INTO messages VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    
+    def __init__(self, db_path: str = "lyra_messages.db", max_batch: int = 256, flush_interval: float = 0.05,
+                 synchronous: str = "NORMAL"):
+        if synchronous.upper() not in self.SYNCHRONOUS_MODES:
+            raise ValueError(f"synchronous must be one of {self.SYNCHRONOUS_MODES}, got {synchronous!r}")
+        
         self.db_path = db_path
+        self.synchronous = synchronous.upper()
         self.agents: Dict[str, BaseAgent] = {}
         self.message_handlers: Dict[str, List[Callable]] = {}
         self.running = False
+        
+        # Pending query futures by correlation ID, oldest first
+        self.response_handlers: "OrderedDict[str, asyncio.Future]" = OrderedDict()
+        self.max_pending_queries = 1000
+        
+        # Batched audit trail writer
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        # One persistent connection in autocommit mode; batches open explicit transactions.
+        # Writes may come from the writer thread or the loop thread, so they share a lock.
+        self._conn = sqlite3.connect(
+            self.db_path, isolation_level=None, check_same_thread=False, cached_statements=256
+        )
+        self._db_lock = threading.Lock()
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
         self._init_database()
         
         # Setup logging
@@ -201,26 +372,57 @@ class MessageBus:
     
     def _init_database(self):
         """Initialize message storage database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
+        # WAL lets audit readers run alongside the writer and needs one fsync per commit.
+        # Every statement is idempotent, so this is safe against an existing database.
+        self._conn.executescript(f'''
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous={self.synchronous};
+            PRAGMA busy_timeout=5000;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-20000;
+            
             CREATE TABLE IF NOT EXISTS messages (
                 id TEXT PRIMARY KEY,
                 sender TEXT NOT NULL,
                 recipient TEXT NOT NULL,
                 message_type TEXT NOT NULL,
-                payload TEXT NOT NULL,
+                payload BLOB NOT NULL,
                 priority INTEGER NOT NULL,
                 timestamp TEXT NOT NULL,
                 correlation_id TEXT,
                 expires_at TEXT,
                 processed BOOLEAN DEFAULT FALSE
-            )
+            );
+            
+            CREATE INDEX IF NOT EXISTS idx_messages_recipient ON messages(recipient, processed);
+            CREATE INDEX IF NOT EXISTS idx_messages_expires_at ON messages(expires_at);
         ''')
+    
+    async def start(self):
+        """Start the background audit trail writer"""
+        if self.running:
+            return
         
-        conn.commit()
-        conn.close()
+        self.running = True
+        self._write_queue = asyncio.Queue()
+        self._writer_task = asyncio.create_task(self._writer_loop())
+    
+    async def stop(self):
+        """Flush pending messages and stop the background writer"""
+        if not self.running:
+            return
+        
+        self.running = False
+        # None is the shutdown sentinel for the writer loop
+        self._write_queue.put_nowait(None)
+        await self._writer_task
+        self._writer_task = None
+        self._write_queue = None
+    
+    def close(self):
+        """Close the persistent database connection"""
+        with self._db_lock:
+            self._conn.close()
     
     def register_agent(self, agent: BaseAgent):
         """Register an agent with the message bus"""
@@ -239,47 +441,122 @@ class MessageBus:
         # Store message in database
         self._store_message(message)
         
+        # Resolve a pending query_agent call
+        if message.message_type == MessageType.RESPONSE and message.correlation_id in self.response_handlers:
+            response_future = self.response_handlers.pop(message.correlation_id)
+            if not response_future.done():
+                response_future.set_result(message)
+            return
+        
         if message.recipient == "broadcast":
             # Send to all agents except sender
             for agent_id, agent in self.agents.items():
                 if agent_id != message.sender:
-                    await agent.message_queue.put(message)
+                    self._deliver(agent, message)
         elif message.recipient in self.agents:
             # Send to specific agent
-            target_agent = self.agents[message.recipient]
-            await target_agent.message_queue.put(message)
+            self._deliver(self.agents[message.recipient], message)
         else:
             self.logger.warning(f"Unknown recipient: {message.recipient}")
     
+    def _deliver(self, agent: BaseAgent, message: AgentMessage):
+        """Enqueue without awaiting, shedding load when the agent's inbox is full"""
+        try:
+            agent.message_queue.put_nowait(message)
+            return
+        except asyncio.QueueFull:
+            pass
+        
+        if message.priority >= 8:
+            # High priority: make room by discarding the oldest queued message
+            dropped = agent.message_queue.get_nowait()
+            if dropped is _STOP_SENTINEL:
+                # Never shed a stop request; the stopping agent will not read the new message anyway
+                agent.message_queue.put_nowait(dropped)
+                self.logger.warning(f"Inbox of stopping agent {agent.agent_id} full, dropped message {message.id}")
+                return
+            agent.message_queue.put_nowait(message)
+            self.logger.warning(f"Inbox of {agent.agent_id} full, dropped oldest message {dropped.id}")
+        else:
+            self.logger.warning(f"Inbox of {agent.agent_id} full, dropped message {message.id}")
+    
     def _store_message(self, message: AgentMessage):
-        """Store message in database for audit trail"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO messages VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            message.id,
-            message.sender,
-            message.recipient,
-            message.message_type.value,
-            json.dumps(message.payload),
-            message.priority,
-            message.timestamp,
-            message.correlation_id,
-            message.expires_at,
-            False
-        ))
-        
-        conn.commit()
-        conn.close()
+        """Queue message for the audit trail writer"""
+        self.store_messages([message])
+    
+    def store_messages(self, messages: List[AgentMessage]):
+        """Record messages in the audit trail without delivering them"""
+        rows = [
+            (
+                message.id,
+                message.sender,
+                message.recipient,
+                message.message_type.value,
+                pack_payload(message.payload),
+                message.priority,
+                message.timestamp,
+                message.correlation_id,
+                message.expires_at,
+                False
+            )
+            for message in messages
+        ]
+        
+        if self._write_queue is not None:
+            self._write_queue.put_nowait(rows)
+        else:
+            # Writer not started, store synchronously
+            self._write_rows(rows)
+    
+    def _write_rows(self, rows: List[tuple]):
+        """Insert a batch of message rows in a single transaction"""
+        with self._db_lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(self._INSERT_SQL, rows)
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+    
+    def _drain_write_queue(self, rows: List[tuple]) -> bool:
+        """Move queued rows into the batch, returning False once the sentinel is seen"""
+        while len(rows) < self.max_batch:
+            try:
+                queued = self._write_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return True
+            if queued is None:
+                return False
+            rows.extend(queued)
+        return True
+    
+    async def _writer_loop(self):
+        """Drain queued message rows and commit them in batches"""
+        keep_running = True
+        while keep_running:
+            queued = await self._write_queue.get()
+            if queued is None:
+                break
+            
+            rows = list(queued)
+            keep_running = self._drain_write_queue(rows)
+            if keep_running and len(rows) < self.max_batch:
+                # Give bursts a moment to accumulate before committing
+                await asyncio.sleep(self.flush_interval)
+                keep_running = self._drain_write_queue(rows)
+            
+            try:
+                await asyncio.to_thread(self._write_rows, rows)
+            except Exception as e:
+                self.logger.error(f"Error storing {len(rows)} messages: {e}")
     
     async def query_agent(self, target_agent: str, query_type: str, payload: Dict, timeout: float = 30.0) -> Optional[Dict]:
         """Send query to agent and wait for response"""
-        correlation_id = f"query_{uuid.uuid4().hex[:12]}"
+        correlation_id = generate_id("query")
         
         query_message = AgentMessage(
-            id=f"q_{uuid.uuid4().hex[:12]}",
+            id=generate_id("q"),
             sender="system",
             recipient=target_agent,
             message_type=MessageType.QUERY,
@@ -287,24 +564,36 @@ class MessageBus:
             correlation_id=correlation_id
         )
         
-        # Setup response handler
-        response_future = asyncio.Future()
+        # Setup response handler, evicting the oldest pending query when over the cap
+        loop = asyncio.get_running_loop()
+        response_future = loop.create_future()
         self.response_handlers[correlation_id] = response_future
+        if len(self.response_handlers) > self.max_pending_queries:
+            _, oldest_future = self.response_handlers.popitem(last=False)
+            if not oldest_future.done():
+                oldest_future.set_exception(asyncio.TimeoutError())
+        expiry = loop.call_later(timeout, self._expire_query, correlation_id)
         
         # Send query
         await self.send_message(query_message)
         
         try:
             # Wait for response
-            response = await asyncio.wait_for(response_future, timeout=timeout)
+            response = await response_future
             return response.payload
         except asyncio.TimeoutError:
             self.logger.warning(f"Query to {target_agent} timed out")
             return None
         finally:
             # Cleanup response handler
-            if correlation_id in self.response_handlers:
-                del self.response_handlers[correlation_id]
+            expiry.cancel()
+            self.response_handlers.pop(correlation_id, None)
+    
+    def _expire_query(self, correlation_id: str):
+        """Time out a pending query whose response never arrived"""
+        response_future = self.response_handlers.pop(correlation_id, None)
+        if response_future is not None and not response_future.done():
+            response_future.set_exception(asyncio.TimeoutError())
 
 class AgentManager:
     """Manages the lifecycle and coordination of all agents"""
@@ -314,51 +603,152 @@ class AgentManager:
         self.agents: Dict[str, BaseAgent] = {}
         self.running = False
         
+        # Reverse index of capability name -> agent IDs
+        self._capability_index: Dict[str, Set[str]] = {}
+        # (tasks_completed, agent_id) heaps per required capability (None = any agent).
+        # Counts only grow, so stale entries are refreshed when they reach the top.
+        self._load_heaps: Dict[Optional[str], List[Tuple[int, str]]] = {}
+        
+        # get_agent_status entries, rebuilt only for agents marked dirty
+        self._status_cache: Dict[str, Dict] = {}
+        self._status_dirty: Set[str] = set()
+        
+        # One collector records every agent's heartbeat per interval
+        self.heartbeat_interval = 30.0
+        self._heartbeat_handle: Optional[asyncio.TimerHandle] = None
+        
         # Setup logging
         self.logger = logging.getLogger("lyra.agentmanager")
     
     def register_agent(self, agent: BaseAgent):
         """Register and start an agent"""
         self.agents[agent.agent_id] = agent
+        self._load_heaps.clear()
+        for capability_name in agent.capabilities:
+            self._index_capability(agent.agent_id, capability_name)
+        agent._capability_callback = self._index_capability
+        agent._status_callback = self._status_dirty.add
+        self._status_dirty.add(agent.agent_id)
         self.message_bus.register_agent(agent)
     
+    def unregister_agent(self, agent_id: str):
+        """Unregister an agent and drop it from the capability index"""
+        agent = self.agents.pop(agent_id, None)
+        if agent is None:
+            return
+        
+        agent._capability_callback = None
+        agent._status_callback = None
+        self._status_cache.pop(agent_id, None)
+        self._status_dirty.discard(agent_id)
+        self._load_heaps.clear()
+        for capability_name in agent.capabilities:
+            agent_ids = self._capability_index.get(capability_name)
+            if agent_ids:
+                agent_ids.discard(agent_id)
+                if not agent_ids:
+                    del self._capability_index[capability_name]
+        self.message_bus.unregister_agent(agent_id)
+    
+    def _index_capability(self, agent_id: str, capability_name: str):
+        """Record that an agent provides a capability"""
+        self._capability_index.setdefault(capability_name, set()).add(agent_id)
+        self._load_heaps.pop(capability_name, None)
+        self._status_dirty.add(agent_id)
+    
     async def start_all_agents(self):
         """Start all registered agents"""
         self.running = True
         
+        # Let fast-completing coroutines finish inline instead of via the scheduler (Python 3.12+)
+        loop = asyncio.get_running_loop()
+        if hasattr(asyncio, "eager_task_factory") and loop.get_task_factory() is None:
+            loop.set_task_factory(asyncio.eager_task_factory)
+        
+        await self.message_bus.start()
+        
         for agent in self.agents.values():
             await agent.start()
         
+        self._emit_heartbeats()
+        
         self.logger.info("All agents started successfully")
     
     async def stop_all_agents(self):
         """Stop all agents gracefully"""
         self.running = False
         
+        if self._heartbeat_handle:
+            self._heartbeat_handle.cancel()
+            self._heartbeat_handle = None
+        
         for agent in self.agents.values():
             await agent.stop()
         
+        # Writer has drained its queue, so the connection can go
+        await self.message_bus.stop()
+        self.message_bus.close()
         self.logger.info("All agents stopped")
     
+    def _emit_heartbeats(self):
+        """Snapshot all running agents, store their heartbeats in one batch and re-arm the timer"""
+        if not self.running:
+            return
+        
+        now = datetime.now()
+        now_iso = now.isoformat()
+        heartbeats = []
+        
+        for agent in self.agents.values():
+            if not agent.running:
+                continue
+            
+            agent.last_heartbeat = now
+            agent.last_heartbeat_iso = now_iso
+            self._status_dirty.add(agent.agent_id)
+            heartbeats.append(AgentMessage(
+                id=generate_id("hb", 4),
+                sender=agent.agent_id,
+                recipient="system",
+                message_type=MessageType.HEARTBEAT,
+                payload={
+                    "status": agent.status.value,
+                    "tasks_completed": agent.tasks_completed,
+                    "tasks_failed": agent.tasks_failed,
+                    "average_response_time": agent.average_response_time,
+                    "capabilities": list(agent.capabilities.keys())
+                },
+                timestamp=now_iso,
+                sent_at=now.timestamp()
+            ))
+        
+        if heartbeats:
+            self.message_bus.store_messages(heartbeats)
+        
+        self._heartbeat_handle = asyncio.get_running_loop().call_later(
+            self.heartbeat_interval, self._emit_heartbeats
+        )
+    
     def get_agent_status(self) -> Dict[str, Dict]:
-        """Get status of all agents"""
-        status = {}
-        for agent_id, agent in self.agents.items():
-            status[agent_id] = {
+        """Get status of all agents (per-agent entries are cached and shared, treat as read-only)"""
+        for agent_id in self._status_dirty:
+            agent = self.agents[agent_id]
+            self._status_cache[agent_id] = {
                 "name": agent.name,
                 "status": agent.status.value,
                 "tasks_completed": agent.tasks_completed,
                 "tasks_failed": agent.tasks_failed,
                 "average_response_time": agent.average_response_time,
-                "last_heartbeat": agent.last_heartbeat.isoformat(),
+                "last_heartbeat": agent.last_heartbeat_iso,
                 "capabilities": list(agent.capabilities.keys())
             }
-        return status
+        self._status_dirty.clear()
+        return dict(self._status_cache)
     
     async def broadcast_message(self, message_type: MessageType, payload: Dict, priority: int = 5):
         """Broadcast message to all agents"""
         message = AgentMessage(
-            id=f"bc_{uuid.uuid4().hex[:12]}",
+            id=generate_id("bc"),
             sender="system",
             recipient="broadcast",
             message_type=message_type,
@@ -374,7 +764,7 @@ class AgentManager:
             return False
         
         message = AgentMessage(
-            id=f"cmd_{uuid.uuid4().hex[:12]}",
+            id=generate_id("cmd"),
             sender="system",
             recipient=target_agent,
             message_type=MessageType.COMMAND,
@@ -386,31 +776,50 @@ class AgentManager:
     
     def get_agents_by_capability(self, capability_name: str) -> List[str]:
         """Get list of agent IDs that have a specific capability"""
-        capable_agents = []
-        for agent_id, agent in self.agents.items():
-            if capability_name in agent.capabilities:
-                capable_agents.append(agent_id)
-        return capable_agents
+        return list(self._capability_index.get(capability_name, ()))
     
     async def distribute_task(self, task_type: str, task_data: Dict, required_capability: str = None) -> Optional[str]:
         """Distribute task to most suitable agent"""
-        if required_capability:
-            candidate_agents = self.get_agents_by_capability(required_capability)
-        else:
-            candidate_agents = list(self.agents.keys())
+        # Simple load balancing - choose agent with lowest task count
+        best_agent = self._least_loaded_agent(required_capability or None)
         
-        if not candidate_agents:
+        if best_agent is None:
             self.logger.warning(f"No agents available for task type: {task_type}")
             return None
         
-        # Simple load balancing - choose agent with lowest task count
-        best_agent = min(candidate_agents, key=lambda aid: self.agents[aid].tasks_completed)
-        
         # Send task as command
         await self.send_command(best_agent, task_type, task_data)
         
         return best_agent
 
+    def _least_loaded_agent(self, required_capability: Optional[str]) -> Optional[str]:
+        """Return the candidate agent with the fewest completed tasks"""
+        heap = self._load_heaps.get(required_capability)
+        if heap is None:
+            if required_capability:
+                candidates = self._capability_index.get(required_capability, ())
+            else:
+                candidates = self.agents
+            heap = [(self.agents[agent_id].tasks_completed, agent_id) for agent_id in candidates]
+            heapq.heapify(heap)
+            self._load_heaps[required_capability] = heap
+        
+        while heap:
+            count, agent_id = heap[0]
+            current = self.agents[agent_id].tasks_completed
+            if count == current:
+                return agent_id
+            # Stale entry, reinsert with the agent's current count
+            heapq.heapreplace(heap, (current, agent_id))
+        
+        return None
+
+def run(main: Awaitable[Any], use_uvloop: bool = True) -> Any:
+    """Entry point helper: run main on a uvloop loop when installed, without touching the global loop policy"""
+    if use_uvloop and uvloop is not None:
+        return uvloop.run(main)
+    return asyncio.run(main)
+
 # Global agent manager instance
 lyra_agent_manager = AgentManager()
 
@@ -6,19 +6,88 @@ Specialized agent for time management, scheduling, and executive coordination.
 Handles Google Calendar integration, task management, and deadline tracking.
 """
 
+import array
 import asyncio
+import bisect
+import functools
+import heapq
+import itertools
 import json
 import os
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Set, Tuple
 import calendar
 import time
+from collections import OrderedDict, deque
 
-from agent_framework import BaseAgent, AgentMessage, MessageType, AgentCapability
+# Optional faster JSON encoder for persisted scheduling data
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional vectorized schedule analytics
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from agent_framework import BaseAgent, AgentMessage, MessageType, AgentCapability, generate_id
+
+@functools.lru_cache(maxsize=8192)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO 8601 string, memoized since the same timestamps recur across requests"""
+    return datetime.fromisoformat(value)
+
+def _dump_json(obj: Any) -> bytes:
+    """Serialize persisted data as indented JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+class _ColumnStore:
+    """Append-only parallel float columns of scheduled items, with row ids for materializing results"""
+    
+    def __init__(self, *names: str):
+        self.columns = {name: array.array("d") for name in names}
+        self.ids: List[str] = []
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def append(self, item_id: str, **values: float):
+        """Add a row for an item"""
+        self.ids.append(item_id)
+        for name, column in self.columns.items():
+            column.append(values[name])
+    
+    def column(self, name: str):
+        """Zero-copy NumPy view of a column, or the raw array without NumPy"""
+        if np is not None:
+            return np.frombuffer(self.columns[name], dtype=np.float64)
+        return self.columns[name]
+    
+    def rows_between(self, name: str, low: float, high: float) -> List[int]:
+        """Row numbers whose column value lies in [low, high]"""
+        if np is not None:
+            values = self.column(name)
+            return np.flatnonzero((values >= low) & (values <= high)).tolist()
+        return [i for i, value in enumerate(self.columns[name]) if low <= value <= high]
 
 class AtlasAgent(BaseAgent):
     """Scheduling and executive management agent"""
     
+    # Collections persisted as one JSON shard per item, so checkpoints only rewrite changed items
+    PERSISTED_COLLECTIONS = {
+        "scheduled_tasks": "schedules/atlas_tasks",
+        "calendar_events": "calendar_data/atlas_events",
+        "deadlines": "schedules/atlas_deadlines",
+    }
+    REMINDERS_PATH = "schedules/atlas_reminders.json"
+    checkpoint_interval = 300.0
+    report_cache_size = 64
+    sent_reminder_log_size = 1000
+    
     def __init__(self):
         super().__init__(
             agent_id="atlas",
@@ -76,9 +145,47 @@ class AtlasAgent(BaseAgent):
         self.scheduled_tasks: Dict[str, Dict] = {}
         self.calendar_events: Dict[str, Dict] = {}
         self.deadlines: Dict[str, Dict] = {}
-        self.reminders: List[Dict] = []
+        self.reminders: Dict[str, Dict] = {}
         self.time_blocks: Dict[str, List[Dict]] = {}
         
+        # Busy intervals (start_ts, end_ts, item_id) in epoch seconds sorted by start, plus
+        # the longest interval length, so overlap queries only walk a narrow bisect window
+        self._interval_index: List[Tuple[float, float, str]] = []
+        self._max_interval = 0.0
+        
+        # Contiguous columns (epoch seconds, minutes) of every task and event, so analytics scan
+        # arrays instead of item dicts
+        self._task_columns = _ColumnStore("start", "duration")
+        self._event_columns = _ColumnStore("start", "end")
+        
+        # Pending reminders live in self.reminders and in a (due_ts, reminder_id) min-heap; the
+        # reminder loop sleeps until the earliest one and is woken early when an earlier one is pushed.
+        # Sent reminders move to a bounded log
+        self._reminder_heap: List[Tuple[float, str]] = []
+        self._sent_reminders: deque = deque(maxlen=self.sent_reminder_log_size)
+        self._reminder_wakeup = asyncio.Event()
+        
+        # Custom reminder ids: a per-process start stamp plus a sequence number, unique without a clock read per id
+        self._started_at_ns = time.time_ns()
+        self._reminder_seq = itertools.count(1)
+        
+        # Live counter so status reads don't rescan deadlines
+        self._active_deadline_count = 0
+        
+        # Active deadlines as (deadline_ts, deadline_id) sorted by time, so urgency buckets are bisect bounds
+        self._deadlines_by_time: List[Tuple[float, str]] = []
+        
+        # Item ids changed since the last checkpoint, per persisted collection
+        self._dirty: Dict[str, Set[str]] = {name: set() for name in self.PERSISTED_COLLECTIONS}
+        self._reminders_dirty = False
+        
+        # Shards left by earlier runs are not loaded, so the first checkpoint rewrites everything
+        self._shards_stale = True
+        
+        # Reports cached per (report, minute bucket, schedule version); the version bumps on every change
+        self._schedule_version = 0
+        self._report_cache: "OrderedDict[Tuple, Dict]" = OrderedDict()
+        
         # Google Calendar integration (placeholder)
         self.google_calendar_enabled = False
         self.calendar_service = None
@@ -91,11 +198,26 @@ class AtlasAgent(BaseAgent):
         self.scheduled_tasks = {}
         self.calendar_events = {}
         self.deadlines = {}
-        self.reminders = []
+        self.reminders = {}
+        self._interval_index = []
+        self._max_interval = 0.0
+        self._task_columns = _ColumnStore("start", "duration")
+        self._event_columns = _ColumnStore("start", "end")
+        self._reminder_heap = []
+        self._sent_reminders = deque(maxlen=self.sent_reminder_log_size)
+        self._active_deadline_count = 0
+        self._deadlines_by_time = []
+        self._dirty = {name: set() for name in self.PERSISTED_COLLECTIONS}
+        self._reminders_dirty = False
+        self._shards_stale = True
+        self._schedule_version = 0
+        self._report_cache = OrderedDict()
         
         # Setup scheduling directories
         os.makedirs("schedules", exist_ok=True)
         os.makedirs("calendar_data", exist_ok=True)
+        for directory in self.PERSISTED_COLLECTIONS.values():
+            os.makedirs(directory, exist_ok=True)
         
         # Initialize Google Calendar (placeholder)
         self.google_calendar_enabled = await self._init_google_calendar()
@@ -103,6 +225,9 @@ class AtlasAgent(BaseAgent):
         # Start reminder checking loop
         asyncio.create_task(self._reminder_loop())
         
+        # Start periodic checkpointing of changed scheduling data
+        asyncio.create_task(self._checkpoint_loop())
+        
         self.logger.info(f"ATLAS initialization complete (Google Calendar: {'enabled' if self.google_calendar_enabled else 'disabled'})")
     
     async def process_message(self, message: AgentMessage) -> Optional[AgentMessage]:
@@ -127,6 +252,41 @@ class AtlasAgent(BaseAgent):
                 correlation_id=message.correlation_id
             )
     
+    async def process_batch(self, messages: List[AgentMessage]) -> List[Any]:
+        """Process a message batch, scheduling consecutive schedule_task commands together"""
+        results = []
+        i = 0
+        while i < len(messages):
+            run_end = i
+            while run_end < len(messages) and self._is_schedule_task_command(messages[run_end]):
+                run_end += 1
+            
+            if run_end - i > 1:
+                run = messages[i:run_end]
+                outcomes = await self._schedule_tasks([m.payload.get("parameters", {}) for m in run])
+                results.extend(self._build_response(m, outcome) for m, outcome in zip(run, outcomes))
+                i = run_end
+            else:
+                results.extend(await super().process_batch(messages[i:i + 1]))
+                i += 1
+        
+        return results
+    
+    def _is_schedule_task_command(self, message: AgentMessage) -> bool:
+        """Check whether a message is a schedule_task command"""
+        return message.message_type == MessageType.COMMAND and message.payload.get("command") == "schedule_task"
+    
+    def _build_response(self, message: AgentMessage, result: Dict) -> AgentMessage:
+        """Wrap a command/query result as a response to the original message"""
+        return AgentMessage(
+            id=f"resp_{message.id}",
+            sender=self.agent_id,
+            recipient=message.sender,
+            message_type=MessageType.RESPONSE,
+            payload=result,
+            correlation_id=message.correlation_id
+        )
+    
     async def _handle_command(self, message: AgentMessage) -> Optional[AgentMessage]:
         """Handle command messages"""
         command = message.payload.get("command")
@@ -149,14 +309,7 @@ class AtlasAgent(BaseAgent):
         else:
             result = {"error": f"Unknown command: {command}", "success": False}
         
-        return AgentMessage(
-            id=f"resp_{message.id}",
-            sender=self.agent_id,
-            recipient=message.sender,
-            message_type=MessageType.RESPONSE,
-            payload=result,
-            correlation_id=message.correlation_id
-        )
+        return self._build_response(message, result)
     
     async def _handle_query(self, message: AgentMessage) -> Optional[AgentMessage]:
         """Handle query messages"""
@@ -175,74 +328,93 @@ class AtlasAgent(BaseAgent):
         else:
             result = {"error": f"Unknown query type: {query_type}", "success": False}
         
-        return AgentMessage(
-            id=f"resp_{message.id}",
-            sender=self.agent_id,
-            recipient=message.sender,
-            message_type=MessageType.RESPONSE,
-            payload=result,
-            correlation_id=message.correlation_id
-        )
+        return self._build_response(message, result)
     
     async def _schedule_task(self, parameters: Dict) -> Dict:
         """Schedule a new task"""
-        try:
-            task_name = parameters.get("name")
-            description = parameters.get("description", "")
-            priority = parameters.get("priority", 5)  # 1-10 scale
-            estimated_duration = parameters.get("duration", 60)  # minutes
-            deadline = parameters.get("deadline")
-            dependencies = parameters.get("dependencies", [])
-            
-            if not task_name:
-                return {"error": "Task name is required", "success": False}
-            
-            task_id = f"task_{int(time.time())}_{len(self.scheduled_tasks)}"
-            
-            # Find optimal time slot
-            optimal_slot = await self._find_optimal_time_slot(estimated_duration, deadline, priority)
-            
-            task = {
-                "id": task_id,
-                "name": task_name,
-                "description": description,
-                "priority": priority,
-                "estimated_duration": estimated_duration,
-                "deadline": deadline,
-                "dependencies": dependencies,
-                "scheduled_time": optimal_slot,
-                "status": "scheduled",
-                "created_at": datetime.now().isoformat(),
-                "completed_at": None
-            }
-            
-            self.scheduled_tasks[task_id] = task
-            
-            # Set reminder if deadline exists
-            if deadline:
-                await self._create_deadline_reminder(task_id, deadline)
-            
-            self.logger.info(f"Scheduled task: {task_name} for {optimal_slot}")
-            
-            return {
-                "success": True,
-                "task_id": task_id,
-                "scheduled_time": optimal_slot,
-                "priority": priority
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Error scheduling task: {e}")
-            return {"error": str(e), "success": False}
+        return (await self._schedule_tasks([parameters]))[0]
+    
+    async def _schedule_tasks(self, parameters_list: List[Dict]) -> List[Dict]:
+        """Schedule several tasks, storing the tasks and their reminders in one update"""
+        results = []
+        new_tasks = {}
+        new_reminders = []
+        now = datetime.now()
+        created_at = now.isoformat()
+        
+        for parameters in parameters_list:
+            try:
+                task_name = parameters.get("name")
+                description = parameters.get("description", "")
+                priority = parameters.get("priority", 5)  # 1-10 scale
+                estimated_duration = parameters.get("duration", 60)  # minutes
+                deadline = parameters.get("deadline")
+                dependencies = parameters.get("dependencies", [])
+                
+                if not task_name:
+                    results.append({"error": "Task name is required", "success": False})
+                    continue
+                
+                task_id = generate_id("task")
+                
+                # Find optimal time slot
+                optimal_slot = await self._find_optimal_time_slot(estimated_duration, deadline, priority, now)
+                slot_dt = _parse_iso(optimal_slot)
+                slot_ts = slot_dt.timestamp()
+                
+                new_tasks[task_id] = {
+                    "id": task_id,
+                    "name": task_name,
+                    "description": description,
+                    "priority": priority,
+                    "estimated_duration": estimated_duration,
+                    "deadline": deadline,
+                    "dependencies": dependencies,
+                    "scheduled_time": optimal_slot,
+                    "scheduled_time_ts": slot_ts,
+                    "_scheduled_time_dt": slot_dt,
+                    "_scheduled_end_dt": slot_dt + timedelta(minutes=estimated_duration),
+                    "status": "scheduled",
+                    "created_at": created_at,
+                    "completed_at": None
+                }
+                
+                # Index right away so later tasks in the batch see this slot as busy
+                self._index_interval(slot_ts, slot_ts + estimated_duration * 60, task_id)
+                self._task_columns.append(task_id, start=slot_ts, duration=estimated_duration)
+                
+                # Set reminders if deadline exists
+                if deadline:
+                    new_reminders.extend(self._build_deadline_reminders(task_id, deadline, now))
+                
+                self.logger.info(f"Scheduled task: {task_name} for {optimal_slot}")
+                
+                results.append({
+                    "success": True,
+                    "task_id": task_id,
+                    "scheduled_time": optimal_slot,
+                    "priority": priority
+                })
+                
+            except Exception as e:
+                self.logger.error(f"Error scheduling task: {e}")
+                results.append({"error": str(e), "success": False})
+        
+        self.scheduled_tasks.update(new_tasks)
+        self._mark_changed("scheduled_tasks", *new_tasks)
+        self._add_reminders(new_reminders)
+        
+        return results
     
-    async def _find_optimal_time_slot(self, duration: int, deadline: Optional[str], priority: int) -> str:
+    async def _find_optimal_time_slot(self, duration: int, deadline: Optional[str], priority: int,
+                                      now: Optional[datetime] = None) -> str:
         """Find optimal time slot for task scheduling"""
+        now = now or datetime.now()
+        
         try:
-            now = datetime.now()
-            
             # If deadline specified, work backwards from deadline
             if deadline:
-                deadline_dt = datetime.fromisoformat(deadline)
+                deadline_dt = _parse_iso(deadline)
                 # Schedule 25% before deadline to allow buffer
                 buffer_time = (deadline_dt - now) * 0.25
                 optimal_time = deadline_dt - buffer_time
@@ -267,34 +439,68 @@ class AtlasAgent(BaseAgent):
         except Exception as e:
             self.logger.error(f"Error finding optimal time slot: {e}")
             # Fallback to 2 hours from now
-            return (datetime.now() + timedelta(hours=2)).isoformat()
+            return (now + timedelta(hours=2)).isoformat()
     
     async def _has_time_conflict(self, start_time: datetime, duration: int) -> bool:
         """Check if proposed time slot conflicts with existing schedule"""
-        end_time = start_time + timedelta(minutes=duration)
+        start_ts = start_time.timestamp()
+        end_ts = start_ts + duration * 60
+        return next(self._overlapping_intervals(start_ts, end_ts), None) is not None
+    
+    def _index_interval(self, start: float, end: float, item_id: str):
+        """Add a task or event time range (epoch seconds) to the busy interval index"""
+        bisect.insort(self._interval_index, (start, end, item_id))
+        self._max_interval = max(self._max_interval, end - start)
+    
+    def _overlapping_intervals(self, start: float, end: float):
+        """Yield indexed (start_ts, end_ts, item_id) intervals overlapping [start, end)"""
+        # Only intervals starting in (start - longest interval, end) can overlap
+        lo = bisect.bisect_left(self._interval_index, (start - self._max_interval,))
         
-        # Check against scheduled tasks
-        for task in self.scheduled_tasks.values():
-            if task["status"] != "scheduled":
+        for i in range(lo, len(self._interval_index)):
+            interval = self._interval_index[i]
+            if interval[0] >= end:
+                break
+            if interval[1] <= start or not self._is_busy(interval[2]):
                 continue
-                
-            task_start = datetime.fromisoformat(task["scheduled_time"])
-            task_end = task_start + timedelta(minutes=task["estimated_duration"])
             
-            # Check for overlap
-            if (start_time < task_end) and (end_time > task_start):
-                return True
+            yield interval
+    
+    def _is_busy(self, item_id: str) -> bool:
+        """Check whether an indexed item still blocks time (tasks only while scheduled)"""
+        task = self.scheduled_tasks.get(item_id)
+        return task is None or task["status"] == "scheduled"
+    
+    def _ensure_dt(self, item: Dict, key: str) -> datetime:
+        """Return item[key] as a datetime, caching the parsed value on the item as _<key>_dt"""
+        cache_key = f"_{key}_dt"
+        value = item.get(cache_key)
+        if value is None:
+            value = item[cache_key] = _parse_iso(item[key])
+        return value
+    
+    def _mark_changed(self, collection: str, *item_ids: str):
+        """Record changed items for the next checkpoint and invalidate cached reports"""
+        self._dirty[collection].update(item_ids)
+        self._schedule_version += 1
+    
+    def _cached_report(self, key: Tuple, build) -> Dict:
+        """Return a report built against the current minute, reusing it until the minute or schedule changes"""
+        now = datetime.now().replace(second=0, microsecond=0)
+        cache_key = (key, now, self._schedule_version)
         
-        # Check against calendar events
-        for event in self.calendar_events.values():
-            event_start = datetime.fromisoformat(event["start_time"])
-            event_end = datetime.fromisoformat(event["end_time"])
-            
-            # Check for overlap
-            if (start_time < event_end) and (end_time > event_start):
-                return True
+        report = self._report_cache.get(cache_key)
+        if report is None:
+            report = build(now)
+            self._report_cache[cache_key] = report
+            if len(self._report_cache) > self.report_cache_size:
+                self._report_cache.popitem(last=False)
         
-        return False
+        return report
+    
+    def _public_fields(self, item: Dict) -> Dict:
+        """Copy of a stored item without private cache fields, for persistence"""
+        return {key: value for key, value in item.items() if not key.startswith("_")}
     
     async def _create_calendar_event(self, parameters: Dict) -> Dict:
         """Create a calendar event"""
@@ -309,7 +515,11 @@ class AtlasAgent(BaseAgent):
             if not title or not start_time or not end_time:
                 return {"error": "Title, start_time, and end_time are required", "success": False}
             
-            event_id = f"event_{int(time.time())}_{len(self.calendar_events)}"
+            event_id = generate_id("event")
+            start_dt = _parse_iso(start_time)
+            end_dt = _parse_iso(end_time)
+            start_ts = start_dt.timestamp()
+            end_ts = end_dt.timestamp()
             
             event = {
                 "id": event_id,
@@ -317,6 +527,10 @@ class AtlasAgent(BaseAgent):
                 "description": description,
                 "start_time": start_time,
                 "end_time": end_time,
+                "start_time_ts": start_ts,
+                "end_time_ts": end_ts,
+                "_start_time_dt": start_dt,
+                "_end_time_dt": end_dt,
                 "attendees": attendees,
                 "location": location,
                 "created_at": datetime.now().isoformat(),
@@ -324,6 +538,9 @@ class AtlasAgent(BaseAgent):
             }
             
             self.calendar_events[event_id] = event
+            self._mark_changed("calendar_events", event_id)
+            self._index_interval(start_ts, end_ts, event_id)
+            self._event_columns.append(event_id, start=start_ts, end=end_ts)
             
             # If Google Calendar is enabled, sync to Google Calendar
             if self.google_calendar_enabled:
@@ -354,24 +571,29 @@ class AtlasAgent(BaseAgent):
             if not name or not deadline_time:
                 return {"error": "Name and deadline time are required", "success": False}
             
-            deadline_id = f"deadline_{int(time.time())}_{len(self.deadlines)}"
+            deadline_id = generate_id("deadline")
+            now = datetime.now()
             
             deadline = {
                 "id": deadline_id,
                 "name": name,
                 "deadline": deadline_time,
+                "_deadline_dt": _parse_iso(deadline_time),
                 "description": description,
                 "priority": priority,
                 "project": project,
                 "status": "active",
-                "created_at": datetime.now().isoformat(),
+                "created_at": now.isoformat(),
                 "completed_at": None
             }
             
             self.deadlines[deadline_id] = deadline
+            self._active_deadline_count += 1
+            bisect.insort(self._deadlines_by_time, (deadline["_deadline_dt"].timestamp(), deadline_id))
+            self._mark_changed("deadlines", deadline_id)
             
             # Create reminders
-            await self._create_deadline_reminders(deadline_id, deadline_time)
+            await self._create_deadline_reminders(deadline_id, deadline_time, now)
             
             self.logger.info(f"Set deadline: {name} for {deadline_time}")
             
@@ -386,11 +608,36 @@ class AtlasAgent(BaseAgent):
             self.logger.error(f"Error setting deadline: {e}")
             return {"error": str(e), "success": False}
     
-    async def _create_deadline_reminders(self, deadline_id: str, deadline_time: str):
+    async def _create_deadline_reminders(self, deadline_id: str, deadline_time: str,
+                                         now: Optional[datetime] = None):
         """Create multiple reminders for a deadline"""
+        self._add_reminders(self._build_deadline_reminders(deadline_id, deadline_time, now))
+    
+    def _add_reminders(self, reminders: List[Dict]):
+        """Store reminders and push them onto the due-time heap"""
+        if not reminders:
+            return
+        
+        self._reminders_dirty = True
+        earliest = self._reminder_heap[0][0] if self._reminder_heap else None
+        for reminder in reminders:
+            self.reminders[reminder["id"]] = reminder
+            due_ts = self._ensure_dt(reminder, "reminder_time").timestamp()
+            heapq.heappush(self._reminder_heap, (due_ts, reminder["id"]))
+        
+        # Wake the reminder loop if the next due reminder moved earlier
+        if earliest is None or self._reminder_heap[0][0] < earliest:
+            self._reminder_wakeup.set()
+    
+    def _build_deadline_reminders(self, deadline_id: str, deadline_time: str,
+                                  now: Optional[datetime] = None) -> List[Dict]:
+        """Build the future reminders for a deadline"""
+        reminders = []
+        
         try:
-            deadline_dt = datetime.fromisoformat(deadline_time)
-            now = datetime.now()
+            deadline_dt = _parse_iso(deadline_time)
+            now = now or datetime.now()
+            created_at = now.isoformat()
             
             # Create reminders at different intervals
             reminder_intervals = [
@@ -406,19 +653,20 @@ class AtlasAgent(BaseAgent):
                 
                 # Only create reminder if it's in the future
                 if reminder_time > now:
-                    reminder = {
+                    reminders.append({
                         "id": f"reminder_{deadline_id}_{interval.total_seconds()}",
                         "deadline_id": deadline_id,
                         "reminder_time": reminder_time.isoformat(),
+                        "_reminder_time_dt": reminder_time,
                         "interval": str(interval),
                         "status": "pending",
-                        "created_at": datetime.now().isoformat()
-                    }
-                    
-                    self.reminders.append(reminder)
+                        "created_at": created_at
+                    })
             
         except Exception as e:
             self.logger.error(f"Error creating deadline reminders: {e}")
+        
+        return reminders
     
     async def _schedule_meeting(self, parameters: Dict) -> Dict:
         """Schedule a meeting with attendees"""
@@ -444,7 +692,7 @@ class AtlasAgent(BaseAgent):
                 "title": title,
                 "description": description,
                 "start_time": best_time,
-                "end_time": (datetime.fromisoformat(best_time) + timedelta(minutes=duration)).isoformat(),
+                "end_time": (_parse_iso(best_time) + timedelta(minutes=duration)).isoformat(),
                 "attendees": attendees
             }
             
@@ -479,11 +727,22 @@ class AtlasAgent(BaseAgent):
         # Look for available slot within next 7 days
         end_search = now + timedelta(days=7)
         
-        while candidate_time < end_search:
-            if not await self._has_time_conflict(candidate_time, duration):
-                return candidate_time.isoformat()
-            
-            candidate_time += timedelta(hours=1)
+        # Sweep the start-sorted busy intervals once, pushing the free start past each
+        # overlapping interval until a gap of the requested length opens up
+        free_start = candidate_time.timestamp()
+        search_end = end_search.timestamp()
+        needed = duration * 60
+        
+        lo = bisect.bisect_left(self._interval_index, (free_start - self._max_interval,))
+        for i in range(lo, len(self._interval_index)):
+            start, end, item_id = self._interval_index[i]
+            if start - free_start >= needed or free_start >= search_end:
+                break
+            if end > free_start and self._is_busy(item_id):
+                free_start = end
+        
+        if free_start < search_end:
+            return datetime.fromtimestamp(free_start).isoformat()
         
         # Fallback to 24 hours from now
         return (now + timedelta(days=1)).isoformat()
@@ -528,23 +787,37 @@ class AtlasAgent(BaseAgent):
             start_date = now
             end_date = now + timedelta(days=days)
             
-            # Count scheduled items
-            tasks_in_range = 0
-            events_in_range = 0
-            total_scheduled_time = 0
+            # Count scheduled items from the task and event columns
+            start_ts = start_date.timestamp()
+            end_ts = end_date.timestamp()
             
-            for task in self.scheduled_tasks.values():
-                task_time = datetime.fromisoformat(task["scheduled_time"])
-                if start_date <= task_time <= end_date:
-                    tasks_in_range += 1
-                    total_scheduled_time += task["estimated_duration"]
+            task_starts = self._task_columns.column("start")
+            task_durations = self._task_columns.column("duration")
+            event_starts = self._event_columns.column("start")
+            event_ends = self._event_columns.column("end")
             
-            for event in self.calendar_events.values():
-                event_start = datetime.fromisoformat(event["start_time"])
-                event_end = datetime.fromisoformat(event["end_time"])
-                if start_date <= event_start <= end_date:
-                    events_in_range += 1
-                    total_scheduled_time += (event_end - event_start).total_seconds() / 60
+            if np is not None:
+                task_mask = (task_starts >= start_ts) & (task_starts <= end_ts)
+                tasks_in_range = int(task_mask.sum())
+                total_scheduled_time = float(task_durations[task_mask].sum())
+                
+                event_mask = (event_starts >= start_ts) & (event_starts <= end_ts)
+                events_in_range = int(event_mask.sum())
+                total_scheduled_time += float((event_ends[event_mask] - event_starts[event_mask]).sum()) / 60
+            else:
+                tasks_in_range = 0
+                events_in_range = 0
+                total_scheduled_time = 0
+                
+                for task_start, duration in zip(task_starts, task_durations):
+                    if start_ts <= task_start <= end_ts:
+                        tasks_in_range += 1
+                        total_scheduled_time += duration
+                
+                for event_start, event_end in zip(event_starts, event_ends):
+                    if start_ts <= event_start <= end_ts:
+                        events_in_range += 1
+                        total_scheduled_time += (event_end - event_start) / 60
             
             # Calculate efficiency metrics
             total_available_time = days * 8 * 60  # 8 working hours per day
@@ -560,7 +833,7 @@ class AtlasAgent(BaseAgent):
                 "total_scheduled_minutes": total_scheduled_time,
                 "utilization_rate": utilization_rate,
                 "efficiency_score": efficiency_score,
-                "analysis_timestamp": datetime.now().isoformat()
+                "analysis_timestamp": now.isoformat()
             }
             
         except Exception as e:
@@ -590,12 +863,12 @@ class AtlasAgent(BaseAgent):
                 })
             
             # Check for deadline conflicts
-            upcoming_deadlines = [d for d in self.deadlines.values() if d["status"] == "active"]
-            if len(upcoming_deadlines) > 5:
+            active_deadlines = self._active_deadline_count
+            if active_deadlines > 5:
                 recommendations.append({
                     "type": "deadline_pressure",
                     "priority": "high",
-                    "description": f"{len(upcoming_deadlines)} active deadlines detected.",
+                    "description": f"{active_deadlines} active deadlines detected.",
                     "action": "Review and prioritize deadline-related tasks"
                 })
             
@@ -624,15 +897,16 @@ class AtlasAgent(BaseAgent):
                 return {"error": "Message and time are required", "success": False}
             
             reminder = {
-                "id": f"reminder_{int(time.time())}",
+                "id": f"reminder_{self._started_at_ns}_{next(self._reminder_seq)}",
                 "message": message,
                 "reminder_time": reminder_time,
+                "_reminder_time_dt": _parse_iso(reminder_time),
                 "priority": priority,
                 "status": "pending",
                 "created_at": datetime.now().isoformat()
             }
             
-            self.reminders.append(reminder)
+            self._add_reminders([reminder])
             
             self.logger.info(f"Set reminder: {message} for {reminder_time}")
             
@@ -656,39 +930,27 @@ class AtlasAgent(BaseAgent):
             if not start_time or not end_time:
                 return {"error": "Start time and end time are required", "success": False}
             
-            start_dt = datetime.fromisoformat(start_time)
-            end_dt = datetime.fromisoformat(end_time)
+            start_dt = _parse_iso(start_time)
+            end_dt = _parse_iso(end_time)
             
-            # Check for conflicts
+            # Check for conflicts among indexed tasks and events, in start order
             conflicts = []
-            
-            # Check tasks
-            for task in self.scheduled_tasks.values():
-                if task["status"] != "scheduled":
-                    continue
-                    
-                task_start = datetime.fromisoformat(task["scheduled_time"])
-                task_end = task_start + timedelta(minutes=task["estimated_duration"])
-                
-                if (start_dt < task_end) and (end_dt > task_start):
+            for _, _, item_id in self._overlapping_intervals(start_dt.timestamp(), end_dt.timestamp()):
+                task = self.scheduled_tasks.get(item_id)
+                if task is not None:
                     conflicts.append({
                         "type": "task",
                         "name": task["name"],
-                        "start": task_start.isoformat(),
-                        "end": task_end.isoformat()
+                        "start": task["_scheduled_time_dt"].isoformat(),
+                        "end": task["_scheduled_end_dt"].isoformat()
                     })
-            
-            # Check events
-            for event in self.calendar_events.values():
-                event_start = datetime.fromisoformat(event["start_time"])
-                event_end = datetime.fromisoformat(event["end_time"])
-                
-                if (start_dt < event_end) and (end_dt > event_start):
+                else:
+                    event = self.calendar_events[item_id]
                     conflicts.append({
                         "type": "event",
                         "name": event["title"],
-                        "start": event_start.isoformat(),
-                        "end": event_end.isoformat()
+                        "start": self._ensure_dt(event, "start_time").isoformat(),
+                        "end": self._ensure_dt(event, "end_time").isoformat()
                     })
             
             is_available = len(conflicts) == 0
@@ -705,32 +967,37 @@ class AtlasAgent(BaseAgent):
             return {"error": str(e), "success": False}
     
     async def _reminder_loop(self):
-        """Main loop for checking and sending reminders"""
+        """Main loop for sending reminders as they come due"""
         while self.running:
             try:
                 now = datetime.now()
+                now_ts = now.timestamp()
+                now_iso = now.isoformat()
                 
-                # Check for due reminders
-                due_reminders = []
-                for reminder in self.reminders:
-                    if reminder["status"] == "pending":
-                        reminder_time = datetime.fromisoformat(reminder["reminder_time"])
-                        if now >= reminder_time:
-                            due_reminders.append(reminder)
-                
-                # Send due reminders
-                for reminder in due_reminders:
-                    await self._send_reminder(reminder)
+                # Pop and send due reminders, skipping ones no longer pending
+                while self._reminder_heap and self._reminder_heap[0][0] <= now_ts:
+                    _, reminder_id = heapq.heappop(self._reminder_heap)
+                    reminder = self.reminders.pop(reminder_id, None)
+                    if reminder is None:
+                        continue
+                    await self._send_reminder(reminder, now_iso)
                     reminder["status"] = "sent"
+                    self._sent_reminders.append(reminder)
+                    self._reminders_dirty = True
                 
-                # Sleep for 1 minute before next check
-                await asyncio.sleep(60)
+                # Sleep until the next reminder is due (capped at an hour) or a new one arrives
+                delay = self._reminder_heap[0][0] - now_ts if self._reminder_heap else 3600
+                self._reminder_wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._reminder_wakeup.wait(), timeout=min(delay, 3600))
+                except asyncio.TimeoutError:
+                    pass
                 
             except Exception as e:
                 self.logger.error(f"Error in reminder loop: {e}")
                 await asyncio.sleep(60)
     
-    async def _send_reminder(self, reminder: Dict):
+    async def _send_reminder(self, reminder: Dict, timestamp: Optional[str] = None):
         """Send a reminder alert"""
         try:
             # Send reminder as alert message
@@ -744,7 +1011,7 @@ class AtlasAgent(BaseAgent):
                         "type": "reminder",
                         "message": reminder["message"],
                         "priority": reminder["priority"],
-                        "timestamp": datetime.now().isoformat()
+                        "timestamp": timestamp or datetime.now().isoformat()
                     },
                     priority=reminder["priority"]
                 )
@@ -773,8 +1040,8 @@ class AtlasAgent(BaseAgent):
                 "success": True,
                 "scheduled_tasks": len(self.scheduled_tasks),
                 "calendar_events": len(self.calendar_events),
-                "active_deadlines": len([d for d in self.deadlines.values() if d["status"] == "active"]),
-                "pending_reminders": len([r for r in self.reminders if r["status"] == "pending"]),
+                "active_deadlines": self._active_deadline_count,
+                "pending_reminders": len(self.reminders),
                 "google_calendar_enabled": self.google_calendar_enabled
             }
             
@@ -786,83 +1053,95 @@ class AtlasAgent(BaseAgent):
         """Get upcoming events and tasks"""
         try:
             days_ahead = parameters.get("days", 7)
-            now = datetime.now()
-            end_time = now + timedelta(days=days_ahead)
-            
-            upcoming_items = []
-            
-            # Add tasks
-            for task in self.scheduled_tasks.values():
-                if task["status"] == "scheduled":
-                    task_time = datetime.fromisoformat(task["scheduled_time"])
-                    if now <= task_time <= end_time:
-                        upcoming_items.append({
-                            "type": "task",
-                            "name": task["name"],
-                            "time": task_time.isoformat(),
-                            "priority": task["priority"]
-                        })
-            
-            # Add events
-            for event in self.calendar_events.values():
-                event_time = datetime.fromisoformat(event["start_time"])
-                if now <= event_time <= end_time:
-                    upcoming_items.append({
-                        "type": "event",
-                        "name": event["title"],
-                        "time": event_time.isoformat(),
-                        "duration": (datetime.fromisoformat(event["end_time"]) - event_time).total_seconds() / 60
-                    })
-            
-            # Sort by time
-            upcoming_items.sort(key=lambda x: x["time"])
-            
-            return {
-                "success": True,
-                "upcoming_items": upcoming_items[:20],  # Limit to 20 items
-                "total_items": len(upcoming_items),
-                "date_range": days_ahead
-            }
+            return self._cached_report(("upcoming_events", days_ahead),
+                                       lambda now: self._build_upcoming_events(now, days_ahead))
             
         except Exception as e:
             self.logger.error(f"Error getting upcoming events: {e}")
             return {"error": str(e), "success": False}
     
+    def _build_upcoming_events(self, now: datetime, days_ahead: int) -> Dict:
+        """Build the upcoming events and tasks report from a given start time"""
+        end_time = now + timedelta(days=days_ahead)
+        
+        now_ts = now.timestamp()
+        end_ts = end_time.timestamp()
+        
+        # Collect lightweight (start_ts, id) candidates from the start columns; dicts are only
+        # touched for rows in range and built for the items returned
+        candidates = []
+        
+        # Add tasks
+        task_starts = self._task_columns.columns["start"]
+        for row in self._task_columns.rows_between("start", now_ts, end_ts):
+            task_id = self._task_columns.ids[row]
+            task = self.scheduled_tasks.get(task_id)
+            if task is not None and task["status"] == "scheduled":
+                candidates.append((task_starts[row], task_id))
+        
+        # Add events
+        event_starts = self._event_columns.columns["start"]
+        for row in self._event_columns.rows_between("start", now_ts, end_ts):
+            candidates.append((event_starts[row], self._event_columns.ids[row]))
+        
+        # Select the earliest 20 without sorting the whole range
+        upcoming_items = []
+        for _, item_id in heapq.nsmallest(20, candidates):
+            task = self.scheduled_tasks.get(item_id)
+            if task is not None:
+                item_time = self._ensure_dt(task, "scheduled_time")
+                upcoming_items.append({
+                    "type": "task",
+                    "name": task["name"],
+                    "time": item_time.isoformat(),
+                    "priority": task["priority"]
+                })
+            else:
+                event = self.calendar_events[item_id]
+                item_time = self._ensure_dt(event, "start_time")
+                upcoming_items.append({
+                    "type": "event",
+                    "name": event["title"],
+                    "time": item_time.isoformat(),
+                    "duration": (self._ensure_dt(event, "end_time") - item_time).total_seconds() / 60
+                })
+        
+        return {
+            "success": True,
+            "upcoming_items": upcoming_items,  # Limited to 20 items
+            "total_items": len(candidates),
+            "date_range": days_ahead
+        }
+    
     async def _get_deadline_report(self, parameters: Dict) -> Dict:
         """Get deadline status report"""
         try:
-            active_deadlines = [d for d in self.deadlines.values() if d["status"] == "active"]
-            
-            # Categorize by urgency
-            now = datetime.now()
-            urgent = []  # < 24 hours
-            soon = []    # < 7 days
-            upcoming = [] # > 7 days
-            
-            for deadline in active_deadlines:
-                deadline_time = datetime.fromisoformat(deadline["deadline"])
-                time_until = deadline_time - now
-                
-                if time_until.total_seconds() < 24 * 3600:
-                    urgent.append(deadline)
-                elif time_until.total_seconds() < 7 * 24 * 3600:
-                    soon.append(deadline)
-                else:
-                    upcoming.append(deadline)
-            
-            return {
-                "success": True,
-                "total_deadlines": len(active_deadlines),
-                "urgent": len(urgent),
-                "soon": len(soon),
-                "upcoming": len(upcoming),
-                "urgent_deadlines": [{"name": d["name"], "deadline": d["deadline"]} for d in urgent]
-            }
+            return self._cached_report(("deadline_report",), self._build_deadline_report)
             
         except Exception as e:
             self.logger.error(f"Error getting deadline report: {e}")
             return {"error": str(e), "success": False}
     
+    def _build_deadline_report(self, now: datetime) -> Dict:
+        """Build the deadline status report relative to a given time"""
+        now_ts = now.timestamp()
+        
+        # Categorize by urgency: urgent < 24 hours, soon < 7 days, upcoming beyond
+        urgent_end = bisect.bisect_left(self._deadlines_by_time, (now_ts + 24 * 3600,))
+        soon_end = bisect.bisect_left(self._deadlines_by_time, (now_ts + 7 * 24 * 3600,))
+        total = len(self._deadlines_by_time)
+        
+        urgent = [self.deadlines[deadline_id] for _, deadline_id in self._deadlines_by_time[:urgent_end]]
+        
+        return {
+            "success": True,
+            "total_deadlines": total,
+            "urgent": urgent_end,
+            "soon": soon_end - urgent_end,
+            "upcoming": total - soon_end,
+            "urgent_deadlines": [{"name": d["name"], "deadline": d["deadline"]} for d in urgent]
+        }
+    
     async def _get_time_analysis(self, parameters: Dict) -> Dict:
         """Get time usage analysis"""
         try:
@@ -878,28 +1157,80 @@ class AtlasAgent(BaseAgent):
             self.logger.error(f"Error getting time analysis: {e}")
             return {"error": str(e), "success": False}
     
+    def _write_atomic(self, path: str, data: Any):
+        """Write data as JSON beside path and rename, so a crash never leaves a partial file"""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_dump_json(data))
+        os.replace(tmp_path, path)
+    
+    def _reset_shards(self):
+        """Remove shards of items not held in memory and mark every current item for writing"""
+        for name, directory in self.PERSISTED_COLLECTIONS.items():
+            collection = getattr(self, name)
+            os.makedirs(directory, exist_ok=True)
+            
+            for filename in os.listdir(directory):
+                item_id, ext = os.path.splitext(filename)
+                if ext == ".tmp" or (ext == ".json" and item_id not in collection):
+                    os.remove(os.path.join(directory, filename))
+            
+            self._dirty[name].update(collection)
+        
+        self._reminders_dirty = True
+        self._shards_stale = False
+    
+    def _checkpoint(self):
+        """Write changed tasks, events and deadlines to their shard files, and reminders if changed"""
+        if self._shards_stale:
+            self._reset_shards()
+        
+        for name, directory in self.PERSISTED_COLLECTIONS.items():
+            dirty = self._dirty[name]
+            if not dirty:
+                continue
+            
+            collection = getattr(self, name)
+            os.makedirs(directory, exist_ok=True)
+            
+            for item_id in list(dirty):
+                path = os.path.join(directory, f"{item_id}.json")
+                item = collection.get(item_id)
+                
+                if item is None:
+                    # Item was removed since it was marked dirty
+                    if os.path.exists(path):
+                        os.remove(path)
+                else:
+                    self._write_atomic(path, self._public_fields(item))
+                
+                dirty.discard(item_id)
+        
+        if self._reminders_dirty:
+            reminders = itertools.chain(self._sent_reminders, self.reminders.values())
+            self._write_atomic(self.REMINDERS_PATH, [self._public_fields(r) for r in reminders])
+            self._reminders_dirty = False
+    
+    async def _checkpoint_loop(self):
+        """Periodically persist changed scheduling data so a crash loses at most one interval"""
+        while self.running:
+            await asyncio.sleep(self.checkpoint_interval)
+            
+            try:
+                self._checkpoint()
+            except Exception as e:
+                self.logger.error(f"Error checkpointing scheduling data: {e}")
+    
     async def shutdown(self):
         """Shutdown ATLAS agent"""
         self.logger.info("Shutting down ATLAS agent...")
         
-        # Save scheduling data
+        # Save scheduling data changed since the last checkpoint
         try:
-            with open("schedules/atlas_tasks.json", "w") as f:
-                json.dump(self.scheduled_tasks, f, indent=2)
-            
-            with open("calendar_data/atlas_events.json", "w") as f:
-                json.dump(self.calendar_events, f, indent=2)
-            
-            with open("schedules/atlas_deadlines.json", "w") as f:
-                json.dump(self.deadlines, f, indent=2)
-            
-            with open("schedules/atlas_reminders.json", "w") as f:
-                json.dump(self.reminders, f, indent=2)
-                
+            self._checkpoint()
             self.logger.info("Scheduling data saved successfully")
         except Exception as e:
             self.logger.error(f"Error saving scheduling data: {e}")
 
 # Create ATLAS agent instance
 atlas_agent = AtlasAgent()
-
@@ -6,26 +6,176 @@ Comprehensive integration module for development tools including VS Code, GitHub
 Provides unified interface for code management, repository operations, and development automation.
 """
 
+import asyncio
 import os
 import json
+import shutil
 import subprocess
 import requests
 import base64
 import time
+import functools
+import random
+import threading
+from collections import OrderedDict
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Tuple
+from urllib.parse import parse_qs, urlparse
 import logging
 from pathlib import Path
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Optional async HTTP client for non-blocking GitHub calls from agents
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Optional faster JSON codec for GitHub responses and workspace files
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional libgit2 bindings for in-process repository initialization
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
+# httpx only negotiates HTTP/2 when the h2 package is installed
+try:
+    import h2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Repository fields returned by listings, extracted in one C-level call per repo
+REPO_FIELDS = (
+    'id', 'name', 'full_name', 'description', 'private', 'html_url', 'clone_url', 'ssh_url',
+    'language', 'size', 'stargazers_count', 'forks_count', 'created_at', 'updated_at', 'pushed_at'
+)
+_get_repo_fields = itemgetter(*REPO_FIELDS)
+
+# Scalar issue fields, plus extractors for the nested label and assignee lists
+ISSUE_FIELDS = ('id', 'number', 'title', 'body', 'state', 'html_url', 'created_at', 'updated_at')
+_get_issue_fields = itemgetter(*ISSUE_FIELDS)
+_get_name = itemgetter('name')
+_get_login = itemgetter('login')
+
+# Responses worth retrying: secondary rate limits and transient server errors
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+class RateLimitExceeded(RuntimeError):
+    """GitHub's core API quota is exhausted until its window resets"""
+
+def _load_json(response) -> Any:
+    """Decode a requests/httpx response body, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+def _dump_json(obj: Any) -> bytes:
+    """Serialize data as indented JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+# Where a discovered VS Code path is remembered between runs
+VSCODE_PATH_CACHE = os.path.join(os.path.expanduser("~"), ".cache", "lyra", "vscode_path")
+
+@functools.lru_cache(maxsize=1)
+def _discover_vscode_path() -> Optional[str]:
+    """Locate the VS Code CLI once per process, preferring the path remembered by a previous run"""
+    try:
+        with open(VSCODE_PATH_CACHE) as f:
+            cached_path = f.read().strip()
+        if cached_path and shutil.which(cached_path):
+            return cached_path
+    except OSError:
+        pass
+    
+    possible_paths = [
+        "/usr/bin/code",
+        "/usr/local/bin/code",
+        "/snap/bin/code",
+        "/opt/visual-studio-code/bin/code",
+        "code"  # If in PATH
+    ]
+    
+    # Check for an executable instead of spawning `code --version` per candidate
+    for path in possible_paths:
+        resolved = shutil.which(path)
+        if resolved:
+            try:
+                os.makedirs(os.path.dirname(VSCODE_PATH_CACHE), exist_ok=True)
+                with open(VSCODE_PATH_CACHE, "w") as f:
+                    f.write(resolved)
+            except OSError:
+                pass
+            return resolved
+    
+    return None
+
 class DevelopmentToolsIntegration:
     """Unified development tools integration for Lyra"""
     
+    # Concurrent page fetches (and pooled connections) for paginated GitHub listings
+    max_page_workers = 8
+    
+    # Conditionally revalidated GitHub GET responses kept for If-None-Match requests
+    github_cache_size = 256
+    
+    # Seconds a cached GET is served without contacting GitHub at all
+    contents_cache_ttl = 300
+    repos_cache_ttl = 60
+    issues_cache_ttl = 30
+    search_cache_ttl = 300
+    user_cache_ttl = 60
+    
+    # Exponential backoff for transient GitHub failures (1s, 2s, 4s ... capped)
+    github_max_retries = 3
+    github_backoff_factor = 1.0
+    github_max_backoff = 30.0
+    
+    # Below this many core API calls left, requests are spread over the rest of the rate-limit window,
+    # waiting at most rate_limit_max_delay seconds per request
+    rate_limit_floor = 50
+    rate_limit_max_delay = 10.0
+    
+    # Gate for async GitHub calls: concurrent requests, sustained requests per second and burst size
+    github_max_concurrency = 10
+    github_request_rate = 80 / 60
+    github_request_burst = 20
+    
+    # Consecutive failed async calls that open the circuit, and seconds before it is tried again
+    circuit_fail_threshold = 5
+    circuit_reset_timeout = 30.0
+    
+    # Seconds the installed VS Code extension list is reused before asking the CLI again
+    extensions_cache_ttl = 30
+    
     def __init__(self, github_token: str = None, vscode_path: str = None):
         self.github_token = github_token or os.getenv('GITHUB_TOKEN')
         self.vscode_path = vscode_path or self._find_vscode_path()
         
         # GitHub API configuration
         self.github_api_base = "https://api.github.com"
+        
+        # Endpoint URL templates, built once from the API base
+        self._url_user = self.github_api_base + "/user"
+        self._url_user_repos = self.github_api_base + "/user/repos"
+        self._url_users_repos = self.github_api_base + "/users/{}/repos"
+        self._url_repo = self.github_api_base + "/repos/{}/{}/"
+        self._url_contents = self._url_repo + "contents/{}"
+        self._url_trees = self._url_repo + "git/trees/{}"
+        self._url_issues = self._url_repo + "issues"
+        self._url_pulls = self._url_repo + "pulls"
+        self._url_search_repos = self.github_api_base + "/search/repositories"
         self.github_headers = {
             "Accept": "application/vnd.github.v3+json",
             "User-Agent": "Lyra-AI-System"
@@ -34,10 +184,41 @@ class DevelopmentToolsIntegration:
         if self.github_token:
             self.github_headers["Authorization"] = f"token {self.github_token}"
         
+        # Shared session so GitHub calls reuse pooled keep-alive connections
+        self._session = requests.Session()
+        self._session.headers.update(self.github_headers)
+        retry = Retry(
+            total=self.github_max_retries,
+            backoff_factor=self.github_backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_page_workers, max_retries=retry)
+        self._session.mount("https://", adapter)
+        
+        # (url, params) -> (etag, parsed body, links, fresh until) for cached GitHub requests
+        self._gh_cache: "OrderedDict[Tuple, Tuple[Optional[str], Any, Dict, float]]" = OrderedDict()
+        self._gh_cache_lock = threading.RLock()
+        
+        # Core API quota last reported by GitHub: (remaining calls, window reset epoch)
+        self._rate_limit: Optional[Tuple[int, float]] = None
+        
+        # Shared async client, created on first async call so it binds to the running loop
+        self._async_client = None
+        self._async_semaphore: Optional[asyncio.Semaphore] = None
+        
+        # Token bucket (tokens, last refill) and circuit breaker (failures, open until) for async calls
+        self._bucket: Tuple[float, float] = (float(self.github_request_burst), time.monotonic())
+        self._circuit: Tuple[int, float] = (0, 0.0)
+        
         # VS Code configuration
         self.vscode_extensions_path = None
         self.active_workspace = None
         
+        # (listed at, extension ids) from the last `code --list-extensions`
+        self._extensions_cache: Optional[Tuple[float, List[str]]] = None
+        
         # Setup logging
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger("lyra.dev_tools")
@@ -47,35 +228,23 @@ class DevelopmentToolsIntegration:
     
     def _find_vscode_path(self) -> Optional[str]:
         """Find VS Code installation path"""
-        possible_paths = [
-            "/usr/bin/code",
-            "/usr/local/bin/code",
-            "/snap/bin/code",
-            "/opt/visual-studio-code/bin/code",
-            "code"  # If in PATH
-        ]
-        
-        for path in possible_paths:
-            try:
-                result = subprocess.run([path, "--version"], 
-                                      capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
-                    print(f"Found VS Code at: {path}")
-                    return path
-            except (subprocess.TimeoutExpired, FileNotFoundError):
-                continue
-        
-        print("VS Code not found in standard locations")
-        return None
+        path = _discover_vscode_path()
+        
+        if path:
+            print(f"Found VS Code at: {path}")
+        else:
+            print("VS Code not found in standard locations")
+        
+        return path
     
     def _initialize_components(self):
         """Initialize development tools components"""
         try:
             # Test GitHub API access
             if self.github_token:
-                response = requests.get(f"{self.github_api_base}/user", headers=self.github_headers)
+                response = self._send("GET", self._url_user)
                 if response.status_code == 200:
-                    user_data = response.json()
+                    user_data = _load_json(response)
                     self.logger.info(f"GitHub API authenticated as: {user_data.get('login')}")
                 else:
                     self.logger.warning("GitHub API authentication failed")
@@ -96,41 +265,10 @@ class DevelopmentToolsIntegration:
     def get_user_repositories(self, username: str = None, repo_type: str = "all") -> List[Dict]:
         """Get user repositories"""
         try:
-            if username:
-                url = f"{self.github_api_base}/users/{username}/repos"
-            else:
-                url = f"{self.github_api_base}/user/repos"
-            
-            params = {
-                "type": repo_type,  # all, owner, member
-                "sort": "updated",
-                "per_page": 100
-            }
+            url, params = self._repositories_request(username, repo_type)
+            repos = self._get_all_pages(url, params, ttl=self.repos_cache_ttl)
             
-            response = requests.get(url, headers=self.github_headers, params=params)
-            response.raise_for_status()
-            
-            repos = response.json()
-            
-            formatted_repos = []
-            for repo in repos:
-                formatted_repos.append({
-                    'id': repo['id'],
-                    'name': repo['name'],
-                    'full_name': repo['full_name'],
-                    'description': repo.get('description', ''),
-                    'private': repo['private'],
-                    'html_url': repo['html_url'],
-                    'clone_url': repo['clone_url'],
-                    'ssh_url': repo['ssh_url'],
-                    'language': repo.get('language'),
-                    'size': repo['size'],
-                    'stargazers_count': repo['stargazers_count'],
-                    'forks_count': repo['forks_count'],
-                    'created_at': repo['created_at'],
-                    'updated_at': repo['updated_at'],
-                    'pushed_at': repo['pushed_at']
-                })
+            formatted_repos = [self._format_repository(repo) for repo in repos]
             
             self.logger.info(f"Retrieved {len(formatted_repos)} repositories")
             return formatted_repos
@@ -142,39 +280,193 @@ class DevelopmentToolsIntegration:
             self.logger.error(f"Error processing repositories: {e}")
             return []
     
+    def _repositories_request(self, username: Optional[str], repo_type: str) -> Tuple[str, Dict]:
+        """URL and query parameters for listing a user's repositories"""
+        if username:
+            url = self._url_users_repos.format(username)
+        else:
+            url = self._url_user_repos
+        
+        params = {
+            "type": repo_type,  # all, owner, member
+            "sort": "updated",
+            "per_page": 100
+        }
+        
+        return url, params
+    
+    def _format_repository(self, repo: Dict) -> Dict:
+        """Reshape a GitHub repository listing entry"""
+        try:
+            return dict(zip(REPO_FIELDS, _get_repo_fields(repo)))
+        except KeyError:
+            pass
+        
+        # Entries missing optional fields fall back to per-key defaults
+        return {
+            'id': repo['id'],
+            'name': repo['name'],
+            'full_name': repo['full_name'],
+            'description': repo.get('description', ''),
+            'private': repo['private'],
+            'html_url': repo['html_url'],
+            'clone_url': repo['clone_url'],
+            'ssh_url': repo['ssh_url'],
+            'language': repo.get('language'),
+            'size': repo['size'],
+            'stargazers_count': repo['stargazers_count'],
+            'forks_count': repo['forks_count'],
+            'created_at': repo['created_at'],
+            'updated_at': repo['updated_at'],
+            'pushed_at': repo['pushed_at']
+        }
+    
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a GitHub request through the pooled session, pacing calls when the quota runs low"""
+        delay = self._rate_limit_delay()
+        if delay:
+            time.sleep(delay)
+        
+        response = self._session.request(method, url, **kwargs)
+        self._note_rate_limit(response)
+        return response
+    
+    def _request(self, method: str, url: str, **kwargs) -> Any:
+        """Send a GitHub request and return its decoded JSON body, raising on HTTP errors"""
+        response = self._send(method, url, **kwargs)
+        response.raise_for_status()
+        return _load_json(response)
+    
+    def _note_rate_limit(self, response):
+        """Remember the core API quota reported in a response's rate-limit headers"""
+        headers = response.headers
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        
+        # Search has its own, much smaller, quota that must not throttle other calls
+        if remaining is None or reset is None or headers.get("X-RateLimit-Resource", "core") != "core":
+            return
+        self._rate_limit = (int(remaining), float(reset))
+    
+    def _rate_limit_delay(self) -> float:
+        """Seconds to wait so the remaining core quota lasts until its window resets, raising once it is spent"""
+        if self._rate_limit is None:
+            return 0.0
+        
+        remaining, reset = self._rate_limit
+        window = reset - time.time()
+        if remaining >= self.rate_limit_floor or window <= 0:
+            return 0.0
+        if remaining == 0:
+            raise RateLimitExceeded(f"GitHub rate limit exhausted, resets in {window:.0f}s")
+        
+        delay = min(window / (remaining + 1), self.rate_limit_max_delay)
+        self.logger.warning(f"GitHub rate limit low ({remaining} left), delaying request {delay:.1f}s")
+        return delay
+    
+    def _cache_key(self, url: str, params: Dict = None) -> Tuple:
+        """Key for the conditional GET cache"""
+        return (url, tuple(sorted(params.items())) if params else ())
+    
+    def _cache_lookup(self, key: Tuple) -> Tuple[Optional[Tuple], bool]:
+        """Cached entry for a GET and whether it is still within its TTL"""
+        with self._gh_cache_lock:
+            cached = self._gh_cache.get(key)
+            if cached is None:
+                return None, False
+            self._gh_cache.move_to_end(key)
+            return cached, time.monotonic() < cached[3]
+    
+    def _remember_response(self, key: Tuple, etag: Optional[str], data: Any, links: Dict, ttl: float = 0):
+        """Keep a response body for TTL hits and If-None-Match revalidation, evicting the least recently used"""
+        # Callers reshape cached bodies into new dicts, so the stored objects are never handed out for mutation
+        if etag or ttl:
+            with self._gh_cache_lock:
+                self._gh_cache[key] = (etag, data, links, time.monotonic() + ttl)
+                self._gh_cache.move_to_end(key)
+                if len(self._gh_cache) > self.github_cache_size:
+                    self._gh_cache.popitem(last=False)
+    
+    def _cached_get(self, url: str, params: Dict = None, ttl: float = 0, revalidate: bool = False) -> Tuple[Any, Dict]:
+        """GET a GitHub resource, serving fresh cache hits locally and 304 Not Modified from the cached body
+        
+        With revalidate, the TTL is ignored and the cached ETag is always checked with GitHub.
+        """
+        key = self._cache_key(url, params)
+        cached, fresh = self._cache_lookup(key)
+        if fresh and not revalidate:
+            return cached[1], cached[2]
+        headers = {"If-None-Match": cached[0]} if cached and cached[0] else None
+        
+        response = self._send("GET", url, params=params, headers=headers)
+        if headers and response.status_code == 304:
+            self._remember_response(key, cached[0], cached[1], cached[2], ttl)
+            return cached[1], cached[2]
+        
+        response.raise_for_status()
+        data = _load_json(response)
+        links = response.links
+        
+        self._remember_response(key, response.headers.get("ETag"), data, links, ttl)
+        return data, links
+    
+    def invalidate(self, owner: str, repo: str):
+        """Drop cached responses for a repository after writing to it"""
+        self._invalidate_prefixes((self._url_repo.format(owner, repo),))
+    
+    def invalidate_repository_listings(self):
+        """Drop cached repository listings after creating a repository"""
+        self._invalidate_prefixes((self._url_user_repos, self._url_users_repos.split("{}")[0]))
+    
+    def _invalidate_prefixes(self, prefixes: Tuple[str, ...]):
+        """Drop cached responses whose URL starts with any of the prefixes"""
+        with self._gh_cache_lock:
+            for key in [key for key in self._gh_cache if key[0].startswith(prefixes)]:
+                del self._gh_cache[key]
+    
+    def _get_page(self, url: str, params: Dict = None, ttl: float = 0) -> List[Dict]:
+        """Fetch a single page of a GitHub list endpoint"""
+        return self._cached_get(url, params, ttl)[0]
+    
+    def _get_all_pages(self, url: str, params: Dict, ttl: float = 0) -> List[Dict]:
+        """Fetch every page of a GitHub list endpoint, requesting the remaining pages concurrently"""
+        first_page, links = self._cached_get(url, params, ttl)
+        items = list(first_page)
+        
+        # The first response's Link header names the last page, so the rest can be fetched in parallel
+        last_url = links.get("last", {}).get("url")
+        if last_url:
+            last_page = int(parse_qs(urlparse(last_url).query).get("page", ["1"])[0])
+            page_params = [{**params, "page": page} for page in range(2, last_page + 1)]
+            
+            if page_params:
+                workers = min(self.max_page_workers, len(page_params))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    for page_items in executor.map(lambda p: self._get_page(url, p, ttl), page_params):
+                        items.extend(page_items)
+        else:
+            # No page count available, follow next links one by one
+            next_url = links.get("next", {}).get("url")
+            while next_url:
+                page_items, links = self._cached_get(next_url, ttl=ttl)
+                items.extend(page_items)
+                next_url = links.get("next", {}).get("url")
+        
+        return items
+    
     def create_repository(self, name: str, description: str = "", private: bool = False,
                          auto_init: bool = True, gitignore_template: str = None,
                          license_template: str = None) -> Optional[Dict]:
         """Create a new GitHub repository"""
         try:
-            data = {
-                "name": name,
-                "description": description,
-                "private": private,
-                "auto_init": auto_init
-            }
-            
-            if gitignore_template:
-                data["gitignore_template"] = gitignore_template
-            
-            if license_template:
-                data["license_template"] = license_template
-            
-            response = requests.post(f"{self.github_api_base}/user/repos", 
-                                   headers=self.github_headers, json=data)
-            response.raise_for_status()
+            data = self._repository_payload(name, description, private, auto_init,
+                                            gitignore_template, license_template)
             
-            repo_data = response.json()
+            repo_data = self._request("POST", self._url_user_repos, json=data)
             
+            self.invalidate_repository_listings()
             self.logger.info(f"Created repository: {repo_data['full_name']}")
-            return {
-                'id': repo_data['id'],
-                'name': repo_data['name'],
-                'full_name': repo_data['full_name'],
-                'html_url': repo_data['html_url'],
-                'clone_url': repo_data['clone_url'],
-                'ssh_url': repo_data['ssh_url']
-            }
+            return self._format_created_repository(repo_data)
             
         except requests.RequestException as e:
             self.logger.error(f"Error creating repository: {e}")
@@ -183,31 +475,41 @@ class DevelopmentToolsIntegration:
             self.logger.error(f"Error processing repository creation: {e}")
             return None
     
+    def _repository_payload(self, name: str, description: str, private: bool, auto_init: bool,
+                            gitignore_template: Optional[str], license_template: Optional[str]) -> Dict:
+        """Request body for creating a repository"""
+        data = {
+            "name": name,
+            "description": description,
+            "private": private,
+            "auto_init": auto_init
+        }
+        
+        if gitignore_template:
+            data["gitignore_template"] = gitignore_template
+        
+        if license_template:
+            data["license_template"] = license_template
+        
+        return data
+    
+    def _format_created_repository(self, repo_data: Dict) -> Dict:
+        """Reshape a newly created repository"""
+        return {
+            'id': repo_data['id'],
+            'name': repo_data['name'],
+            'full_name': repo_data['full_name'],
+            'html_url': repo_data['html_url'],
+            'clone_url': repo_data['clone_url'],
+            'ssh_url': repo_data['ssh_url']
+        }
+    
     def get_repository_contents(self, owner: str, repo: str, path: str = "") -> List[Dict]:
         """Get repository contents"""
         try:
-            url = f"{self.github_api_base}/repos/{owner}/{repo}/contents/{path}"
-            
-            response = requests.get(url, headers=self.github_headers)
-            response.raise_for_status()
-            
-            contents = response.json()
-            
-            # Handle single file vs directory
-            if isinstance(contents, dict):
-                contents = [contents]
+            url = self._url_contents.format(owner, repo, path)
             
-            formatted_contents = []
-            for item in contents:
-                formatted_contents.append({
-                    'name': item['name'],
-                    'path': item['path'],
-                    'type': item['type'],  # file or dir
-                    'size': item.get('size', 0),
-                    'sha': item['sha'],
-                    'download_url': item.get('download_url'),
-                    'html_url': item['html_url']
-                })
+            formatted_contents = self._format_contents(self._cached_get(url, ttl=self.contents_cache_ttl)[0])
             
             self.logger.info(f"Retrieved {len(formatted_contents)} items from {owner}/{repo}/{path}")
             return formatted_contents
@@ -219,24 +521,72 @@ class DevelopmentToolsIntegration:
             self.logger.error(f"Error processing repository contents: {e}")
             return []
     
-    def get_file_content(self, owner: str, repo: str, path: str) -> Optional[str]:
-        """Get file content from repository"""
+    def _format_contents(self, contents: Any) -> List[Dict]:
+        """Reshape a contents API response into a list of items"""
+        # Handle single file vs directory
+        if isinstance(contents, dict):
+            contents = [contents]
+        
+        return [{
+            'name': item['name'],
+            'path': item['path'],
+            'type': item['type'],  # file or dir
+            'size': item.get('size', 0),
+            'sha': item['sha'],
+            'download_url': item.get('download_url'),
+            'html_url': item['html_url']
+        } for item in contents]
+    
+    def get_repository_tree(self, owner: str, repo: str, ref: str = "HEAD", path: str = "") -> List[Dict]:
+        """Get every item under a path in one recursive git tree request instead of a walk per directory"""
         try:
-            url = f"{self.github_api_base}/repos/{owner}/{repo}/contents/{path}"
+            url = self._url_trees.format(owner, repo, ref)
             
-            response = requests.get(url, headers=self.github_headers)
-            response.raise_for_status()
+            tree = self._cached_get(url, {"recursive": 1}, ttl=self.contents_cache_ttl)[0]
+            formatted_tree = self._format_tree(tree, path)
             
-            file_data = response.json()
+            self.logger.info(f"Retrieved {len(formatted_tree)} tree items from {owner}/{repo}/{path}")
+            return formatted_tree
             
-            if file_data['type'] != 'file':
-                self.logger.error(f"Path {path} is not a file")
-                return None
+        except requests.RequestException as e:
+            self.logger.error(f"Error getting repository tree: {e}")
+            return []
+        except Exception as e:
+            self.logger.error(f"Error processing repository tree: {e}")
+            return []
+    
+    def _format_tree(self, tree: Dict, path: str = "") -> List[Dict]:
+        """Reshape a recursive git tree response into contents-style items under path"""
+        if tree.get('truncated'):
+            self.logger.warning("Repository tree truncated by GitHub; listing is incomplete")
+        
+        prefix = path.strip("/") + "/" if path.strip("/") else ""
+        item_types = {"blob": "file", "tree": "dir", "commit": "submodule"}
+        
+        return [{
+            'name': item['path'].rsplit("/", 1)[-1],
+            'path': item['path'],
+            'type': item_types.get(item['type'], item['type']),
+            'size': item.get('size', 0),
+            'sha': item['sha']
+        } for item in tree.get('tree', []) if item['path'].startswith(prefix)]
+    
+    def get_file_content(self, owner: str, repo: str, path: str) -> Optional[str]:
+        """Get file content from repository"""
+        try:
+            url = self._url_contents.format(owner, repo, path)
             
-            # Decode base64 content
-            content = base64.b64decode(file_data['content']).decode('utf-8')
+            file_data, _ = self._cached_get(url, ttl=self.contents_cache_ttl)
             
-            self.logger.info(f"Retrieved file content: {owner}/{repo}/{path}")
+            if self._is_raw_only(file_data):
+                response = self._send("GET", file_data['download_url'])
+                response.raise_for_status()
+                content = response.content.decode('utf-8')
+            else:
+                content = self._decode_file(file_data, path)
+            
+            if content is not None:
+                self.logger.info(f"Retrieved file content: {owner}/{repo}/{path}")
             return content
             
         except requests.RequestException as e:
@@ -246,38 +596,56 @@ class DevelopmentToolsIntegration:
             self.logger.error(f"Error processing file content: {e}")
             return None
     
+    def get_file_sha(self, owner: str, repo: str, path: str) -> Optional[str]:
+        """Current blob SHA of a file for updating it, revalidated with GitHub; None if there is no such file"""
+        try:
+            url = self._url_contents.format(owner, repo, path)
+            
+            file_data, _ = self._cached_get(url, ttl=self.contents_cache_ttl, revalidate=True)
+            return self._file_sha(file_data, path)
+            
+        except requests.RequestException as e:
+            if getattr(e.response, "status_code", None) != 404:
+                self.logger.error(f"Error getting file SHA: {e}")
+            return None
+        except Exception as e:
+            self.logger.error(f"Error processing file SHA: {e}")
+            return None
+    
+    def _file_sha(self, file_data: Any, path: str) -> Optional[str]:
+        """SHA of the contents entry for exactly path, if it is a file (a directory lists its children)"""
+        if isinstance(file_data, dict) and file_data.get('type') == 'file' and file_data.get('path') == path.strip("/"):
+            return file_data['sha']
+        return None
+    
+    def _is_raw_only(self, file_data: Any) -> bool:
+        """Whether a contents entry omits its body (files over 1 MB) and must be read from download_url"""
+        return (isinstance(file_data, dict) and file_data.get('encoding') == 'none'
+                and bool(file_data.get('download_url')))
+    
+    def _decode_file(self, file_data: Dict, path: str) -> Optional[str]:
+        """Decode the base64 body of a contents API file entry"""
+        if file_data['type'] != 'file':
+            self.logger.error(f"Path {path} is not a file")
+            return None
+        
+        return base64.b64decode(file_data['content']).decode('utf-8')
+    
     def create_or_update_file(self, owner: str, repo: str, path: str, content: str,
                              message: str, branch: str = "main", sha: str = None) -> Optional[Dict]:
         """Create or update file in repository"""
         try:
-            url = f"{self.github_api_base}/repos/{owner}/{repo}/contents/{path}"
+            url = self._url_contents.format(owner, repo, path)
+            data = self._file_payload(content, message, branch, sha)
             
-            # Encode content to base64
-            encoded_content = base64.b64encode(content.encode('utf-8')).decode('utf-8')
+            result = self._request("PUT", url, json=data)
             
-            data = {
-                "message": message,
-                "content": encoded_content,
-                "branch": branch
-            }
-            
-            # If updating existing file, include SHA
-            if sha:
-                data["sha"] = sha
-            
-            response = requests.put(url, headers=self.github_headers, json=data)
-            response.raise_for_status()
-            
-            result = response.json()
+            self.invalidate(owner, repo)
             
             action = "Updated" if sha else "Created"
             self.logger.info(f"{action} file: {owner}/{repo}/{path}")
             
-            return {
-                'sha': result['content']['sha'],
-                'html_url': result['content']['html_url'],
-                'download_url': result['content']['download_url']
-            }
+            return self._format_file_result(result)
             
         except requests.RequestException as e:
             self.logger.error(f"Error creating/updating file: {e}")
@@ -286,37 +654,44 @@ class DevelopmentToolsIntegration:
             self.logger.error(f"Error processing file operation: {e}")
             return None
     
+    def _file_payload(self, content: str, message: str, branch: str, sha: Optional[str]) -> Dict:
+        """Request body for creating or updating a file"""
+        # Encode content to base64
+        encoded_content = base64.b64encode(content.encode('utf-8')).decode('ascii')
+        
+        data = {
+            "message": message,
+            "content": encoded_content,
+            "branch": branch
+        }
+        
+        # If updating existing file, include SHA
+        if sha:
+            data["sha"] = sha
+        
+        return data
+    
+    def _format_file_result(self, result: Dict) -> Dict:
+        """Reshape a file create/update response"""
+        return {
+            'sha': result['content']['sha'],
+            'html_url': result['content']['html_url'],
+            'download_url': result['content']['download_url']
+        }
+    
     def create_issue(self, owner: str, repo: str, title: str, body: str = "",
                     labels: List[str] = None, assignees: List[str] = None) -> Optional[Dict]:
         """Create issue in repository"""
         try:
-            url = f"{self.github_api_base}/repos/{owner}/{repo}/issues"
-            
-            data = {
-                "title": title,
-                "body": body
-            }
+            url = self._url_issues.format(owner, repo)
+            data = self._issue_payload(title, body, labels, assignees)
             
-            if labels:
-                data["labels"] = labels
-            
-            if assignees:
-                data["assignees"] = assignees
-            
-            response = requests.post(url, headers=self.github_headers, json=data)
-            response.raise_for_status()
-            
-            issue_data = response.json()
+            issue_data = self._request("POST", url, json=data)
+            self.invalidate(owner, repo)
             
             self.logger.info(f"Created issue: {owner}/{repo}#{issue_data['number']}")
             
-            return {
-                'id': issue_data['id'],
-                'number': issue_data['number'],
-                'title': issue_data['title'],
-                'html_url': issue_data['html_url'],
-                'state': issue_data['state']
-            }
+            return self._format_created_item(issue_data)
             
         except requests.RequestException as e:
             self.logger.error(f"Error creating issue: {e}")
@@ -325,39 +700,39 @@ class DevelopmentToolsIntegration:
             self.logger.error(f"Error processing issue creation: {e}")
             return None
     
+    def _issue_payload(self, title: str, body: str, labels: Optional[List[str]],
+                       assignees: Optional[List[str]]) -> Dict:
+        """Request body for creating an issue"""
+        data = {
+            "title": title,
+            "body": body
+        }
+        
+        if labels:
+            data["labels"] = labels
+        
+        if assignees:
+            data["assignees"] = assignees
+        
+        return data
+    
+    def _format_created_item(self, item_data: Dict) -> Dict:
+        """Reshape a newly created issue or pull request"""
+        return {
+            'id': item_data['id'],
+            'number': item_data['number'],
+            'title': item_data['title'],
+            'html_url': item_data['html_url'],
+            'state': item_data['state']
+        }
+    
     def get_repository_issues(self, owner: str, repo: str, state: str = "open") -> List[Dict]:
         """Get repository issues"""
         try:
-            url = f"{self.github_api_base}/repos/{owner}/{repo}/issues"
-            
-            params = {
-                "state": state,  # open, closed, all
-                "per_page": 100
-            }
-            
-            response = requests.get(url, headers=self.github_headers, params=params)
-            response.raise_for_status()
-            
-            issues = response.json()
+            url, params = self._issues_request(owner, repo, state)
             
-            formatted_issues = []
-            for issue in issues:
-                # Skip pull requests (they appear in issues API)
-                if 'pull_request' in issue:
-                    continue
-                
-                formatted_issues.append({
-                    'id': issue['id'],
-                    'number': issue['number'],
-                    'title': issue['title'],
-                    'body': issue.get('body', ''),
-                    'state': issue['state'],
-                    'html_url': issue['html_url'],
-                    'created_at': issue['created_at'],
-                    'updated_at': issue['updated_at'],
-                    'labels': [label['name'] for label in issue.get('labels', [])],
-                    'assignees': [assignee['login'] for assignee in issue.get('assignees', [])]
-                })
+            issues = self._get_all_pages(url, params, ttl=self.issues_cache_ttl)
+            formatted_issues = self._format_issues(issues)
             
             self.logger.info(f"Retrieved {len(formatted_issues)} issues from {owner}/{repo}")
             return formatted_issues
@@ -369,42 +744,523 @@ class DevelopmentToolsIntegration:
             self.logger.error(f"Error processing issues: {e}")
             return []
     
+    def _issues_request(self, owner: str, repo: str, state: str) -> Tuple[str, Dict]:
+        """URL and query parameters for listing a repository's issues"""
+        url = self._url_issues.format(owner, repo)
+        
+        params = {
+            "state": state,  # open, closed, all
+            "per_page": 100
+        }
+        
+        return url, params
+    
+    def _format_issues(self, issues: List[Dict]) -> List[Dict]:
+        """Reshape an issues API response, dropping pull requests"""
+        # Pull requests also appear in the issues API and are skipped
+        return [self._format_issue(issue) for issue in issues if 'pull_request' not in issue]
+    
+    def _format_issue(self, issue: Dict) -> Dict:
+        """Reshape a single issues API entry"""
+        try:
+            formatted = dict(zip(ISSUE_FIELDS, _get_issue_fields(issue)))
+        except KeyError:
+            # Entries missing the optional body fall back to per-key defaults
+            formatted = {
+                'id': issue['id'],
+                'number': issue['number'],
+                'title': issue['title'],
+                'body': issue.get('body', ''),
+                'state': issue['state'],
+                'html_url': issue['html_url'],
+                'created_at': issue['created_at'],
+                'updated_at': issue['updated_at']
+            }
+        
+        formatted['labels'] = list(map(_get_name, issue.get('labels', ())))
+        formatted['assignees'] = list(map(_get_login, issue.get('assignees', ())))
+        return formatted
+    
     def create_pull_request(self, owner: str, repo: str, title: str, head: str, base: str,
                            body: str = "", draft: bool = False) -> Optional[Dict]:
         """Create pull request"""
         try:
-            url = f"{self.github_api_base}/repos/{owner}/{repo}/pulls"
+            url = self._url_pulls.format(owner, repo)
+            data = self._pull_request_payload(title, head, base, body, draft)
             
-            data = {
-                "title": title,
-                "head": head,
-                "base": base,
-                "body": body,
-                "draft": draft
-            }
+            pr_data = self._request("POST", url, json=data)
+            self.invalidate(owner, repo)
             
-            response = requests.post(url, headers=self.github_headers, json=data)
-            response.raise_for_status()
+            self.logger.info(f"Created pull request: {owner}/{repo}#{pr_data['number']}")
             
-            pr_data = response.json()
+            return self._format_created_item(pr_data)
+            
+        except requests.RequestException as e:
+            self.logger.error(f"Error creating pull request: {e}")
+            return None
+        except Exception as e:
+            self.logger.error(f"Error processing pull request creation: {e}")
+            return None
+    
+    def _pull_request_payload(self, title: str, head: str, base: str, body: str, draft: bool) -> Dict:
+        """Request body for creating a pull request"""
+        return {
+            "title": title,
+            "head": head,
+            "base": base,
+            "body": body,
+            "draft": draft
+        }
+    
+    # ==================== ASYNC GITHUB OPERATIONS ====================
+    
+    def _get_async_client(self):
+        """Shared httpx client with pooled (HTTP/2 when available) connections"""
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                headers=self.github_headers,
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=20),
+                timeout=30.0
+            )
+        return self._async_client
+    
+    def _backoff_delay(self, attempt: int, response=None) -> float:
+        """Seconds to wait before retrying, preferring the server's Retry-After"""
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after and retry_after.isdigit():
+            return float(retry_after)
+        
+        delay = min(self.github_max_backoff, self.github_backoff_factor * (2 ** attempt))
+        return delay * random.uniform(0.5, 1.0)
+    
+    async def _acquire_token(self):
+        """Wait for a token from the request bucket, refilled at github_request_rate"""
+        while True:
+            tokens, refilled = self._bucket
+            now = time.monotonic()
+            tokens = min(float(self.github_request_burst), tokens + (now - refilled) * self.github_request_rate)
+            if tokens >= 1:
+                self._bucket = (tokens - 1, now)
+                return
+            self._bucket = (tokens, now)
+            await asyncio.sleep((1 - tokens) / self.github_request_rate)
+    
+    def _record_outcome(self, failed: bool):
+        """Update the circuit breaker, opening it after too many consecutive failures"""
+        if not failed:
+            self._circuit = (0, 0.0)
+            return
+        
+        failures = self._circuit[0] + 1
+        if failures >= self.circuit_fail_threshold:
+            self.logger.warning(f"GitHub failing ({failures} in a row), pausing calls for {self.circuit_reset_timeout:.0f}s")
+            self._circuit = (0, time.monotonic() + self.circuit_reset_timeout)
+        else:
+            self._circuit = (failures, 0.0)
+    
+    async def _async_send(self, method: str, url: str, **kwargs):
+        """Async counterpart of _send, passing every call through the concurrency, rate and circuit gate"""
+        if time.monotonic() < self._circuit[1]:
+            raise httpx.HTTPError("GitHub circuit open after repeated failures")
+        
+        # Pace before taking a concurrency slot so a quota wait does not stall other calls
+        delay = self._rate_limit_delay()
+        if delay:
+            await asyncio.sleep(delay)
+        
+        if self._async_semaphore is None:
+            self._async_semaphore = asyncio.Semaphore(self.github_max_concurrency)
+        
+        async with self._async_semaphore:
+            await self._acquire_token()
+            
+            try:
+                response = await self._get_async_client().request(method, url, **kwargs)
+            except httpx.TransportError:
+                self._record_outcome(failed=True)
+                raise
+        
+        self._record_outcome(failed=response.status_code >= 500)
+        self._note_rate_limit(response)
+        return response
+    
+    async def _async_request(self, method: str, url: str, **kwargs) -> Any:
+        """Async counterpart of _request"""
+        response = await self._async_send(method, url, **kwargs)
+        response.raise_for_status()
+        return _load_json(response)
+    
+    async def _async_get(self, url: str, params: Dict = None, headers: Dict = None):
+        """GET through the async client, retrying transient failures like the sync session does"""
+        for attempt in range(self.github_max_retries + 1):
+            response = None
+            try:
+                response = await self._async_send("GET", url, params=params, headers=headers)
+            except httpx.TransportError:
+                if attempt == self.github_max_retries:
+                    raise
+            else:
+                if response.status_code not in RETRY_STATUSES or attempt == self.github_max_retries:
+                    return response
+            
+            await asyncio.sleep(self._backoff_delay(attempt, response))
+    
+    async def _async_cached_get(self, url: str, params: Dict = None, ttl: float = 0,
+                                revalidate: bool = False) -> Tuple[Any, Dict]:
+        """Async counterpart of _cached_get, sharing its cache"""
+        key = self._cache_key(url, params)
+        cached, fresh = self._cache_lookup(key)
+        if fresh and not revalidate:
+            return cached[1], cached[2]
+        headers = {"If-None-Match": cached[0]} if cached and cached[0] else None
+        
+        response = await self._async_get(url, params=params, headers=headers)
+        if headers and response.status_code == 304:
+            self._remember_response(key, cached[0], cached[1], cached[2], ttl)
+            return cached[1], cached[2]
+        
+        response.raise_for_status()
+        data = _load_json(response)
+        links = response.links
+        
+        self._remember_response(key, response.headers.get("ETag"), data, links, ttl)
+        return data, links
+    
+    async def _async_get_all_pages(self, url: str, params: Dict, ttl: float = 0) -> List[Dict]:
+        """Fetch every page of a GitHub list endpoint, gathering the remaining pages concurrently"""
+        first_page, links = await self._async_cached_get(url, params, ttl)
+        items = list(first_page)
+        
+        last_url = links.get("last", {}).get("url")
+        if last_url:
+            last_page = int(parse_qs(urlparse(last_url).query).get("page", ["1"])[0])
+            
+            # Same bound as the sync thread pool, to stay clear of GitHub's secondary rate limits
+            semaphore = asyncio.Semaphore(self.max_page_workers)
+            
+            async def fetch_page(page: int) -> Tuple[Any, Dict]:
+                async with semaphore:
+                    return await self._async_cached_get(url, {**params, "page": page}, ttl)
+            
+            pages = await asyncio.gather(*(fetch_page(page) for page in range(2, last_page + 1)))
+            for page_items, _ in pages:
+                items.extend(page_items)
+        else:
+            next_url = links.get("next", {}).get("url")
+            while next_url:
+                page_items, links = await self._async_cached_get(next_url, ttl=ttl)
+                items.extend(page_items)
+                next_url = links.get("next", {}).get("url")
+        
+        return items
+    
+    async def async_get_user_repositories(self, username: str = None, repo_type: str = "all") -> List[Dict]:
+        """Get user repositories without blocking the event loop"""
+        if httpx is None:
+            return await asyncio.to_thread(self.get_user_repositories, username, repo_type)
+        
+        try:
+            url, params = self._repositories_request(username, repo_type)
+            repos = await self._async_get_all_pages(url, params, ttl=self.repos_cache_ttl)
+            
+            formatted_repos = [self._format_repository(repo) for repo in repos]
+            
+            self.logger.info(f"Retrieved {len(formatted_repos)} repositories")
+            return formatted_repos
+            
+        except httpx.HTTPError as e:
+            self.logger.error(f"Error getting repositories: {e}")
+            return []
+        except Exception as e:
+            self.logger.error(f"Error processing repositories: {e}")
+            return []
+    
+    async def async_create_repository(self, name: str, description: str = "", private: bool = False,
+                                      auto_init: bool = True, gitignore_template: str = None,
+                                      license_template: str = None) -> Optional[Dict]:
+        """Create a new GitHub repository without blocking the event loop"""
+        if httpx is None:
+            return await asyncio.to_thread(self.create_repository, name, description, private,
+                                           auto_init, gitignore_template, license_template)
+        
+        try:
+            data = self._repository_payload(name, description, private, auto_init,
+                                            gitignore_template, license_template)
+            
+            repo_data = await self._async_request("POST", self._url_user_repos, json=data)
+            
+            self.invalidate_repository_listings()
+            self.logger.info(f"Created repository: {repo_data['full_name']}")
+            return self._format_created_repository(repo_data)
+            
+        except httpx.HTTPError as e:
+            self.logger.error(f"Error creating repository: {e}")
+            return None
+        except Exception as e:
+            self.logger.error(f"Error processing repository creation: {e}")
+            return None
+    
+    async def async_get_repository_contents(self, owner: str, repo: str, path: str = "") -> List[Dict]:
+        """Get repository contents without blocking the event loop"""
+        if httpx is None:
+            return await asyncio.to_thread(self.get_repository_contents, owner, repo, path)
+        
+        try:
+            url = self._url_contents.format(owner, repo, path)
+            
+            contents, _ = await self._async_cached_get(url, ttl=self.contents_cache_ttl)
+            formatted_contents = self._format_contents(contents)
+            
+            self.logger.info(f"Retrieved {len(formatted_contents)} items from {owner}/{repo}/{path}")
+            return formatted_contents
+            
+        except httpx.HTTPError as e:
+            self.logger.error(f"Error getting repository contents: {e}")
+            return []
+        except Exception as e:
+            self.logger.error(f"Error processing repository contents: {e}")
+            return []
+    
+    async def async_get_repository_tree(self, owner: str, repo: str, ref: str = "HEAD", path: str = "") -> List[Dict]:
+        """Get every item under a path in one recursive tree request without blocking the event loop"""
+        if httpx is None:
+            return await asyncio.to_thread(self.get_repository_tree, owner, repo, ref, path)
+        
+        try:
+            url = self._url_trees.format(owner, repo, ref)
+            
+            tree, _ = await self._async_cached_get(url, {"recursive": 1}, ttl=self.contents_cache_ttl)
+            formatted_tree = self._format_tree(tree, path)
+            
+            self.logger.info(f"Retrieved {len(formatted_tree)} tree items from {owner}/{repo}/{path}")
+            return formatted_tree
+            
+        except httpx.HTTPError as e:
+            self.logger.error(f"Error getting repository tree: {e}")
+            return []
+        except Exception as e:
+            self.logger.error(f"Error processing repository tree: {e}")
+            return []
+    
+    async def async_create_or_update_file(self, owner: str, repo: str, path: str, content: str,
+                                          message: str, branch: str = "main", sha: str = None) -> Optional[Dict]:
+        """Create or update file in repository without blocking the event loop"""
+        if httpx is None:
+            return await asyncio.to_thread(self.create_or_update_file, owner, repo, path, content,
+                                           message, branch, sha)
+        
+        try:
+            url = self._url_contents.format(owner, repo, path)
+            data = self._file_payload(content, message, branch, sha)
+            
+            result = await self._async_request("PUT", url, json=data)
+            
+            self.invalidate(owner, repo)
+            
+            action = "Updated" if sha else "Created"
+            self.logger.info(f"{action} file: {owner}/{repo}/{path}")
+            
+            return self._format_file_result(result)
+            
+        except httpx.HTTPError as e:
+            self.logger.error(f"Error creating/updating file: {e}")
+            return None
+        except Exception as e:
+            self.logger.error(f"Error processing file operation: {e}")
+            return None
+    
+    async def async_create_issue(self, owner: str, repo: str, title: str, body: str = "",
+                                 labels: List[str] = None, assignees: List[str] = None) -> Optional[Dict]:
+        """Create issue in repository without blocking the event loop"""
+        if httpx is None:
+            return await asyncio.to_thread(self.create_issue, owner, repo, title, body, labels, assignees)
+        
+        try:
+            url = self._url_issues.format(owner, repo)
+            data = self._issue_payload(title, body, labels, assignees)
+            
+            issue_data = await self._async_request("POST", url, json=data)
+            self.invalidate(owner, repo)
+            
+            self.logger.info(f"Created issue: {owner}/{repo}#{issue_data['number']}")
+            
+            return self._format_created_item(issue_data)
+            
+        except httpx.HTTPError as e:
+            self.logger.error(f"Error creating issue: {e}")
+            return None
+        except Exception as e:
+            self.logger.error(f"Error processing issue creation: {e}")
+            return None
+    
+    async def async_create_issues(self, owner: str, repo: str, issues: List[Dict]) -> List[Optional[Dict]]:
+        """Create several issues in one call, in order (None for issues that failed)"""
+        # GitHub asks for content-creating requests to be made serially, so these are not gathered
+        created = []
+        for issue in issues:
+            created.append(await self.async_create_issue(
+                owner, repo, issue["title"], issue.get("body", ""),
+                issue.get("labels"), issue.get("assignees")
+            ))
+        return created
+    
+    async def async_create_pull_request(self, owner: str, repo: str, title: str, head: str, base: str,
+                                        body: str = "", draft: bool = False) -> Optional[Dict]:
+        """Create pull request without blocking the event loop"""
+        if httpx is None:
+            return await asyncio.to_thread(self.create_pull_request, owner, repo, title, head, base, body, draft)
+        
+        try:
+            url = self._url_pulls.format(owner, repo)
+            data = self._pull_request_payload(title, head, base, body, draft)
+            
+            pr_data = await self._async_request("POST", url, json=data)
+            self.invalidate(owner, repo)
             
             self.logger.info(f"Created pull request: {owner}/{repo}#{pr_data['number']}")
             
-            return {
-                'id': pr_data['id'],
-                'number': pr_data['number'],
-                'title': pr_data['title'],
-                'html_url': pr_data['html_url'],
-                'state': pr_data['state']
-            }
+            return self._format_created_item(pr_data)
             
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             self.logger.error(f"Error creating pull request: {e}")
             return None
         except Exception as e:
             self.logger.error(f"Error processing pull request creation: {e}")
             return None
     
+    async def async_get_github_user_info(self) -> Optional[Dict]:
+        """Get authenticated GitHub user information without blocking the event loop"""
+        if httpx is None:
+            return await asyncio.to_thread(self.get_github_user_info)
+        
+        try:
+            if not self.github_token:
+                return None
+            
+            user_data, _ = await self._async_cached_get(self._url_user, ttl=self.user_cache_ttl)
+            return self._format_user(user_data)
+            
+        except httpx.HTTPError as e:
+            self.logger.error(f"Error getting GitHub user info: {e}")
+            return None
+        except Exception as e:
+            self.logger.error(f"Error processing GitHub user info: {e}")
+            return None
+    
+    async def async_get_file_content(self, owner: str, repo: str, path: str) -> Optional[str]:
+        """Get file content from repository without blocking the event loop"""
+        if httpx is None:
+            return await asyncio.to_thread(self.get_file_content, owner, repo, path)
+        
+        try:
+            url = self._url_contents.format(owner, repo, path)
+            
+            file_data, _ = await self._async_cached_get(url, ttl=self.contents_cache_ttl)
+            
+            if self._is_raw_only(file_data):
+                response = await self._async_get(file_data['download_url'])
+                response.raise_for_status()
+                content = response.content.decode('utf-8')
+            else:
+                content = self._decode_file(file_data, path)
+            
+            if content is not None:
+                self.logger.info(f"Retrieved file content: {owner}/{repo}/{path}")
+            return content
+            
+        except httpx.HTTPError as e:
+            self.logger.error(f"Error getting file content: {e}")
+            return None
+        except Exception as e:
+            self.logger.error(f"Error processing file content: {e}")
+            return None
+    
+    async def async_get_file_sha(self, owner: str, repo: str, path: str) -> Optional[str]:
+        """Current blob SHA of a file, revalidated with GitHub, without blocking the event loop"""
+        if httpx is None:
+            return await asyncio.to_thread(self.get_file_sha, owner, repo, path)
+        
+        try:
+            url = self._url_contents.format(owner, repo, path)
+            
+            file_data, _ = await self._async_cached_get(url, ttl=self.contents_cache_ttl, revalidate=True)
+            return self._file_sha(file_data, path)
+            
+        except httpx.HTTPError as e:
+            response = getattr(e, "response", None)
+            if getattr(response, "status_code", None) != 404:
+                self.logger.error(f"Error getting file SHA: {e}")
+            return None
+        except Exception as e:
+            self.logger.error(f"Error processing file SHA: {e}")
+            return None
+    
+    async def async_get_many_files(self, owner: str, repo: str, paths: List[str]) -> Dict[str, Optional[str]]:
+        """Fetch several files concurrently, keyed by path (None for files that could not be read)"""
+        contents = await asyncio.gather(*(
+            self.async_get_file_content(owner, repo, path) for path in paths
+        ))
+        return dict(zip(paths, contents))
+    
+    async def async_get_repository_issues(self, owner: str, repo: str, state: str = "open") -> List[Dict]:
+        """Get repository issues without blocking the event loop"""
+        if httpx is None:
+            return await asyncio.to_thread(self.get_repository_issues, owner, repo, state)
+        
+        try:
+            url, params = self._issues_request(owner, repo, state)
+            
+            issues = await self._async_get_all_pages(url, params, ttl=self.issues_cache_ttl)
+            formatted_issues = self._format_issues(issues)
+            
+            self.logger.info(f"Retrieved {len(formatted_issues)} issues from {owner}/{repo}")
+            return formatted_issues
+            
+        except httpx.HTTPError as e:
+            self.logger.error(f"Error getting issues: {e}")
+            return []
+        except Exception as e:
+            self.logger.error(f"Error processing issues: {e}")
+            return []
+    
+    async def async_search_repositories(self, query: str, sort: str = "updated", order: str = "desc") -> List[Dict]:
+        """Search GitHub repositories without blocking the event loop"""
+        if httpx is None:
+            return await asyncio.to_thread(self.search_repositories, query, sort, order)
+        
+        try:
+            url, params = self._search_request(query, sort, order)
+            
+            search_results, _ = await self._async_cached_get(url, params, ttl=self.search_cache_ttl)
+            formatted_repos = self._format_search_results(search_results)
+            
+            self.logger.info(f"Found {len(formatted_repos)} repositories for query: {query}")
+            return formatted_repos
+            
+        except httpx.HTTPError as e:
+            self.logger.error(f"Error searching repositories: {e}")
+            return []
+        except Exception as e:
+            self.logger.error(f"Error processing repository search: {e}")
+            return []
+    
+    async def aclose(self):
+        """Close the shared async client"""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+        self._async_semaphore = None
+    
+    def close(self):
+        """Release the pooled connections held by the shared session"""
+        self._session.close()
+    
+    def __del__(self):
+        session = getattr(self, "_session", None)
+        if session is not None:
+            session.close()
+
     # ==================== VS CODE OPERATIONS ====================
     
     def open_vscode(self, path: str = None, new_window: bool = False) -> bool:
@@ -437,24 +1293,34 @@ class DevelopmentToolsIntegration:
     
     def install_vscode_extension(self, extension_id: str) -> bool:
         """Install VS Code extension"""
+        return self.install_vscode_extensions([extension_id])
+    
+    def install_vscode_extensions(self, extension_ids: List[str]) -> bool:
+        """Install several VS Code extensions with a single CLI invocation"""
         try:
             if not self.vscode_path:
                 self.logger.error("VS Code not available")
                 return False
             
-            cmd = [self.vscode_path, "--install-extension", extension_id]
+            if not extension_ids:
+                return True
+            
+            cmd = [self.vscode_path]
+            for extension_id in extension_ids:
+                cmd.extend(["--install-extension", extension_id])
             
             result = subprocess.run(cmd, capture_output=True, text=True)
+            self._extensions_cache = None
             
             if result.returncode == 0:
-                self.logger.info(f"Installed VS Code extension: {extension_id}")
+                self.logger.info(f"Installed VS Code extensions: {', '.join(extension_ids)}")
                 return True
             else:
-                self.logger.error(f"Failed to install extension: {result.stderr}")
+                self.logger.error(f"Failed to install extensions: {result.stderr}")
                 return False
                 
         except Exception as e:
-            self.logger.error(f"Error installing VS Code extension: {e}")
+            self.logger.error(f"Error installing VS Code extensions: {e}")
             return False
     
     def list_vscode_extensions(self) -> List[str]:
@@ -464,6 +1330,11 @@ class DevelopmentToolsIntegration:
                 self.logger.error("VS Code not available")
                 return []
             
+            # Reuse a recent listing instead of starting the CLI again
+            cached = self._extensions_cache
+            if cached and time.monotonic() - cached[0] < self.extensions_cache_ttl:
+                return list(cached[1])
+            
             cmd = [self.vscode_path, "--list-extensions"]
             
             result = subprocess.run(cmd, capture_output=True, text=True)
@@ -471,9 +1342,10 @@ class DevelopmentToolsIntegration:
             if result.returncode == 0:
                 extensions = result.stdout.strip().split('\n')
                 extensions = [ext for ext in extensions if ext]  # Remove empty lines
+                self._extensions_cache = (time.monotonic(), extensions)
                 
                 self.logger.info(f"Found {len(extensions)} VS Code extensions")
-                return extensions
+                return list(extensions)
             else:
                 self.logger.error(f"Failed to list extensions: {result.stderr}")
                 return []
@@ -496,8 +1368,8 @@ class DevelopmentToolsIntegration:
             if extensions:
                 workspace_config["extensions"] = extensions
             
-            with open(workspace_path, 'w') as f:
-                json.dump(workspace_config, f, indent=2)
+            with open(workspace_path, 'wb') as f:
+                f.write(_dump_json(workspace_config))
             
             self.logger.info(f"Created VS Code workspace: {workspace_path}")
             return True
@@ -531,40 +1403,52 @@ class DevelopmentToolsIntegration:
             self.logger.error(f"Error cloning repository: {e}")
             return False
     
+    def init_git_repository(self, repo_path: str) -> bool:
+        """Initialize a Git repository, in-process through libgit2 when pygit2 is installed"""
+        try:
+            if pygit2 is not None:
+                pygit2.init_repository(repo_path, bare=False)
+            else:
+                subprocess.run(["git", "init"], cwd=repo_path, check=True, capture_output=True, text=True)
+            
+            self.logger.info(f"Initialized Git repository in {repo_path}")
+            return True
+            
+        except subprocess.CalledProcessError as e:
+            self.logger.error(f"Failed to initialize Git repository: {e} {e.stderr or ''}".rstrip())
+            return False
+        except Exception as e:
+            self.logger.error(f"Error initializing Git repository: {e}")
+            return False
+    
     def git_commit_and_push(self, repo_path: str, message: str, files: List[str] = None,
                            branch: str = None, push: bool = True) -> bool:
         """Commit and push changes to Git repository"""
         try:
-            original_dir = os.getcwd()
-            os.chdir(repo_path)
+            git = functools.partial(subprocess.run, check=True, cwd=repo_path, capture_output=True, text=True)
             
-            try:
-                # Add files
-                if files:
-                    for file in files:
-                        subprocess.run(["git", "add", file], check=True)
-                else:
-                    subprocess.run(["git", "add", "."], check=True)
-                
-                # Commit
-                subprocess.run(["git", "commit", "-m", message], check=True)
-                
-                # Push if requested
-                if push:
-                    push_cmd = ["git", "push"]
-                    if branch:
-                        push_cmd.extend(["origin", branch])
-                    
-                    subprocess.run(push_cmd, check=True)
-                
-                self.logger.info(f"Committed and pushed changes: {message}")
-                return True
+            # Add files in a single invocation
+            if files:
+                git(["git", "add", "--", *files])
+            else:
+                git(["git", "add", "."])
+            
+            # Commit
+            git(["git", "commit", "-m", message])
+            
+            # Push if requested
+            if push:
+                push_cmd = ["git", "push"]
+                if branch:
+                    push_cmd.extend(["origin", branch])
                 
-            finally:
-                os.chdir(original_dir)
+                git(push_cmd)
+            
+            self.logger.info(f"Committed and pushed changes: {message}")
+            return True
                 
         except subprocess.CalledProcessError as e:
-            self.logger.error(f"Git operation failed: {e}")
+            self.logger.error(f"Git operation failed: {e} {e.stderr or ''}".rstrip())
             return False
         except Exception as e:
             self.logger.error(f"Error in git commit/push: {e}")
@@ -573,25 +1457,19 @@ class DevelopmentToolsIntegration:
     def create_git_branch(self, repo_path: str, branch_name: str, checkout: bool = True) -> bool:
         """Create Git branch"""
         try:
-            original_dir = os.getcwd()
-            os.chdir(repo_path)
+            git = functools.partial(subprocess.run, check=True, cwd=repo_path, capture_output=True, text=True)
             
-            try:
-                # Create branch
-                subprocess.run(["git", "branch", branch_name], check=True)
-                
-                # Checkout if requested
-                if checkout:
-                    subprocess.run(["git", "checkout", branch_name], check=True)
-                
-                self.logger.info(f"Created Git branch: {branch_name}")
-                return True
-                
-            finally:
-                os.chdir(original_dir)
+            # Create the branch, checking it out in the same git invocation if requested
+            if checkout:
+                git(["git", "checkout", "-b", branch_name])
+            else:
+                git(["git", "branch", branch_name])
+            
+            self.logger.info(f"Created Git branch: {branch_name}")
+            return True
                 
         except subprocess.CalledProcessError as e:
-            self.logger.error(f"Failed to create Git branch: {e}")
+            self.logger.error(f"Failed to create Git branch: {e} {e.stderr or ''}".rstrip())
             return False
         except Exception as e:
             self.logger.error(f"Error creating Git branch: {e}")
@@ -605,43 +1483,17 @@ class DevelopmentToolsIntegration:
             project_path = Path(project_path)
             project_path.mkdir(parents=True, exist_ok=True)
             
-            if project_type == "python":
-                # Python project structure
-                (project_path / "src").mkdir(exist_ok=True)
-                (project_path / "tests").mkdir(exist_ok=True)
-                (project_path / "docs").mkdir(exist_ok=True)
-                (project_path / "scripts").mkdir(exist_ok=True)
-                
-                # Create files
-                (project_path / "README.md").touch()
-                (project_path / "requirements.txt").touch()
-                (project_path / "setup.py").touch()
-                (project_path / ".gitignore").write_text(self._get_python_gitignore())
-                
-            elif project_type == "javascript":
-                # JavaScript/Node.js project structure
-                (project_path / "src").mkdir(exist_ok=True)
-                (project_path / "test").mkdir(exist_ok=True)
-                (project_path / "docs").mkdir(exist_ok=True)
-                (project_path / "public").mkdir(exist_ok=True)
-                
-                # Create files
-                (project_path / "README.md").touch()
-                (project_path / "package.json").touch()
-                (project_path / ".gitignore").write_text(self._get_javascript_gitignore())
-                
-            elif project_type == "web":
-                # Web project structure
-                (project_path / "src").mkdir(exist_ok=True)
-                (project_path / "assets").mkdir(exist_ok=True)
-                (project_path / "css").mkdir(exist_ok=True)
-                (project_path / "js").mkdir(exist_ok=True)
-                (project_path / "images").mkdir(exist_ok=True)
-                
-                # Create files
-                (project_path / "index.html").touch()
-                (project_path / "README.md").touch()
-                (project_path / ".gitignore").write_text(self._get_web_gitignore())
+            directories, files = PROJECT_LAYOUTS.get(project_type, ((), ()))
+            
+            for directory in directories:
+                (project_path / directory).mkdir(exist_ok=True)
+            
+            # Empty placeholders are touched, templates written in one call
+            for filename, content in files:
+                if content is None:
+                    (project_path / filename).touch()
+                else:
+                    (project_path / filename).write_bytes(content)
             
             self.logger.info(f"Created {project_type} project structure: {project_path}")
             return True
@@ -650,9 +1502,101 @@ class DevelopmentToolsIntegration:
             self.logger.error(f"Error creating project structure: {e}")
             return False
     
-    def _get_python_gitignore(self) -> str:
-        """Get Python .gitignore template"""
-        return """# Byte-compiled / optimized / DLL files
+    # ==================== UTILITY METHODS ====================
+    
+    def get_github_user_info(self) -> Optional[Dict]:
+        """Get authenticated GitHub user information"""
+        try:
+            if not self.github_token:
+                return None
+            
+            user_data, _ = self._cached_get(self._url_user, ttl=self.user_cache_ttl)
+            return self._format_user(user_data)
+            
+        except requests.RequestException as e:
+            self.logger.error(f"Error getting GitHub user info: {e}")
+            return None
+        except Exception as e:
+            self.logger.error(f"Error processing GitHub user info: {e}")
+            return None
+    
+    def _format_user(self, user_data: Dict) -> Dict:
+        """Reshape the authenticated user profile"""
+        return {
+            'login': user_data['login'],
+            'name': user_data.get('name'),
+            'email': user_data.get('email'),
+            'bio': user_data.get('bio'),
+            'public_repos': user_data['public_repos'],
+            'followers': user_data['followers'],
+            'following': user_data['following'],
+            'created_at': user_data['created_at']
+        }
+    
+    def search_repositories(self, query: str, sort: str = "updated", order: str = "desc") -> List[Dict]:
+        """Search GitHub repositories"""
+        try:
+            url, params = self._search_request(query, sort, order)
+            
+            search_results, _ = self._cached_get(url, params, ttl=self.search_cache_ttl)
+            formatted_repos = self._format_search_results(search_results)
+            
+            self.logger.info(f"Found {len(formatted_repos)} repositories for query: {query}")
+            return formatted_repos
+            
+        except requests.RequestException as e:
+            self.logger.error(f"Error searching repositories: {e}")
+            return []
+        except Exception as e:
+            self.logger.error(f"Error processing repository search: {e}")
+            return []
+    
+    def _search_request(self, query: str, sort: str, order: str) -> Tuple[str, Dict]:
+        """URL and query parameters for a repository search"""
+        url = self._url_search_repos
+        
+        params = {
+            "q": query,
+            "sort": sort,  # stars, forks, updated
+            "order": order,  # asc, desc
+            "per_page": 50
+        }
+        
+        return url, params
+    
+    def _format_search_results(self, search_results: Dict) -> List[Dict]:
+        """Reshape a repository search response"""
+        return [{
+            'id': repo['id'],
+            'name': repo['name'],
+            'full_name': repo['full_name'],
+            'description': repo.get('description', ''),
+            'html_url': repo['html_url'],
+            'language': repo.get('language'),
+            'stargazers_count': repo['stargazers_count'],
+            'forks_count': repo['forks_count'],
+            'updated_at': repo['updated_at']
+        } for repo in search_results.get('items', [])]
+    
+    def is_github_authenticated(self) -> bool:
+        """Check if GitHub is authenticated"""
+        return self.github_token is not None
+    
+    def is_vscode_available(self) -> bool:
+        """Check if VS Code is available"""
+        return self.vscode_path is not None
+    
+    def get_integration_status(self) -> Dict[str, Any]:
+        """Get development tools integration status"""
+        return {
+            'github_authenticated': self.is_github_authenticated(),
+            'vscode_available': self.is_vscode_available(),
+            'github_token_set': bool(self.github_token),
+            'vscode_path': self.vscode_path
+        }
+
+# .gitignore templates for create_project_structure, kept as bytes so each is written in one call
+PYTHON_GITIGNORE = b"""# Byte-compiled / optimized / DLL files
 __pycache__/
 *.py[cod]
 *$py.class
@@ -756,10 +1700,9 @@ venv.bak/
 .dmypy.json
 dmypy.json
 """
-    
-    def _get_javascript_gitignore(self) -> str:
-        """Get JavaScript .gitignore template"""
-        return """# Logs
+
+# JavaScript .gitignore template
+JAVASCRIPT_GITIGNORE = b"""# Logs
 logs
 *.log
 npm-debug.log*
@@ -830,10 +1773,9 @@ typings/
 # Serverless directories
 .serverless
 """
-    
-    def _get_web_gitignore(self) -> str:
-        """Get Web .gitignore template"""
-        return """# OS generated files
+
+# Web .gitignore template
+WEB_GITIGNORE = b"""# OS generated files
 .DS_Store
 .DS_Store?
 ._*
@@ -878,97 +1820,31 @@ build/
 *.tmp
 *.temp
 """
-    
-    # ==================== UTILITY METHODS ====================
-    
-    def get_github_user_info(self) -> Optional[Dict]:
-        """Get authenticated GitHub user information"""
-        try:
-            if not self.github_token:
-                return None
-            
-            response = requests.get(f"{self.github_api_base}/user", headers=self.github_headers)
-            response.raise_for_status()
-            
-            user_data = response.json()
-            
-            return {
-                'login': user_data['login'],
-                'name': user_data.get('name'),
-                'email': user_data.get('email'),
-                'bio': user_data.get('bio'),
-                'public_repos': user_data['public_repos'],
-                'followers': user_data['followers'],
-                'following': user_data['following'],
-                'created_at': user_data['created_at']
-            }
-            
-        except requests.RequestException as e:
-            self.logger.error(f"Error getting GitHub user info: {e}")
-            return None
-        except Exception as e:
-            self.logger.error(f"Error processing GitHub user info: {e}")
-            return None
-    
-    def search_repositories(self, query: str, sort: str = "updated", order: str = "desc") -> List[Dict]:
-        """Search GitHub repositories"""
-        try:
-            url = f"{self.github_api_base}/search/repositories"
-            
-            params = {
-                "q": query,
-                "sort": sort,  # stars, forks, updated
-                "order": order,  # asc, desc
-                "per_page": 50
-            }
-            
-            response = requests.get(url, headers=self.github_headers, params=params)
-            response.raise_for_status()
-            
-            search_results = response.json()
-            repos = search_results.get('items', [])
-            
-            formatted_repos = []
-            for repo in repos:
-                formatted_repos.append({
-                    'id': repo['id'],
-                    'name': repo['name'],
-                    'full_name': repo['full_name'],
-                    'description': repo.get('description', ''),
-                    'html_url': repo['html_url'],
-                    'language': repo.get('language'),
-                    'stargazers_count': repo['stargazers_count'],
-                    'forks_count': repo['forks_count'],
-                    'updated_at': repo['updated_at']
-                })
-            
-            self.logger.info(f"Found {len(formatted_repos)} repositories for query: {query}")
-            return formatted_repos
-            
-        except requests.RequestException as e:
-            self.logger.error(f"Error searching repositories: {e}")
-            return []
-        except Exception as e:
-            self.logger.error(f"Error processing repository search: {e}")
-            return []
-    
-    def is_github_authenticated(self) -> bool:
-        """Check if GitHub is authenticated"""
-        return self.github_token is not None
-    
-    def is_vscode_available(self) -> bool:
-        """Check if VS Code is available"""
-        return self.vscode_path is not None
-    
-    def get_integration_status(self) -> Dict[str, Any]:
-        """Get development tools integration status"""
-        return {
-            'github_authenticated': self.is_github_authenticated(),
-            'vscode_available': self.is_vscode_available(),
-            'github_token_set': bool(self.github_token),
-            'vscode_path': self.vscode_path
-        }
 
-# Global development tools instance
-dev_tools = DevelopmentToolsIntegration()
+# Directories and (filename, template or None for an empty file) per project type
+PROJECT_LAYOUTS: Dict[str, Tuple[Tuple[str, ...], Tuple[Tuple[str, Optional[bytes]], ...]]] = {
+    "python": (
+        ("src", "tests", "docs", "scripts"),
+        (("README.md", None), ("requirements.txt", None), ("setup.py", None), (".gitignore", PYTHON_GITIGNORE))
+    ),
+    "javascript": (
+        ("src", "test", "docs", "public"),
+        (("README.md", None), ("package.json", None), (".gitignore", JAVASCRIPT_GITIGNORE))
+    ),
+    "web": (
+        ("src", "assets", "css", "js", "images"),
+        (("index.html", None), ("README.md", None), (".gitignore", WEB_GITIGNORE))
+    )
+}
+
+@functools.lru_cache(maxsize=1)
+def get_dev_tools() -> DevelopmentToolsIntegration:
+    """Shared development tools instance, created on first use rather than at import"""
+    return DevelopmentToolsIntegration()
+
+def __getattr__(name: str) -> Any:
+    # Keep the old module-level `dev_tools` name working without constructing it at import
+    if name == "dev_tools":
+        return get_dev_tools()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
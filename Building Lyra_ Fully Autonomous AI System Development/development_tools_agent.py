@@ -7,17 +7,72 @@ Provides seamless integration with Lyra's multi-agent system for development wor
 """
 
 import asyncio
-import json
+import copy
+import itertools
 import os
-from datetime import datetime
-from typing import Dict, List, Optional, Any
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, Dict, List, Optional, Any, Union
 
-from agents.agent_framework import BaseAgent, AgentMessage, MessageType, AgentCapability
-from integrations.development_tools import dev_tools
+from agents.agent_framework import BaseAgent, AgentMessage, MessageType, AgentCapability, format_timestamp
+from integrations.development_tools import _dump_json, get_dev_tools
+
+# Scheduling priority per command or query type (lower runs first); others default to DEFAULT_PRIORITY
+COMMAND_PRIORITIES = {
+    "capabilities": 0,
+    "integration_status": 0,
+    "vscode_extensions": 1,
+    "user_repositories": 1,
+    "repository_contents": 1,
+    "repository_issues": 1,
+    "search_repositories": 1,
+    "get_repositories": 1,
+    "get_files": 1,
+    "open_vscode": 1,
+    "create_repository": 2,
+    "create_issue": 2,
+    "create_issues": 2,
+    "create_pull_request": 2,
+    "update_file": 2,
+    "clone_repository": 3,
+    "create_project": 3,
+    "setup_project_structure": 3,
+    "git_commit_push": 3
+}
+DEFAULT_PRIORITY = 2
+
+# Parameters each command or query needs, checked once before it is queued
+REQUIRED_PARAMETERS = {
+    "create_repository": ("name",),
+    "clone_repository": ("repo_url", "local_path"),
+    "create_issue": ("owner", "repo", "title"),
+    "create_issues": ("owner", "repo", "issues"),
+    "create_pull_request": ("owner", "repo", "title", "head", "base"),
+    "update_file": ("owner", "repo", "path", "content", "message"),
+    "get_files": ("owner", "repo", "paths"),
+    "create_workspace": ("workspace_path",),
+    "create_project": ("project_name",),
+    "setup_project_structure": ("project_path",),
+    "git_commit_push": ("repo_path", "message"),
+    "create_branch": ("repo_path", "branch_name"),
+    "repository_contents": ("owner", "repo"),
+    "repository_issues": ("owner", "repo"),
+    "search_repositories": ("query",)
+}
 
 class DevelopmentToolsAgent(BaseAgent):
     """Agent for development tools integration"""
     
+    # Worker threads for blocking git, VS Code and filesystem calls
+    max_blocking_workers = 8
+    
+    # Coroutines draining the prioritized command queue
+    command_workers = 4
+    
+    # Seconds an integration status response is reused between state changes
+    status_cache_ttl = 1.0
+    
     def __init__(self):
         super().__init__(
             agent_id="development_tools",
@@ -66,12 +121,78 @@ class DevelopmentToolsAgent(BaseAgent):
         self.github_authenticated = False
         self.vscode_available = False
         self.active_projects = {}
-        self.recent_repositories = []
+        self.recent_repositories: deque = deque(maxlen=10)  # Most recent first
+        
+        # Bumped on every tracked state change; (cached at, response) for the status query
+        self.state_version = 0
+        self._status_cache: Optional[tuple] = None
+        
+        # Bounded pool so concurrent commands cannot spawn unlimited blocking work
+        self.blocking_executor = ThreadPoolExecutor(max_workers=self.max_blocking_workers,
+                                                    thread_name_prefix="dev_tools")
+        
+        # Prioritized work queue, created with its workers on first use so it binds to the running loop
+        self._command_queue: Optional[asyncio.PriorityQueue] = None
+        self._command_seq = itertools.count()  # FIFO among equal priorities
+        self._workers: List[asyncio.Task] = []
+        
+        # Dispatch tables, built once so each message costs a single dict lookup
+        self.message_handlers = {
+            MessageType.COMMAND: self._handle_command,
+            MessageType.QUERY: self._handle_query
+        }
+        
+        self.command_handlers: Dict[str, Callable[[Dict], Awaitable[Dict]]] = {
+            # GitHub operations
+            "create_repository": self._create_repository,
+            "clone_repository": self._clone_repository,
+            "get_repositories": self._get_repositories,
+            "create_issue": self._create_issue,
+            "create_issues": self._create_issues,
+            "create_pull_request": self._create_pull_request,
+            "update_file": self._update_file,
+            "get_files": self._get_files,
+            
+            # VS Code operations
+            "open_vscode": self._open_vscode,
+            "install_extension": self._install_extension,
+            "create_workspace": self._create_workspace,
+            
+            # Project management
+            "create_project": self._create_project,
+            "setup_project_structure": self._setup_project_structure,
+            
+            # Git operations
+            "git_commit_push": self._git_commit_push,
+            "create_branch": self._create_branch
+        }
+        
+        self.query_handlers: Dict[str, Callable[[Dict], Awaitable[Dict]]] = {
+            "integration_status": self._get_integration_status,
+            "user_repositories": self._get_user_repositories,
+            "repository_contents": self._get_repository_contents,
+            "repository_issues": self._get_repository_issues,
+            "vscode_extensions": self._get_vscode_extensions,
+            "search_repositories": self._search_repositories,
+            "capabilities": self._get_capabilities
+        }
+        
+        # Read-only GitHub queries whose identical concurrent requests share one call
+        self.coalesced_queries = frozenset({
+            "user_repositories",
+            "repository_contents",
+            "repository_issues",
+            "search_repositories"
+        })
+        self._inflight: Dict[tuple, asyncio.Task] = {}
     
     async def initialize(self):
         """Initialize development tools agent"""
         self.logger.info("Initializing Development Tools agent...")
         
+        # Constructing the shared instance probes GitHub, so do it off the event loop
+        dev_tools = await self._run_blocking(get_dev_tools)
+        
         # Check integration status
         status = dev_tools.get_integration_status()
         self.github_authenticated = status['github_authenticated']
@@ -81,7 +202,7 @@ class DevelopmentToolsAgent(BaseAgent):
             self.logger.info("GitHub API authenticated successfully")
             
             # Get user info
-            user_info = dev_tools.get_github_user_info()
+            user_info = await dev_tools.async_get_github_user_info()
             if user_info:
                 self.logger.info(f"GitHub user: {user_info['login']}")
         else:
@@ -94,108 +215,122 @@ class DevelopmentToolsAgent(BaseAgent):
         
         self.logger.info("Development Tools agent initialization complete")
     
+    async def _run_blocking(self, func: Callable, *args) -> Any:
+        """Run a blocking dev tools call on the agent's worker pool"""
+        return await asyncio.get_running_loop().run_in_executor(self.blocking_executor, func, *args)
+    
+    async def process_batch(self, messages: List[AgentMessage]) -> List[Union[AgentMessage, Exception, None]]:
+        """Process a batch concurrently so the command queue can order it by priority"""
+        return await asyncio.gather(*(self.process_message(message) for message in messages),
+                                    return_exceptions=True)
+    
     async def process_message(self, message: AgentMessage) -> Optional[AgentMessage]:
         """Process incoming messages for development tools operations"""
         try:
-            if message.message_type == MessageType.COMMAND:
-                return await self._handle_command(message)
-            elif message.message_type == MessageType.QUERY:
-                return await self._handle_query(message)
-            else:
+            handler = self.message_handlers.get(message.message_type)
+            if handler is None:
                 self.logger.debug(f"Ignoring message type: {message.message_type}")
                 return None
+            
+            return await handler(message)
                 
         except Exception as e:
             self.logger.error(f"Error processing message: {e}")
-            return AgentMessage(
-                id=f"err_{message.id}",
-                sender=self.agent_id,
-                recipient=message.sender,
-                message_type=MessageType.RESPONSE,
-                payload={"error": str(e), "success": False},
-                correlation_id=message.correlation_id
-            )
+            return self._make_response(message, {"error": str(e), "success": False}, "err")
+    
+    def _make_response(self, message: AgentMessage, payload: Dict, prefix: str = "resp") -> AgentMessage:
+        """Build the response message answering an incoming message"""
+        return AgentMessage(
+            f"{prefix}_{message.id}",
+            self.agent_id,
+            message.sender,
+            MessageType.RESPONSE,
+            payload,
+            correlation_id=message.correlation_id
+        )
     
     async def _handle_command(self, message: AgentMessage) -> Optional[AgentMessage]:
         """Handle command messages"""
         command = message.payload.get("command")
         parameters = message.payload.get("parameters", {})
         
-        # GitHub operations
-        if command == "create_repository":
-            result = await self._create_repository(parameters)
-        elif command == "clone_repository":
-            result = await self._clone_repository(parameters)
-        elif command == "get_repositories":
-            result = await self._get_repositories(parameters)
-        elif command == "create_issue":
-            result = await self._create_issue(parameters)
-        elif command == "create_pull_request":
-            result = await self._create_pull_request(parameters)
-        elif command == "update_file":
-            result = await self._update_file(parameters)
-        
-        # VS Code operations
-        elif command == "open_vscode":
-            result = await self._open_vscode(parameters)
-        elif command == "install_extension":
-            result = await self._install_extension(parameters)
-        elif command == "create_workspace":
-            result = await self._create_workspace(parameters)
-        
-        # Project management
-        elif command == "create_project":
-            result = await self._create_project(parameters)
-        elif command == "setup_project_structure":
-            result = await self._setup_project_structure(parameters)
-        
-        # Git operations
-        elif command == "git_commit_push":
-            result = await self._git_commit_push(parameters)
-        elif command == "create_branch":
-            result = await self._create_branch(parameters)
-        
+        handler = self.command_handlers.get(command)
+        missing = self._missing_parameters(command, parameters)
+        if handler and missing:
+            result = missing
+        elif handler:
+            result = await self._dispatch(command, handler, parameters)
         else:
             result = {"error": f"Unknown command: {command}", "success": False}
         
-        return AgentMessage(
-            id=f"resp_{message.id}",
-            sender=self.agent_id,
-            recipient=message.sender,
-            message_type=MessageType.RESPONSE,
-            payload=result,
-            correlation_id=message.correlation_id
-        )
+        return self._make_response(message, result)
     
     async def _handle_query(self, message: AgentMessage) -> Optional[AgentMessage]:
         """Handle query messages"""
         query_type = message.payload.get("query_type")
         
-        if query_type == "integration_status":
-            result = await self._get_integration_status(message.payload)
-        elif query_type == "user_repositories":
-            result = await self._get_user_repositories(message.payload)
-        elif query_type == "repository_contents":
-            result = await self._get_repository_contents(message.payload)
-        elif query_type == "repository_issues":
-            result = await self._get_repository_issues(message.payload)
-        elif query_type == "vscode_extensions":
-            result = await self._get_vscode_extensions(message.payload)
-        elif query_type == "search_repositories":
-            result = await self._search_repositories(message.payload)
-        elif query_type == "capabilities":
-            result = {"capabilities": list(self.capabilities.keys()), "success": True}
+        handler = self.query_handlers.get(query_type)
+        missing = self._missing_parameters(query_type, message.payload)
+        if handler and missing:
+            result = missing
+        elif handler and query_type in self.coalesced_queries:
+            result = await self._coalesced(query_type, handler, message.payload)
+        elif handler:
+            result = await self._dispatch(query_type, handler, message.payload)
         else:
             result = {"error": f"Unknown query type: {query_type}", "success": False}
         
-        return AgentMessage(
-            id=f"resp_{message.id}",
-            sender=self.agent_id,
-            recipient=message.sender,
-            message_type=MessageType.RESPONSE,
-            payload=result,
-            correlation_id=message.correlation_id
-        )
+        return self._make_response(message, result)
+    
+    def _missing_parameters(self, name: str, parameters: Dict) -> Optional[Dict]:
+        """Error result naming the required parameters that are absent or empty, if any"""
+        missing = [key for key in REQUIRED_PARAMETERS.get(name, ()) if not parameters.get(key)]
+        if missing:
+            return {"error": f"Missing required parameters: {', '.join(missing)}", "success": False}
+        return None
+    
+    async def _dispatch(self, name: str, handler: Callable[[Dict], Awaitable[Dict]], parameters: Dict) -> Dict:
+        """Queue a handler call by priority and wait for a worker to run it"""
+        if self._command_queue is None:
+            self._command_queue = asyncio.PriorityQueue()
+            self._workers = [asyncio.create_task(self._command_worker()) for _ in range(self.command_workers)]
+        
+        future = asyncio.get_running_loop().create_future()
+        priority = COMMAND_PRIORITIES.get(name, DEFAULT_PRIORITY)
+        await self._command_queue.put((priority, next(self._command_seq), handler, parameters, future))
+        return await future
+    
+    async def _command_worker(self):
+        """Run queued handler calls, highest priority first"""
+        while True:
+            _, _, handler, parameters, future = await self._command_queue.get()
+            try:
+                if not future.cancelled():
+                    future.set_result(await handler(parameters))
+            except Exception as e:
+                if not future.cancelled():
+                    future.set_exception(e)
+            finally:
+                self._command_queue.task_done()
+    
+    async def _coalesced(self, query_type: str, handler: Callable[[Dict], Awaitable[Dict]], payload: Dict) -> Dict:
+        """Run a read-only query, joining an identical one already in flight"""
+        try:
+            key = (query_type, frozenset(payload.items()))
+            hash(key)
+        except TypeError:
+            # Unhashable parameters, so run the query on its own
+            return await self._dispatch(query_type, handler, payload)
+        
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._dispatch(query_type, handler, payload))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        
+        # Shield so one cancelled caller does not cancel the shared call; deep copy so
+        # joined callers never share the nested repository or contents lists
+        return copy.deepcopy(await asyncio.shield(task))
     
     # ==================== GITHUB OPERATIONS ====================
     
@@ -205,17 +340,14 @@ class DevelopmentToolsAgent(BaseAgent):
             if not self.github_authenticated:
                 return {"error": "GitHub not authenticated", "success": False}
             
-            name = parameters.get("name")
+            name = parameters["name"]
             description = parameters.get("description", "")
             private = parameters.get("private", False)
             auto_init = parameters.get("auto_init", True)
             gitignore_template = parameters.get("gitignore_template")
             license_template = parameters.get("license_template")
             
-            if not name:
-                return {"error": "Repository name is required", "success": False}
-            
-            repo_data = dev_tools.create_repository(
+            repo_data = await get_dev_tools().async_create_repository(
                 name=name,
                 description=description,
                 private=private,
@@ -228,8 +360,8 @@ class DevelopmentToolsAgent(BaseAgent):
                 self.logger.info(f"Created repository: {repo_data['full_name']}")
                 
                 # Add to recent repositories
-                self.recent_repositories.insert(0, repo_data)
-                self.recent_repositories = self.recent_repositories[:10]  # Keep last 10
+                self.recent_repositories.appendleft(repo_data)
+                self._state_changed()
                 
                 return {
                     "success": True,
@@ -245,14 +377,10 @@ class DevelopmentToolsAgent(BaseAgent):
     async def _clone_repository(self, parameters: Dict) -> Dict:
         """Clone GitHub repository"""
         try:
-            repo_url = parameters.get("repo_url")
-            local_path = parameters.get("local_path")
+            repo_url, local_path = parameters["repo_url"], parameters["local_path"]
             branch = parameters.get("branch")
             
-            if not repo_url or not local_path:
-                return {"error": "Repository URL and local path are required", "success": False}
-            
-            success = dev_tools.clone_repository(repo_url, local_path, branch)
+            success = await self._run_blocking(get_dev_tools().clone_repository, repo_url, local_path, branch)
             
             if success:
                 self.logger.info(f"Cloned repository: {repo_url}")
@@ -262,8 +390,9 @@ class DevelopmentToolsAgent(BaseAgent):
                 self.active_projects[project_name] = {
                     "path": local_path,
                     "repo_url": repo_url,
-                    "cloned_at": datetime.now().isoformat()
+                    "cloned_at": format_timestamp(time.time())
                 }
+                self._state_changed()
                 
                 return {
                     "success": True,
@@ -286,7 +415,7 @@ class DevelopmentToolsAgent(BaseAgent):
             username = parameters.get("username")
             repo_type = parameters.get("repo_type", "all")
             
-            repos = dev_tools.get_user_repositories(username, repo_type)
+            repos = await get_dev_tools().async_get_user_repositories(username, repo_type)
             
             self.logger.info(f"Retrieved {len(repos)} repositories")
             
@@ -306,17 +435,12 @@ class DevelopmentToolsAgent(BaseAgent):
             if not self.github_authenticated:
                 return {"error": "GitHub not authenticated", "success": False}
             
-            owner = parameters.get("owner")
-            repo = parameters.get("repo")
-            title = parameters.get("title")
+            owner, repo, title = parameters["owner"], parameters["repo"], parameters["title"]
             body = parameters.get("body", "")
             labels = parameters.get("labels", [])
             assignees = parameters.get("assignees", [])
             
-            if not owner or not repo or not title:
-                return {"error": "Owner, repo, and title are required", "success": False}
-            
-            issue_data = dev_tools.create_issue(owner, repo, title, body, labels, assignees)
+            issue_data = await get_dev_tools().async_create_issue(owner, repo, title, body, labels, assignees)
             
             if issue_data:
                 self.logger.info(f"Created issue: {owner}/{repo}#{issue_data['number']}")
@@ -332,24 +456,44 @@ class DevelopmentToolsAgent(BaseAgent):
             self.logger.error(f"Error creating issue: {e}")
             return {"error": str(e), "success": False}
     
+    async def _create_issues(self, parameters: Dict) -> Dict:
+        """Create several GitHub issues from one command"""
+        try:
+            if not self.github_authenticated:
+                return {"error": "GitHub not authenticated", "success": False}
+            
+            owner, repo, issues = parameters["owner"], parameters["repo"], parameters["issues"]
+            
+            if not all(issue.get("title") for issue in issues):
+                return {"error": "Every issue needs a title", "success": False}
+            
+            created = await get_dev_tools().async_create_issues(owner, repo, issues)
+            failed = [issue["title"] for issue, result in zip(issues, created) if result is None]
+            
+            self.logger.info(f"Created {len(created) - len(failed)} issues in {owner}/{repo}")
+            
+            return {
+                "success": not failed,
+                "issues": [result for result in created if result is not None],
+                "failed": failed
+            }
+            
+        except Exception as e:
+            self.logger.error(f"Error creating issues: {e}")
+            return {"error": str(e), "success": False}
+    
     async def _create_pull_request(self, parameters: Dict) -> Dict:
         """Create GitHub pull request"""
         try:
             if not self.github_authenticated:
                 return {"error": "GitHub not authenticated", "success": False}
             
-            owner = parameters.get("owner")
-            repo = parameters.get("repo")
-            title = parameters.get("title")
-            head = parameters.get("head")
-            base = parameters.get("base")
+            owner, repo, title = parameters["owner"], parameters["repo"], parameters["title"]
+            head, base = parameters["head"], parameters["base"]
             body = parameters.get("body", "")
             draft = parameters.get("draft", False)
             
-            if not all([owner, repo, title, head, base]):
-                return {"error": "Owner, repo, title, head, and base are required", "success": False}
-            
-            pr_data = dev_tools.create_pull_request(owner, repo, title, head, base, body, draft)
+            pr_data = await get_dev_tools().async_create_pull_request(owner, repo, title, head, base, body, draft)
             
             if pr_data:
                 self.logger.info(f"Created pull request: {owner}/{repo}#{pr_data['number']}")
@@ -371,27 +515,14 @@ class DevelopmentToolsAgent(BaseAgent):
             if not self.github_authenticated:
                 return {"error": "GitHub not authenticated", "success": False}
             
-            owner = parameters.get("owner")
-            repo = parameters.get("repo")
-            path = parameters.get("path")
-            content = parameters.get("content")
-            message = parameters.get("message")
+            owner, repo, path = parameters["owner"], parameters["repo"], parameters["path"]
+            content, message = parameters["content"], parameters["message"]
             branch = parameters.get("branch", "main")
             
-            if not all([owner, repo, path, content, message]):
-                return {"error": "Owner, repo, path, content, and message are required", "success": False}
-            
-            # Get existing file SHA if updating
-            existing_content = dev_tools.get_file_content(owner, repo, path)
-            sha = None
-            
-            if existing_content is not None:
-                # File exists, get SHA for update
-                contents = dev_tools.get_repository_contents(owner, repo, path)
-                if contents:
-                    sha = contents[0]['sha']
+            # One revalidated lookup tells whether the file exists and gives its current SHA for the update
+            sha = await get_dev_tools().async_get_file_sha(owner, repo, path)
             
-            result = dev_tools.create_or_update_file(owner, repo, path, content, message, branch, sha)
+            result = await get_dev_tools().async_create_or_update_file(owner, repo, path, content, message, branch, sha)
             
             if result:
                 action = "Updated" if sha else "Created"
@@ -409,6 +540,30 @@ class DevelopmentToolsAgent(BaseAgent):
             self.logger.error(f"Error updating file: {e}")
             return {"error": str(e), "success": False}
     
+    async def _get_files(self, parameters: Dict) -> Dict:
+        """Fetch several files from a GitHub repository concurrently"""
+        try:
+            if not self.github_authenticated:
+                return {"error": "GitHub not authenticated", "success": False}
+            
+            owner, repo, paths = parameters["owner"], parameters["repo"], parameters["paths"]
+            
+            files = await get_dev_tools().async_get_many_files(owner, repo, paths)
+            missing = [path for path, content in files.items() if content is None]
+            
+            self.logger.info(f"Retrieved {len(files) - len(missing)} files from {owner}/{repo}")
+            
+            return {
+                "success": True,
+                "files": files,
+                "missing": missing,
+                "count": len(files) - len(missing)
+            }
+            
+        except Exception as e:
+            self.logger.error(f"Error getting files: {e}")
+            return {"error": str(e), "success": False}
+    
     # ==================== VS CODE OPERATIONS ====================
     
     async def _open_vscode(self, parameters: Dict) -> Dict:
@@ -420,7 +575,7 @@ class DevelopmentToolsAgent(BaseAgent):
             path = parameters.get("path")
             new_window = parameters.get("new_window", False)
             
-            success = dev_tools.open_vscode(path, new_window)
+            success = await self._run_blocking(get_dev_tools().open_vscode, path, new_window)
             
             if success:
                 self.logger.info(f"Opened VS Code: {path or 'default'}")
@@ -444,18 +599,20 @@ class DevelopmentToolsAgent(BaseAgent):
                 return {"error": "VS Code not available", "success": False}
             
             extension_id = parameters.get("extension_id")
+            extension_ids = parameters.get("extension_ids") or ([extension_id] if extension_id else [])
             
-            if not extension_id:
+            if not extension_ids:
                 return {"error": "Extension ID is required", "success": False}
             
-            success = dev_tools.install_vscode_extension(extension_id)
+            success = await self._run_blocking(get_dev_tools().install_vscode_extensions, extension_ids)
             
             if success:
-                self.logger.info(f"Installed VS Code extension: {extension_id}")
+                self.logger.info(f"Installed VS Code extensions: {', '.join(extension_ids)}")
                 
                 return {
                     "success": True,
-                    "extension_id": extension_id
+                    "extension_id": extension_id,
+                    "extension_ids": extension_ids
                 }
             else:
                 return {"error": "Failed to install extension", "success": False}
@@ -467,15 +624,12 @@ class DevelopmentToolsAgent(BaseAgent):
     async def _create_workspace(self, parameters: Dict) -> Dict:
         """Create VS Code workspace"""
         try:
-            workspace_path = parameters.get("workspace_path")
+            workspace_path = parameters["workspace_path"]
             folders = parameters.get("folders", [])
             settings = parameters.get("settings", {})
             extensions = parameters.get("extensions", {})
             
-            if not workspace_path:
-                return {"error": "Workspace path is required", "success": False}
-            
-            success = dev_tools.create_vscode_workspace(workspace_path, folders, settings, extensions)
+            success = await self._run_blocking(get_dev_tools().create_vscode_workspace, workspace_path, folders, settings, extensions)
             
             if success:
                 self.logger.info(f"Created VS Code workspace: {workspace_path}")
@@ -497,20 +651,14 @@ class DevelopmentToolsAgent(BaseAgent):
     async def _create_project(self, parameters: Dict) -> Dict:
         """Create development project"""
         try:
-            project_name = parameters.get("project_name")
-            project_path = parameters.get("project_path")
+            project_name = parameters["project_name"]
+            project_path = parameters.get("project_path") or f"./{project_name}"
             project_type = parameters.get("project_type", "python")
             initialize_git = parameters.get("initialize_git", True)
             create_github_repo = parameters.get("create_github_repo", False)
             
-            if not project_name:
-                return {"error": "Project name is required", "success": False}
-            
-            if not project_path:
-                project_path = f"./{project_name}"
-            
             # Create project structure
-            success = dev_tools.create_project_structure(project_path, project_type)
+            success = await self._run_blocking(get_dev_tools().create_project_structure, project_path, project_type)
             
             if not success:
                 return {"error": "Failed to create project structure", "success": False}
@@ -519,23 +667,20 @@ class DevelopmentToolsAgent(BaseAgent):
                 "name": project_name,
                 "path": project_path,
                 "type": project_type,
-                "created_at": datetime.now().isoformat()
+                "created_at": format_timestamp(time.time())
             }
             
             # Initialize Git if requested
             if initialize_git:
-                try:
-                    import subprocess
-                    subprocess.run(["git", "init"], cwd=project_path, check=True)
-                    project_info["git_initialized"] = True
-                    self.logger.info(f"Initialized Git repository in {project_path}")
-                except Exception as e:
-                    self.logger.warning(f"Failed to initialize Git: {e}")
-                    project_info["git_initialized"] = False
+                project_info["git_initialized"] = await self._run_blocking(
+                    get_dev_tools().init_git_repository, project_path
+                )
+                if not project_info["git_initialized"]:
+                    self.logger.warning(f"Failed to initialize Git in {project_path}")
             
             # Create GitHub repository if requested
             if create_github_repo and self.github_authenticated:
-                repo_data = dev_tools.create_repository(
+                repo_data = await get_dev_tools().async_create_repository(
                     name=project_name,
                     description=f"Auto-created {project_type} project",
                     private=False,
@@ -548,6 +693,7 @@ class DevelopmentToolsAgent(BaseAgent):
             
             # Track as active project
             self.active_projects[project_name] = project_info
+            self._state_changed()
             
             self.logger.info(f"Created project: {project_name}")
             
@@ -563,13 +709,10 @@ class DevelopmentToolsAgent(BaseAgent):
     async def _setup_project_structure(self, parameters: Dict) -> Dict:
         """Setup project structure"""
         try:
-            project_path = parameters.get("project_path")
+            project_path = parameters["project_path"]
             project_type = parameters.get("project_type", "python")
             
-            if not project_path:
-                return {"error": "Project path is required", "success": False}
-            
-            success = dev_tools.create_project_structure(project_path, project_type)
+            success = await self._run_blocking(get_dev_tools().create_project_structure, project_path, project_type)
             
             if success:
                 self.logger.info(f"Setup project structure: {project_path}")
@@ -591,16 +734,12 @@ class DevelopmentToolsAgent(BaseAgent):
     async def _git_commit_push(self, parameters: Dict) -> Dict:
         """Git commit and push"""
         try:
-            repo_path = parameters.get("repo_path")
-            message = parameters.get("message")
+            repo_path, message = parameters["repo_path"], parameters["message"]
             files = parameters.get("files")
             branch = parameters.get("branch")
             push = parameters.get("push", True)
             
-            if not repo_path or not message:
-                return {"error": "Repository path and commit message are required", "success": False}
-            
-            success = dev_tools.git_commit_and_push(repo_path, message, files, branch, push)
+            success = await self._run_blocking(get_dev_tools().git_commit_and_push, repo_path, message, files, branch, push)
             
             if success:
                 self.logger.info(f"Git commit and push successful: {message}")
@@ -621,14 +760,10 @@ class DevelopmentToolsAgent(BaseAgent):
     async def _create_branch(self, parameters: Dict) -> Dict:
         """Create Git branch"""
         try:
-            repo_path = parameters.get("repo_path")
-            branch_name = parameters.get("branch_name")
+            repo_path, branch_name = parameters["repo_path"], parameters["branch_name"]
             checkout = parameters.get("checkout", True)
             
-            if not repo_path or not branch_name:
-                return {"error": "Repository path and branch name are required", "success": False}
-            
-            success = dev_tools.create_git_branch(repo_path, branch_name, checkout)
+            success = await self._run_blocking(get_dev_tools().create_git_branch, repo_path, branch_name, checkout)
             
             if success:
                 self.logger.info(f"Created Git branch: {branch_name}")
@@ -648,22 +783,38 @@ class DevelopmentToolsAgent(BaseAgent):
     
     # ==================== QUERY OPERATIONS ====================
     
+    def _state_changed(self):
+        """Record a change to tracked projects or repositories"""
+        self.state_version += 1
+        self._status_cache = None
+    
     async def _get_integration_status(self, parameters: Dict) -> Dict:
-        """Get integration status"""
+        """Get integration status, reusing a response younger than status_cache_ttl"""
         try:
-            status = dev_tools.get_integration_status()
+            cached = self._status_cache
+            if cached and time.monotonic() - cached[0] < self.status_cache_ttl:
+                return cached[1]
             
-            return {
+            status = get_dev_tools().get_integration_status()
+            
+            result = {
                 "success": True,
                 "integration_status": status,
                 "active_projects": len(self.active_projects),
-                "recent_repositories": len(self.recent_repositories)
+                "recent_repositories": len(self.recent_repositories),
+                "state_version": self.state_version
             }
+            self._status_cache = (time.monotonic(), result)
+            return result
             
         except Exception as e:
             self.logger.error(f"Error getting integration status: {e}")
             return {"error": str(e), "success": False}
     
+    async def _get_capabilities(self, parameters: Dict) -> Dict:
+        """List agent capabilities"""
+        return {"capabilities": list(self.capabilities.keys()), "success": True}
+    
     async def _get_user_repositories(self, parameters: Dict) -> Dict:
         """Get user repositories"""
         try:
@@ -673,7 +824,7 @@ class DevelopmentToolsAgent(BaseAgent):
             username = parameters.get("username")
             repo_type = parameters.get("repo_type", "all")
             
-            repos = dev_tools.get_user_repositories(username, repo_type)
+            repos = await get_dev_tools().async_get_user_repositories(username, repo_type)
             
             return {
                 "success": True,
@@ -691,14 +842,15 @@ class DevelopmentToolsAgent(BaseAgent):
             if not self.github_authenticated:
                 return {"error": "GitHub not authenticated", "success": False}
             
-            owner = parameters.get("owner")
-            repo = parameters.get("repo")
+            owner, repo = parameters["owner"], parameters["repo"]
             path = parameters.get("path", "")
             
-            if not owner or not repo:
-                return {"error": "Owner and repo are required", "success": False}
-            
-            contents = dev_tools.get_repository_contents(owner, repo, path)
+            # A recursive listing is one git tree request rather than a contents call per directory
+            if parameters.get("recursive"):
+                ref = parameters.get("ref", "HEAD")
+                contents = await get_dev_tools().async_get_repository_tree(owner, repo, ref, path)
+            else:
+                contents = await get_dev_tools().async_get_repository_contents(owner, repo, path)
             
             return {
                 "success": True,
@@ -716,14 +868,10 @@ class DevelopmentToolsAgent(BaseAgent):
             if not self.github_authenticated:
                 return {"error": "GitHub not authenticated", "success": False}
             
-            owner = parameters.get("owner")
-            repo = parameters.get("repo")
+            owner, repo = parameters["owner"], parameters["repo"]
             state = parameters.get("state", "open")
             
-            if not owner or not repo:
-                return {"error": "Owner and repo are required", "success": False}
-            
-            issues = dev_tools.get_repository_issues(owner, repo, state)
+            issues = await get_dev_tools().async_get_repository_issues(owner, repo, state)
             
             return {
                 "success": True,
@@ -741,7 +889,7 @@ class DevelopmentToolsAgent(BaseAgent):
             if not self.vscode_available:
                 return {"error": "VS Code not available", "success": False}
             
-            extensions = dev_tools.list_vscode_extensions()
+            extensions = await self._run_blocking(get_dev_tools().list_vscode_extensions)
             
             return {
                 "success": True,
@@ -756,14 +904,11 @@ class DevelopmentToolsAgent(BaseAgent):
     async def _search_repositories(self, parameters: Dict) -> Dict:
         """Search GitHub repositories"""
         try:
-            query = parameters.get("query")
+            query = parameters["query"]
             sort = parameters.get("sort", "updated")
             order = parameters.get("order", "desc")
             
-            if not query:
-                return {"error": "Search query is required", "success": False}
-            
-            repos = dev_tools.search_repositories(query, sort, order)
+            repos = await get_dev_tools().async_search_repositories(query, sort, order)
             
             return {
                 "success": True,
@@ -784,17 +929,30 @@ class DevelopmentToolsAgent(BaseAgent):
         try:
             state_data = {
                 "active_projects": self.active_projects,
-                "recent_repositories": self.recent_repositories,
+                "recent_repositories": list(self.recent_repositories),
                 "github_authenticated": self.github_authenticated,
                 "vscode_available": self.vscode_available
             }
             
-            with open("integrations/dev_tools_state.json", "w") as f:
-                json.dump(state_data, f, indent=2)
+            # Write beside the target and rename so a crash never leaves a partial file
+            state_path = "integrations/dev_tools_state.json"
+            tmp_path = f"{state_path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(_dump_json(state_data))
+            os.replace(tmp_path, state_path)
                 
             self.logger.info("Development tools state saved successfully")
         except Exception as e:
             self.logger.error(f"Error saving development tools state: {e}")
+        
+        # Release pooled GitHub connections, async and sync
+        dev_tools = get_dev_tools()
+        await dev_tools.aclose()
+        dev_tools.close()
+        
+        for worker in self._workers:
+            worker.cancel()
+        self.blocking_executor.shutdown(wait=False, cancel_futures=True)
 
 # Create development tools agent instance
 dev_tools_agent = DevelopmentToolsAgent()
@@ -7,23 +7,124 @@ Handles threat detection, competitive intelligence, and anonymous operations.
 """
 
 import asyncio
+import functools
+import ipaddress
 import json
 import os
 import requests
 import socket
 import subprocess
 import time
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from enum import Enum
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from urllib.parse import urlparse, urljoin
 import hashlib
 import re
 
-from agent_framework import BaseAgent, AgentMessage, MessageType, AgentCapability
+from agent_framework import BaseAgent, AgentMessage, MessageType, AgentCapability, generate_id
+
+# Optional async HTTP client so page fetches do not block the event loop
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Optional SIMD-accelerated hash for page change fingerprints (no cryptographic need)
+try:
+    from blake3 import blake3
+except ImportError:
+    blake3 = None
+
+# Optional Aho-Corasick automaton for finding every surveillance keyword in one pass
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Response headers whose absence is reported as a web threat
+SECURITY_HEADERS = (
+    "X-Frame-Options",
+    "X-Content-Type-Options",
+    "X-XSS-Protection",
+    "Strict-Transport-Security"
+)
+
+# Ports probed by network scans (limited to avoid being intrusive)
+COMMON_PORTS = (22, 23, 25, 53, 80, 110, 143, 443, 993, 995)
+
+# Response headers revealing the technology stack
+TECH_HEADERS = {
+    "Server": "web_server",
+    "X-Powered-By": "backend_technology",
+    "X-Generator": "cms_platform"
+}
+
+# Page content indicators of the technology stack, matched in a single regex pass
+TECH_INDICATORS = {
+    "wordpress": "cms",
+    "drupal": "cms",
+    "joomla": "cms",
+    "react": "frontend_framework",
+    "angular": "frontend_framework",
+    "vue": "frontend_framework"
+}
+_TECH_INDICATOR_RE = re.compile("|".join(map(re.escape, TECH_INDICATORS)))
+
+_content_hasher = blake3 if blake3 is not None else hashlib.sha256
+
+class TargetKind(Enum):
+    URL = "url"
+    HANDLE = "handle"
+    IP = "ip"
+    DOMAIN = "domain"
+
+@functools.lru_cache(maxsize=4096)
+def _classify_target(target: str) -> TargetKind:
+    """Classify a surveillance or scan target once, accepting IPv4 and IPv6 addresses"""
+    if target.startswith("http"):
+        return TargetKind.URL
+    if "@" in target:
+        return TargetKind.HANDLE
+    try:
+        ipaddress.ip_address(target)
+        return TargetKind.IP
+    except ValueError:
+        return TargetKind.DOMAIN
+
+def _keyword_matcher(keywords: List[str]) -> Callable[[str], List[str]]:
+    """Build a function returning the keywords found in lowercased content, in keyword order"""
+    lowered = [(keyword, keyword.lower()) for keyword in keywords]
+    if ahocorasick is None or not all(word for _, word in lowered):
+        return lambda content: [keyword for keyword, word in lowered if word in content]
+    
+    positions: Dict[str, List[int]] = {}
+    for index, (_, word) in enumerate(lowered):
+        positions.setdefault(word, []).append(index)
+    
+    automaton = ahocorasick.Automaton()
+    for word, indexes in positions.items():
+        automaton.add_word(word, indexes)
+    automaton.make_automaton()
+    
+    def match(content: str) -> List[str]:
+        found = set()
+        for _, indexes in automaton.iter(content):
+            found.update(indexes)
+        return [keywords[index] for index in sorted(found)]
+    
+    return match
 
 class GhostAgent(BaseAgent):
     """Surveillance and network operations agent"""
     
+    # Targets checked, scanned or profiled at once, to avoid hammering upstreams
+    max_concurrent_targets = 20
+    
+    # Most recent surveillance checks kept in memory
+    max_surveillance_history = 10000
+    
     def __init__(self):
         super().__init__(
             agent_id="ghost",
@@ -71,9 +172,27 @@ class GhostAgent(BaseAgent):
         # Surveillance state
         self.monitored_targets: Dict[str, Dict] = {}
         self.threat_feeds: List[str] = []
-        self.surveillance_history: List[Dict] = []
+        self.surveillance_history: deque = deque(maxlen=self.max_surveillance_history)
+        self.surveillance_history_total = 0  # Checks recorded, including ones rotated out
+        
+        # Maintained on start, stop and alert so status queries need not scan every surveillance
+        self.active_surveillance_count = 0
+        self.total_alerts = 0
         self.tor_enabled = False
         
+        # Shared async HTTP client, created on first fetch so it binds to the running loop
+        self._http = None
+        self._target_semaphore: Optional[asyncio.Semaphore] = None
+        
+        # Surveillance id -> event set to wake its loop and end it immediately
+        self._stop_events: Dict[str, asyncio.Event] = {}
+        
+        # Surveillance id -> keyword matcher built once when the surveillance starts
+        self._keyword_matchers: Dict[str, Callable[[str], List[str]]] = {}
+        
+        # (surveillance id, url) -> validators and results of the last full fetch, for conditional GETs
+        self.page_validators: Dict[Tuple[str, str], Dict] = {}
+        
         # Security settings
         self.user_agents = [
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
@@ -87,7 +206,10 @@ class GhostAgent(BaseAgent):
         
         # Initialize surveillance storage
         self.monitored_targets = {}
-        self.surveillance_history = []
+        self.surveillance_history = deque(maxlen=self.max_surveillance_history)
+        self.surveillance_history_total = 0
+        self.active_surveillance_count = 0
+        self.total_alerts = 0
         
         # Setup surveillance directories
         os.makedirs("surveillance_data", exist_ok=True)
@@ -190,7 +312,8 @@ class GhostAgent(BaseAgent):
             if not targets:
                 return {"error": "No surveillance targets provided", "success": False}
             
-            surveillance_id = f"surv_{int(time.time())}"
+            # Unique even for starts within the same second, so no config or stop event is overwritten
+            surveillance_id = generate_id("surv")
             
             surveillance_config = {
                 "id": surveillance_id,
@@ -204,6 +327,9 @@ class GhostAgent(BaseAgent):
             }
             
             self.monitored_targets[surveillance_id] = surveillance_config
+            self.active_surveillance_count += 1
+            self._keyword_matchers[surveillance_id] = _keyword_matcher(keywords)
+            self._stop_events[surveillance_id] = asyncio.Event()
             
             # Start surveillance task
             asyncio.create_task(self._surveillance_loop(surveillance_id))
@@ -230,8 +356,18 @@ class GhostAgent(BaseAgent):
                 return {"error": "Invalid surveillance ID", "success": False}
             
             # Mark as stopped
+            if self.monitored_targets[surveillance_id]["status"] == "active":
+                self.active_surveillance_count -= 1
             self.monitored_targets[surveillance_id]["status"] = "stopped"
             self.monitored_targets[surveillance_id]["stopped_at"] = datetime.now().isoformat()
+            self._keyword_matchers.pop(surveillance_id, None)
+            for key in [key for key in self.page_validators if key[0] == surveillance_id]:
+                del self.page_validators[key]
+            
+            # Wake the loop now rather than after its current interval
+            stop_event = self._stop_events.pop(surveillance_id, None)
+            if stop_event is not None:
+                stop_event.set()
             
             self.logger.info(f"Stopped surveillance: {surveillance_id}")
             
@@ -247,6 +383,8 @@ class GhostAgent(BaseAgent):
     
     async def _surveillance_loop(self, surveillance_id: str):
         """Main surveillance loop for a target"""
+        stop_event = self._stop_events.get(surveillance_id) or asyncio.Event()
+        
         while surveillance_id in self.monitored_targets:
             config = self.monitored_targets[surveillance_id]
             
@@ -254,27 +392,60 @@ class GhostAgent(BaseAgent):
                 break
             
             try:
-                # Check each target
-                for target in config["targets"]:
-                    await self._check_target(surveillance_id, target, config["keywords"])
+                # Check every target concurrently so one slow site does not delay the rest
+                await asyncio.gather(*(
+                    self._limited(self._check_target(surveillance_id, target, config["keywords"]))
+                    for target in config["targets"]
+                ), return_exceptions=True)
                 
                 # Update last check time
                 config["last_check"] = datetime.now().isoformat()
                 
-                # Wait for next interval
-                await asyncio.sleep(config["interval"])
+                # Wait for next interval, or until the surveillance is stopped
+                if await self._wait_for_stop(stop_event, config["interval"]):
+                    break
                 
             except Exception as e:
                 self.logger.error(f"Error in surveillance loop {surveillance_id}: {e}")
-                await asyncio.sleep(60)  # Wait 1 minute before retrying
+                if await self._wait_for_stop(stop_event, 60):  # Wait 1 minute before retrying
+                    break
+    
+    async def _wait_for_stop(self, stop_event: asyncio.Event, timeout: float) -> bool:
+        """Wait up to timeout seconds for a stop request, returning whether one arrived"""
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+    
+    async def _limited(self, coro):
+        """Await a per-target coroutine within the shared concurrency limit"""
+        if self._target_semaphore is None:
+            self._target_semaphore = asyncio.Semaphore(self.max_concurrent_targets)
+        async with self._target_semaphore:
+            return await coro
+    
+    async def _fetch(self, url: str, headers: Dict = None):
+        """GET a page through the shared pooled client, or a worker thread when httpx is missing"""
+        if httpx is None:
+            return await asyncio.to_thread(requests.get, url, headers=headers, timeout=30)
+        
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=100, keepalive_expiry=30.0),
+                timeout=30.0
+            )
+        return await self._http.get(url, headers=headers)
     
     async def _check_target(self, surveillance_id: str, target: str, keywords: List[str]):
         """Check a specific target for changes or mentions"""
         try:
             # Determine target type
-            if target.startswith("http"):
+            kind = _classify_target(target)
+            if kind is TargetKind.URL:
                 await self._check_website(surveillance_id, target, keywords)
-            elif "@" in target:
+            elif kind is TargetKind.HANDLE:
                 await self._check_social_media(surveillance_id, target, keywords)
             else:
                 await self._check_general_mentions(surveillance_id, target, keywords)
@@ -286,17 +457,41 @@ class GhostAgent(BaseAgent):
         """Check website for changes or keyword mentions"""
         try:
             headers = {"User-Agent": self.user_agents[0]}
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
             
-            content = response.text.lower()
-            content_hash = hashlib.sha256(content.encode()).hexdigest()
+            # Revalidate instead of downloading the page again when it is unchanged
+            key = (surveillance_id, url)
+            cached = self.page_validators.get(key)
+            if cached:
+                if cached["etag"]:
+                    headers["If-None-Match"] = cached["etag"]
+                if cached["last_modified"]:
+                    headers["If-Modified-Since"] = cached["last_modified"]
             
-            # Check for keyword mentions
-            mentions = []
-            for keyword in keywords:
-                if keyword.lower() in content:
-                    mentions.append(keyword)
+            response = await self._fetch(url, headers)
+            
+            if cached and response.status_code == 304:
+                content_hash = cached["content_hash"]
+                mentions = cached["mentions"]
+            else:
+                response.raise_for_status()
+                
+                # Fingerprint the raw bytes; a lowercased copy of the page is only needed for keywords
+                content_hash = _content_hasher(response.content).hexdigest()
+                
+                # Check for keyword mentions
+                mentions = []
+                if keywords:
+                    matcher = self._keyword_matchers.get(surveillance_id) or _keyword_matcher(keywords)
+                    mentions = matcher(response.text.lower())
+                
+                # A check still in flight when its surveillance stops must not re-add the entry
+                if surveillance_id in self._stop_events:
+                    self.page_validators[key] = {
+                        "etag": response.headers.get("ETag"),
+                        "last_modified": response.headers.get("Last-Modified"),
+                        "content_hash": content_hash,
+                        "mentions": mentions
+                    }
             
             # Store surveillance data
             surveillance_data = {
@@ -309,6 +504,7 @@ class GhostAgent(BaseAgent):
             }
             
             self.surveillance_history.append(surveillance_data)
+            self.surveillance_history_total += 1
             
             # Generate alert if mentions found
             if mentions:
@@ -364,6 +560,7 @@ class GhostAgent(BaseAgent):
         # Update alert count
         if surveillance_id in self.monitored_targets:
             self.monitored_targets[surveillance_id]["alerts_count"] += 1
+            self.total_alerts += 1
         
         self.logger.warning(f"SURVEILLANCE ALERT [{alert_type}]: {data}")
         
@@ -390,8 +587,10 @@ class GhostAgent(BaseAgent):
             
             threats_found = []
             
-            for target in targets:
-                target_threats = await self._scan_target_threats(target, scan_type)
+            results = await asyncio.gather(*(
+                self._limited(self._scan_target_threats(target, scan_type)) for target in targets
+            ))
+            for target_threats in results:
                 threats_found.extend(target_threats)
             
             # Store threat intelligence
@@ -426,10 +625,11 @@ class GhostAgent(BaseAgent):
         threats = []
         
         try:
-            if target.startswith("http"):
+            kind = _classify_target(target)
+            if kind is TargetKind.URL:
                 # Web application scanning
                 threats.extend(await self._scan_web_threats(target))
-            elif self._is_ip_address(target):
+            elif kind is TargetKind.IP:
                 # Network scanning
                 threats.extend(await self._scan_network_threats(target))
             else:
@@ -453,18 +653,11 @@ class GhostAgent(BaseAgent):
         
         try:
             # Basic HTTP security checks
-            response = requests.get(url, timeout=30)
+            response = await self._fetch(url)
             headers = response.headers
             
             # Check for missing security headers
-            security_headers = [
-                "X-Frame-Options",
-                "X-Content-Type-Options",
-                "X-XSS-Protection",
-                "Strict-Transport-Security"
-            ]
-            
-            for header in security_headers:
+            for header in SECURITY_HEADERS:
                 if header not in headers:
                     threats.append({
                         "target": url,
@@ -492,11 +685,15 @@ class GhostAgent(BaseAgent):
         threats = []
         
         try:
-            # Basic port scanning (limited to avoid being intrusive)
-            common_ports = [22, 23, 25, 53, 80, 110, 143, 443, 993, 995]
-            
-            for port in common_ports:
-                if await self._check_port_open(ip, port):
+            # Resolve the target once, then probe all ports at once (limited to avoid being intrusive)
+            infos = await asyncio.get_running_loop().getaddrinfo(ip, None, type=socket.SOCK_STREAM)
+            family, _, _, _, sockaddr = infos[0]
+            open_ports = await asyncio.gather(*(
+                self._check_port_open(ip, port, family=family, sockaddr=sockaddr) for port in COMMON_PORTS
+            ))
+            
+            for port, is_open in zip(COMMON_PORTS, open_ports):
+                if is_open:
                     threats.append({
                         "target": ip,
                         "threat_type": "open_port",
@@ -514,12 +711,10 @@ class GhostAgent(BaseAgent):
         threats = []
         
         try:
-            # DNS checks
-            import socket
-            
+            # DNS checks, resolved off the event loop
             # Check if domain resolves
             try:
-                ip = socket.gethostbyname(domain)
+                ip = await asyncio.to_thread(socket.gethostbyname, domain)
                 
                 # Check for suspicious IP ranges
                 if ip.startswith("127.") or ip.startswith("0."):
@@ -544,23 +739,22 @@ class GhostAgent(BaseAgent):
         return threats
     
     def _is_ip_address(self, target: str) -> bool:
-        """Check if target is an IP address"""
+        """Check if target is an IPv4 or IPv6 address"""
+        return _classify_target(target) is TargetKind.IP
+    
+    async def _check_port_open(self, ip: str, port: int, timeout: float = 3.0,
+                               family: int = socket.AF_INET, sockaddr: Tuple = None) -> bool:
+        """Check if a port is open on target IP, connecting a bare non-blocking socket"""
+        address = (sockaddr[0], port) + tuple(sockaddr[2:]) if sockaddr else (ip, port)
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        sock.setblocking(False)
         try:
-            socket.inet_aton(target)
+            await asyncio.wait_for(asyncio.get_running_loop().sock_connect(sock, address), timeout)
             return True
-        except socket.error:
+        except (OSError, asyncio.TimeoutError):
             return False
-    
-    async def _check_port_open(self, ip: str, port: int, timeout: float = 3.0) -> bool:
-        """Check if a port is open on target IP"""
-        try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(timeout)
-            result = sock.connect_ex((ip, port))
+        finally:
             sock.close()
-            return result == 0
-        except Exception:
-            return False
     
     async def _gather_intelligence(self, parameters: Dict) -> Dict:
         """Gather competitive intelligence"""
@@ -571,11 +765,9 @@ class GhostAgent(BaseAgent):
             if not targets:
                 return {"error": "No intelligence targets provided", "success": False}
             
-            intelligence_data = []
-            
-            for target in targets:
-                target_intel = await self._gather_target_intelligence(target, intelligence_type)
-                intelligence_data.append(target_intel)
+            intelligence_data = await asyncio.gather(*(
+                self._limited(self._gather_target_intelligence(target, intelligence_type)) for target in targets
+            ))
             
             intelligence_report = {
                 "report_id": f"intel_{int(time.time())}",
@@ -608,7 +800,7 @@ class GhostAgent(BaseAgent):
                 "timestamp": datetime.now().isoformat()
             }
             
-            if target.startswith("http"):
+            if _classify_target(target) is TargetKind.URL:
                 # Web-based intelligence
                 intelligence["insights"].extend(await self._gather_web_intelligence(target))
             else:
@@ -627,16 +819,10 @@ class GhostAgent(BaseAgent):
         
         try:
             headers = {"User-Agent": self.user_agents[0]}
-            response = requests.get(url, headers=headers, timeout=30)
+            response = await self._fetch(url, headers)
             
             # Technology detection
-            tech_headers = {
-                "Server": "web_server",
-                "X-Powered-By": "backend_technology",
-                "X-Generator": "cms_platform"
-            }
-            
-            for header, tech_type in tech_headers.items():
+            for header, tech_type in TECH_HEADERS.items():
                 if header in response.headers:
                     insights.append({
                         "type": tech_type,
@@ -648,17 +834,10 @@ class GhostAgent(BaseAgent):
             content = response.text.lower()
             
             # Look for technology indicators
-            tech_indicators = {
-                "wordpress": "cms",
-                "drupal": "cms",
-                "joomla": "cms",
-                "react": "frontend_framework",
-                "angular": "frontend_framework",
-                "vue": "frontend_framework"
-            }
+            found = set(_TECH_INDICATOR_RE.findall(content))
             
-            for indicator, tech_type in tech_indicators.items():
-                if indicator in content:
+            for indicator, tech_type in TECH_INDICATORS.items():
+                if indicator in found:
                     insights.append({
                         "type": tech_type,
                         "value": indicator,
@@ -675,11 +854,9 @@ class GhostAgent(BaseAgent):
         insights = []
         
         try:
-            # DNS information
-            import socket
-            
+            # DNS information, resolved off the event loop
             try:
-                ip = socket.gethostbyname(domain)
+                ip = await asyncio.to_thread(socket.gethostbyname, domain)
                 insights.append({
                     "type": "ip_address",
                     "value": ip,
@@ -688,7 +865,7 @@ class GhostAgent(BaseAgent):
                 
                 # Reverse DNS lookup
                 try:
-                    hostname = socket.gethostbyaddr(ip)[0]
+                    hostname = (await asyncio.to_thread(socket.gethostbyaddr, ip))[0]
                     insights.append({
                         "type": "hostname",
                         "value": hostname,
@@ -812,14 +989,12 @@ class GhostAgent(BaseAgent):
     async def _get_surveillance_status(self, parameters: Dict) -> Dict:
         """Get status of surveillance operations"""
         try:
-            active_surveillance = {k: v for k, v in self.monitored_targets.items() if v["status"] == "active"}
-            
             return {
                 "success": True,
                 "total_surveillance": len(self.monitored_targets),
-                "active_surveillance": len(active_surveillance),
-                "total_alerts": sum(s.get("alerts_count", 0) for s in self.monitored_targets.values()),
-                "surveillance_history": len(self.surveillance_history)
+                "active_surveillance": self.active_surveillance_count,
+                "total_alerts": self.total_alerts,
+                "surveillance_history": self.surveillance_history_total
             }
             
         except Exception as e:
@@ -852,7 +1027,7 @@ class GhostAgent(BaseAgent):
                 "success": True,
                 "intelligence_operations": "operational",
                 "anonymous_research": "available" if self.tor_enabled else "limited",
-                "surveillance_active": len([s for s in self.monitored_targets.values() if s["status"] == "active"])
+                "surveillance_active": self.active_surveillance_count
             }
             
         except Exception as e:
@@ -867,6 +1042,13 @@ class GhostAgent(BaseAgent):
         for surveillance_id in list(self.monitored_targets.keys()):
             if self.monitored_targets[surveillance_id]["status"] == "active":
                 self.monitored_targets[surveillance_id]["status"] = "stopped"
+        self.active_surveillance_count = 0
+        
+        for stop_event in self._stop_events.values():
+            stop_event.set()
+        self._stop_events.clear()
+        self._keyword_matchers.clear()
+        self.page_validators.clear()
         
         # Save surveillance data
         try:
@@ -874,11 +1056,16 @@ class GhostAgent(BaseAgent):
                 json.dump(self.monitored_targets, f, indent=2)
             
             with open("surveillance_data/ghost_history.json", "w") as f:
-                json.dump(self.surveillance_history, f, indent=2)
+                json.dump(list(self.surveillance_history), f, indent=2)
                 
             self.logger.info("Surveillance data saved successfully")
         except Exception as e:
             self.logger.error(f"Error saving surveillance data: {e}")
+        
+        # Release pooled HTTP connections
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
 
 # Create GHOST agent instance
 ghost_agent = GhostAgent()
@@ -0,0 +1,64 @@
+import os
+import sys
+import tempfile
+import time
+import unittest
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agent_framework import _STOP_SENTINEL, AgentMessage, BaseAgent, MessageBus, MessageType
+
+class IdleAgent(BaseAgent):
+    """Agent that never processes its inbox"""
+    
+    message_queue_maxsize = 3
+    
+    async def initialize(self):
+        pass
+    
+    async def process_message(self, message):
+        return None
+    
+    async def shutdown(self):
+        pass
+
+class MessageBusDeliveryTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.bus = MessageBus(db_path=os.path.join(self.tmpdir.name, "messages.db"))
+    
+    def tearDown(self):
+        self.bus.close()
+        self.tmpdir.cleanup()
+    
+    async def test_full_inbox_of_stopped_agent_keeps_stop_sentinel(self):
+        agent = IdleAgent("idle", "IDLE", "Never reads its inbox")
+        self.bus.register_agent(agent)
+        await agent.stop()
+        
+        for index in range(agent.message_queue_maxsize + 2):
+            await self.bus.send_message(AgentMessage(
+                f"msg_{index}", "tester", agent.agent_id, MessageType.COMMAND, {}, priority=9
+            ))
+        
+        queued = [agent.message_queue.get_nowait() for _ in range(agent.message_queue.qsize())]
+        self.assertIn(_STOP_SENTINEL, queued)
+        self.assertEqual(len(queued), agent.message_queue_maxsize)
+
+class AgentMessageTimestampTest(unittest.TestCase):
+    
+    def test_iso_timestamp_sets_sent_at(self):
+        message = AgentMessage("m1", "tester", "idle", MessageType.COMMAND, {}, timestamp="2026-01-01T12:30:00")
+        self.assertEqual(message.timestamp, "2026-01-01T12:30:00")
+        self.assertEqual(message.sent_at, datetime(2026, 1, 1, 12, 30).timestamp())
+    
+    def test_non_iso_timestamp_is_kept(self):
+        before = time.time()
+        message = AgentMessage("m1", "tester", "idle", MessageType.COMMAND, {}, timestamp="yesterday")
+        self.assertEqual(message.timestamp, "yesterday")
+        self.assertGreaterEqual(message.sent_at, before)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from atlas_agent import AtlasAgent
+
+NOW = datetime(2026, 3, 2, 9, 20)
+
+class FixedDatetime(datetime):
+    """datetime whose now() is pinned to NOW"""
+    
+    @classmethod
+    def now(cls, tz=None):
+        return NOW
+
+class CheckpointTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        os.chdir(self.tmpdir.name)
+    
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmpdir.cleanup()
+    
+    async def test_first_checkpoint_replaces_shards_of_earlier_runs(self):
+        tasks_dir = AtlasAgent.PERSISTED_COLLECTIONS["scheduled_tasks"]
+        os.makedirs(tasks_dir)
+        with open(os.path.join(tasks_dir, "task_old.json"), "w") as f:
+            f.write("{}")
+        with open(os.path.join(tasks_dir, "task_crashed.json.tmp"), "w") as f:
+            f.write("{")
+        
+        agent = AtlasAgent()
+        result = await agent._schedule_task({"name": "Write report", "duration": 30})
+        agent._checkpoint()
+        
+        self.assertEqual(os.listdir(tasks_dir), [f"{result['task_id']}.json"])
+        self.assertTrue(os.path.exists(AtlasAgent.REMINDERS_PATH))
+        
+        # Later checkpoints only touch changed items
+        with open(os.path.join(tasks_dir, "task_other.json"), "w") as f:
+            f.write("{}")
+        agent._checkpoint()
+        self.assertIn("task_other.json", os.listdir(tasks_dir))
+
+class NextAvailableSlotTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.agent = AtlasAgent()
+        patcher = mock.patch("atlas_agent.datetime", FixedDatetime)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def busy(self, start: datetime, end: datetime, item_id: str):
+        self.agent._index_interval(start.timestamp(), end.timestamp(), item_id)
+    
+    async def next_slot(self, duration: int) -> datetime:
+        return datetime.fromisoformat(await self.agent._find_next_available_slot(duration))
+    
+    async def test_free_next_hour(self):
+        self.assertEqual(await self.next_slot(60), datetime(2026, 3, 2, 10, 0))
+    
+    async def test_overlapping_intervals_and_short_gap(self):
+        self.busy(datetime(2026, 3, 2, 10, 0), datetime(2026, 3, 2, 11, 0), "event_a")
+        self.busy(datetime(2026, 3, 2, 10, 30), datetime(2026, 3, 2, 12, 0), "event_b")
+        self.busy(datetime(2026, 3, 2, 12, 30), datetime(2026, 3, 2, 13, 0), "event_c")
+        
+        self.assertEqual(await self.next_slot(30), datetime(2026, 3, 2, 12, 0))
+        self.assertEqual(await self.next_slot(60), datetime(2026, 3, 2, 13, 0))
+    
+    async def test_interval_starting_before_candidate(self):
+        self.busy(datetime(2026, 3, 2, 9, 0), datetime(2026, 3, 2, 10, 45), "event_a")
+        
+        self.assertEqual(await self.next_slot(30), datetime(2026, 3, 2, 10, 45))
+    
+    async def test_completed_task_is_skipped(self):
+        self.agent.scheduled_tasks["task_done"] = {"id": "task_done", "status": "completed"}
+        self.busy(datetime(2026, 3, 2, 10, 0), datetime(2026, 3, 2, 11, 0), "task_done")
+        
+        self.assertEqual(await self.next_slot(60), datetime(2026, 3, 2, 10, 0))
+    
+    async def test_busy_past_search_window_falls_back(self):
+        self.busy(datetime(2026, 3, 2, 10, 0), NOW + timedelta(days=3), "event_a")
+        self.busy(NOW + timedelta(days=3), NOW + timedelta(days=8), "event_b")
+        
+        self.assertEqual(await self.next_slot(60), NOW + timedelta(days=1))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import asyncio
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    from development_tools_agent import DevelopmentToolsAgent
+    from agents.agent_framework import AgentMessage, MessageType
+except ImportError:  # needs the agents/integrations package layout and requests
+    DevelopmentToolsAgent = None
+
+@unittest.skipIf(DevelopmentToolsAgent is None, "development tools agent dependencies not importable")
+class CommandPriorityTest(unittest.IsolatedAsyncioTestCase):
+
+    async def test_priority_query_runs_before_queued_long_command(self):
+        agent = DevelopmentToolsAgent()
+        agent.command_workers = 1
+        finished = []
+        
+        async def slow_clone(parameters):
+            await asyncio.sleep(0.05)
+            finished.append("clone_repository")
+            return {"success": True}
+        
+        get_capabilities = agent.query_handlers["capabilities"]
+        
+        async def capabilities(parameters):
+            result = await get_capabilities(parameters)
+            finished.append("capabilities")
+            return result
+        
+        agent.command_handlers["clone_repository"] = slow_clone
+        agent.query_handlers["capabilities"] = capabilities
+        
+        messages = [
+            AgentMessage("m1", "tester", agent.agent_id, MessageType.COMMAND,
+                         {"command": "clone_repository",
+                          "parameters": {"repo_url": "https://example.com/r.git", "local_path": "/tmp/r"}}),
+            AgentMessage("m2", "tester", agent.agent_id, MessageType.QUERY, {"query_type": "capabilities"})
+        ]
+        
+        try:
+            results = await agent.process_batch(messages)
+        finally:
+            for worker in agent._workers:
+                worker.cancel()
+            agent.blocking_executor.shutdown(wait=False)
+        
+        self.assertEqual(finished, ["capabilities", "clone_repository"])
+        self.assertEqual([result.id for result in results], ["resp_m1", "resp_m2"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import asyncio
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    from ghost_agent import GhostAgent
+except ImportError:  # needs requests
+    GhostAgent = None
+
+@unittest.skipIf(GhostAgent is None, "ghost agent dependencies not importable")
+class SurveillanceLifecycleTest(unittest.IsolatedAsyncioTestCase):
+
+    async def test_start_start_stop_keeps_active_count(self):
+        agent = GhostAgent()
+        stopped = []
+        
+        async def surveillance_loop(surveillance_id):
+            await agent._stop_events[surveillance_id].wait()
+            stopped.append(surveillance_id)
+        
+        agent._surveillance_loop = surveillance_loop
+        parameters = {"targets": ["https://example.com"], "interval": 3600}
+        
+        first = await agent._start_surveillance(parameters)
+        second = await agent._start_surveillance(parameters)
+        await asyncio.sleep(0)  # let both loops pick up their stop events
+        self.assertNotEqual(first["surveillance_id"], second["surveillance_id"])
+        
+        await agent._stop_surveillance({"surveillance_id": first["surveillance_id"]})
+        await asyncio.sleep(0)
+        
+        status = await agent._get_surveillance_status({})
+        self.assertEqual(status["total_surveillance"], 2)
+        self.assertEqual(status["active_surveillance"], 1)
+        self.assertEqual(stopped, [first["surveillance_id"]])
+        
+        await agent._stop_surveillance({"surveillance_id": second["surveillance_id"]})
+        await asyncio.sleep(0)
+        
+        status = await agent._get_surveillance_status({})
+        self.assertEqual(status["active_surveillance"], 0)
+        self.assertEqual(sorted(stopped), sorted([first["surveillance_id"], second["surveillance_id"]]))
+
+if __name__ == "__main__":
+    unittest.main()